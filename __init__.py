@@ -13,9 +13,19 @@ Example
 >>> x = Variable("x")
 >>> expression = 2*x**2 + x + 1 + (x + 4) / (x**3)
 
-You can use 'float' type in your expression and `Fraction` will automatically convert it to fraction if the numerator and denominator do not exceed 10^3.
+You can use 'float' type in your expression and `Fraction` will automatically convert it to fraction if the denominator does not exceed 10^6.
 """
 
 from . import operations
 from . import fraction
-from . import polynomial
\ No newline at end of file
+from . import polynomial
+from . import subproduct
+from . import multivariate
+from . import memo
+from . import lazy
+from . import kernel
+from . import modular
+from . import matrix
+from . import storage
+from . import profiling
+from . import roots
@@ -0,0 +1,5 @@
+"""
+Benchmarks of the PyCalc module.
+
+Every submodule can be run on its own, for example `python -m PyCalc.benchmarks.dense`.
+"""
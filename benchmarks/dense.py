@@ -0,0 +1,46 @@
+"""
+Compares the dict and the dense representation of `Polinominal` on addition, multiplication and evaluation.
+
+    python -m PyCalc.benchmarks.dense
+"""
+
+import random
+from timeit import timeit
+
+from .. import polynomial
+from ..fraction import Fraction
+from ..polynomial import Polinominal
+
+
+def randomPolynomial(degree: int) -> Polinominal:
+    return Polinominal({i: Fraction(random.randint(-99, 99), random.randint(1, 9)) for i in range(degree + 1)})
+
+
+def measure(degree: int, dense: bool) -> dict[str, float]:
+    """ time of one operation in seconds for the given representation """
+
+    fill = polynomial.DENSE_FILL
+    polynomial.DENSE_FILL = fill if dense else None
+    try:
+        random.seed(degree)
+        a, b = randomPolynomial(degree), randomPolynomial(degree)
+        number = max(1, 2000 // degree)
+        return {
+            "add": timeit(lambda: a + b, number=number) / number,
+            "mul": timeit(lambda: a * b, number=1),
+            "evaluate_polynomial": timeit(lambda: a.evaluate_polynomial(Fraction(3, 7)), number=number) / number,
+        }
+    finally:
+        polynomial.DENSE_FILL = fill
+
+
+def main(degrees: tuple[int]=(200, 500, 1000)) -> None:
+    print(f"{'degree':>6} {'operation':>20} {'dict, s':>12} {'dense, s':>12} {'speedup':>8}")
+    for degree in degrees:
+        sparse, dense = measure(degree, False), measure(degree, True)
+        for operation in sparse:
+            print(f"{degree:>6} {operation:>20} {sparse[operation]:>12.6f} {dense[operation]:>12.6f} {sparse[operation] / dense[operation]:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Compares `operations.fftMul` with the former recursive implementation on sizes 2^8 to 2^20.
+
+    python -m PyCalc.benchmarks.fft
+"""
+
+import random
+from cmath import exp, pi
+from timeit import timeit
+
+from .. import operations
+
+
+def recursiveFft(x: list, inverse: bool=False) -> list[complex]:
+    """ the recursive transform that `operations.fft` and `operations.ifft` used before, for reference """
+
+    n = len(x)
+    if n <= 1:
+        return x
+
+    even = recursiveFft(x[0::2], inverse)
+    odd = recursiveFft(x[1::2], inverse)
+    sign = 1 if inverse else -1
+    t = [exp(sign * 2j * pi * k / n) * odd[k] for k in range(n // 2)]
+    scale = 2 if inverse else 1
+
+    return [(even[k] + t[k]) / scale for k in range(n // 2)] + [(even[k] - t[k]) / scale for k in range(n // 2)]
+
+
+def recursiveFftMul(poly1: list, poly2: list) -> list[complex]:
+    n = 1 << (len(poly1) + len(poly2) - 1).bit_length()
+    product = [x * y for x, y in zip(recursiveFft(poly1 + [0] * (n - len(poly1))),
+                                      recursiveFft(poly2 + [0] * (n - len(poly2))))]
+    return recursiveFft(product, inverse=True)
+
+
+def measure(size: int, recursive: bool=True) -> dict[str, float]:
+    """ time of one product of two lists whose product has `size` coefficients """
+
+    random.seed(size)
+    a = [random.randint(-999, 999) for _ in range(size // 2)]
+    b = [random.randint(-999, 999) for _ in range(size // 2)]
+    number = max(1, 2 ** 12 // size)
+
+    numpy, operations.numpy = operations.numpy, None
+    try:
+        result = {"iterative": timeit(lambda: operations.fftMul(a, b), number=number) / number}
+    finally:
+        operations.numpy = numpy
+    if numpy is not None:
+        result["numpy"] = timeit(lambda: operations.fftMul(a, b), number=number) / number
+    if recursive:
+        result["recursive"] = timeit(lambda: recursiveFftMul(a, b), number=number) / number
+
+    return result
+
+
+def main(powers: range=range(8, 21), recursive_limit: int=2 ** 16) -> None:
+    print(f"{'size':>8} {'recursive, s':>13} {'iterative, s':>13} {'numpy, s':>10} {'speedup':>8}")
+    for power in powers:
+        size = 2 ** power
+        result = measure(size, size <= recursive_limit)
+        best = min(result.get("numpy", result["iterative"]), result["iterative"])
+        recursive = result.get("recursive")
+        print(f"{size:>8} {recursive if recursive else float('nan'):>13.5f} {result['iterative']:>13.5f} "
+              f"{result.get('numpy', float('nan')):>10.5f} {recursive / best if recursive else float('nan'):>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Measures the overhead of the arithmetic operators on small `int`, `Fraction` and `Polinominal` operands,
+where the type checks cost as much as the arithmetic itself.
+
+    python -m PyCalc.benchmarks.operators
+"""
+
+from timeit import repeat
+
+from ..fraction import Fraction
+from ..polynomial import Polinominal, Variable
+
+
+def operands() -> dict[str, object]:
+    x = Variable("x")
+    return {
+        "int": 7,
+        "float": 0.25,
+        "Fraction": Fraction(3, 5),
+        "Polinominal": 2 * x + 1,
+    }
+
+
+def measure(number: int=5000) -> dict[tuple[str, str, str], float]:
+    """ the best time of one operation in seconds for every pair of operand types with a Fraction or a Polinominal """
+
+    values = operands()
+    operations = {
+        "+": lambda a, b: a + b,
+        "-": lambda a, b: a - b,
+        "*": lambda a, b: a * b,
+        "/": lambda a, b: a / b,
+    }
+
+    results = {}
+    for first, a in values.items():
+        for second, b in values.items():
+            if "Fraction" not in [first, second] and "Polinominal" not in [first, second]:
+                continue
+            for name, operation in operations.items():
+                try:
+                    operation(a, b)
+                except (TypeError, AttributeError, ZeroDivisionError):
+                    continue
+                results[(first, name, second)] = min(repeat(lambda: operation(a, b), number=number, repeat=5)) / number
+    return results
+
+
+def main() -> None:
+    print(f"{'operation':>36} {'time, us':>10}")
+    for (first, name, second), time in measure().items():
+        print(f"{first + ' ' + name + ' ' + second:>36} {time * 10**6:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
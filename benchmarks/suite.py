@@ -0,0 +1,329 @@
+"""
+The benchmark suite of the module: the time, the peak memory and the memory blocks retained by the result
+of every operation on degrees from 10 to 10^5, written as JSON to compare two revisions.
+
+    python -m PyCalc.benchmarks.suite --output new.json
+    python -m PyCalc.benchmarks.suite --compare old.json new.json
+
+The larger degrees of a case are skipped when an estimate of their time from the growth of the measured degrees
+exceeds `--max-time` seconds, and a measurement that runs longer than `--budget` seconds is stopped.
+The suite only uses the public operators where it can, so a copy of it runs on older revisions too; the cases
+whose operation a revision does not have are reported as unsupported and left out of the JSON.
+"""
+
+import argparse
+import json
+import platform
+import random
+import signal
+import sys
+import tracemalloc
+from math import log
+from time import perf_counter
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .. import operations
+from ..fraction import Fraction
+from ..polynomial import Polinominal, Variable
+
+
+DEGREES = (10, 100, 1000, 10000, 100000)
+# every measurement repeats the operation for at least this many seconds
+MIN_TIME = 0.2
+# the growth exponent of the time with the degree before two degrees of a case are measured
+GROWTH = 2
+
+
+def densePolinominal(numerators: List[int], denominator: int) -> Polinominal:
+    if hasattr(Polinominal, "fromDense"):
+        return Polinominal.fromDense(numerators, denominator)
+    # revisions without the dense form
+    return Polinominal({power: Fraction(numerator, denominator) for power, numerator in enumerate(numerators) if numerator})
+
+
+def randomNumerators(degree: int) -> List[int]:
+    return [random.randint(-99, 99) for _ in range(degree)] + [random.randint(1, 99)]
+
+
+def randomDense(degree: int) -> Polinominal:
+    return densePolinominal(randomNumerators(degree), random.randint(1, 9))
+
+
+def randomInteger(digits: int) -> int:
+    return random.randrange(10 ** (digits - 1), 10 ** digits)
+
+
+def readmeExample() -> Polinominal:
+    """ the expression from the "Getting started" section of README.md """
+
+    x = Variable("x")
+    a = 1 / (x**2 - 3*x + 1)
+    b = (x**3 + 3*x**2 + 3*x + 1) / (x + 1)
+    c = (4*x**6 - 8*x**5 + 9*x**4 - x**3 + 2*x**2 - 5*x + 1) * (3*x**3 - x**2 + 2*x - 6) / (x**4 + x**2 + 84)
+    return a - b + c
+
+
+def readmeEvaluate() -> Fraction:
+    """ the expression from the `evaluate_polynomial` section of README.md at its point """
+
+    x = Variable("a")
+    a = 1 / (x**2 - 3*x + 1) + (x**3 + 3*x**2 + 3*x + 1) / (x + 1)
+    return a.evaluate_polynomial(2)
+
+
+def setupAdd(degree: int) -> Callable:
+    a, b = randomDense(degree), randomDense(degree)
+    return lambda: a + b
+
+
+def setupMul(degree: int) -> Callable:
+    a, b = randomDense(degree), randomDense(degree)
+    return lambda: a * b
+
+
+def setupPow(degree: int) -> Callable:
+    numerators, denominator = randomNumerators(max(1, degree // 4)), random.randint(1, 9)
+    # a new polynomial for every call, the powers of an instance are cached
+    return lambda: densePolinominal(list(numerators), denominator) ** 4
+
+
+def divisionOperands(degree: int) -> Tuple[Polinominal, Polinominal]:
+    """ a dividend of the degree with a small remainder, random dividends give huge exact quotients """
+
+    divisor, quotient = randomDense(max(1, degree // 2)), randomDense(degree - max(1, degree // 2))
+    remainder = randomDense(max(1, degree // 2) - 1)
+    return divisor * quotient + remainder, divisor
+
+
+def setupDivmod(degree: int) -> Optional[Callable]:
+    if not hasattr(Polinominal, "__divmod__"):
+        return None
+    a, b = divisionOperands(degree)
+    return lambda: divmod(a, b)
+
+
+def setupMod(degree: int) -> Optional[Callable]:
+    if not hasattr(Polinominal, "__mod__"):
+        return None
+    a, b = divisionOperands(degree)
+    return lambda: a % b
+
+
+def setupTruediv(degree: int) -> Callable:
+    # a rational function whose numerator and denominator share a factor of half the degree
+    common = randomDense(max(1, degree // 2))
+    a, b = common * randomDense(max(1, degree // 4)), common * randomDense(max(1, degree // 4))
+    return lambda: a / b
+
+
+def setupFraction(degree: int) -> Callable:
+    # the degree is the number of digits of the numerator and the denominator, they share a factor
+    common = randomInteger(degree // 2 + 1)
+    numerator, denominator = common * randomInteger(degree // 2 + 1), common * randomInteger(degree // 2 + 1)
+    return lambda: Fraction(numerator, denominator)
+
+
+def setupFractionSum(degree: int) -> Callable:
+    fractions = [Fraction(random.randint(1, 99), random.randint(1, 99)) for _ in range(degree)]
+
+    def fractionSum():
+        total = 0
+        for fraction in fractions:
+            total = fraction + total
+        return total
+
+    return fractionSum
+
+
+def setupFftMul(degree: int) -> Callable:
+    a = [random.randint(-999, 999) for _ in range(degree + 1)]
+    b = [random.randint(-999, 999) for _ in range(degree + 1)]
+    # the lists are copied for every call, older revisions pad the arguments of fftMul in place
+    return lambda: operations.fftMul(list(a), list(b))
+
+
+def setupEvaluate(degree: int) -> Callable:
+    a = randomDense(degree)
+    return lambda: a.evaluate_polynomial(Fraction(3, 7))
+
+
+def setupReadme(degree: int) -> Callable:
+    # the examples have a fixed size, the degree only repeats them
+    return lambda: [readmeExample() for _ in range(max(1, degree // 100))]
+
+
+def setupReadmeEvaluate(degree: int) -> Callable:
+    return lambda: [readmeEvaluate() for _ in range(max(1, degree // 100))]
+
+
+# a setup returns None when the revision does not support the operation
+CASES: Dict[str, Callable[[int], Optional[Callable]]] = {
+    "Polinominal.__add__": setupAdd,
+    "Polinominal.__mul__": setupMul,
+    "Polinominal.__pow__": setupPow,
+    "Polinominal.__divmod__": setupDivmod,
+    "Polinominal.__mod__": setupMod,
+    "Polinominal.__truediv__": setupTruediv,
+    "Fraction": setupFraction,
+    "Fraction.__add__": setupFractionSum,
+    "operations.fftMul": setupFftMul,
+    "Polinominal.evaluate_polynomial": setupEvaluate,
+    "README": setupReadme,
+    "README.evaluate_polynomial": setupReadmeEvaluate,
+}
+
+
+class BudgetExceeded(Exception):
+    """ a measurement ran longer than its time budget """
+
+
+def onAlarm(signum: int, frame: object) -> None:
+    raise BudgetExceeded
+
+
+def measure(function: Callable, budget: Optional[float]=None) -> dict:
+    """
+    the best time of one call, the peak memory and the memory blocks and bytes that are still held by the result;
+    these are not allocation counts: tracemalloc only sees the live blocks, and the blocks allocated and freed
+    during the call only show in the peak
+    """
+
+    # the budget interrupts the operation with SIGALRM, so it is only kept where the timer exists
+    timer = budget and hasattr(signal, "setitimer")
+    if timer:
+        handler = signal.signal(signal.SIGALRM, onAlarm)
+        signal.setitimer(signal.ITIMER_REAL, budget)
+    try:
+        repeats = 0
+        best = float("inf")
+        start = perf_counter()
+        while repeats < 3 or perf_counter() - start < MIN_TIME:
+            begin = perf_counter()
+            function()
+            best = min(best, perf_counter() - begin)
+            repeats += 1
+            if best > MIN_TIME:
+                break
+
+        tracemalloc.start()
+        try:
+            before = tracemalloc.take_snapshot()
+            tracemalloc.reset_peak()
+            result = function()
+            _, peak = tracemalloc.get_traced_memory()
+            after = tracemalloc.take_snapshot()
+        finally:
+            tracemalloc.stop()
+    finally:
+        if timer:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, handler)
+    difference = after.compare_to(before, "filename")
+    del result
+
+    return {
+        "seconds": best,
+        "repeats": repeats,
+        "peak_bytes": peak,
+        "retained_blocks": sum(statistic.count_diff for statistic in difference),
+        "retained_bytes": sum(statistic.size_diff for statistic in difference),
+    }
+
+
+def estimate(measured: List[dict], degree: int) -> float:
+    """ the expected seconds of one call at the degree, the time grows as fast as between the last two measured degrees """
+
+    last = measured[-1]
+    exponent = GROWTH
+    if len(measured) > 1:
+        before = measured[-2]
+        if 0 < before["seconds"] < last["seconds"]:
+            exponent = max(1, log(last["seconds"] / before["seconds"]) / log(last["degree"] / before["degree"]))
+    return last["seconds"] * (degree / last["degree"]) ** exponent
+
+
+def run(cases: List[str], degrees: List[int], max_time: float, budget: Optional[float]=None) -> dict:
+    """ runs the cases on the degrees in increasing order, printing a line for every measurement """
+
+    results = []
+    for case in cases:
+        measured = []
+        for degree in sorted(degrees):
+            if measured and estimate(measured, degree) > max_time:
+                print(f"{case:>32} {degree:>7} skipped", file=sys.stderr)
+                break
+            random.seed(degree)
+            function = CASES[case](degree)
+            if function is None:
+                print(f"{case:>32} {degree:>7} unsupported", file=sys.stderr)
+                break
+            try:
+                result = {"case": case, "degree": degree, **measure(function, budget)}
+            except BudgetExceeded:
+                print(f"{case:>32} {degree:>7} over the budget of {budget} s", file=sys.stderr)
+                break
+            results.append(result)
+            print(f"{case:>32} {degree:>7} {result['seconds']:>12.6f} s {result['peak_bytes'] / 2**20:>10.2f} MiB "
+                  f"{result['retained_blocks']:>9} retained blocks", file=sys.stderr)
+            measured.append(result)
+
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+
+
+def compare(old: dict, new: dict, threshold: float) -> List[dict]:
+    """ prints the ratio of the times of the common measurements and returns the ones slower than `threshold` """
+
+    old_results = {(result["case"], result["degree"]): result for result in old["results"]}
+    regressions = []
+    print(f"{'case':>32} {'degree':>7} {'old, s':>12} {'new, s':>12} {'ratio':>7} {'peak ratio':>10}")
+    for result in new["results"]:
+        before = old_results.get((result["case"], result["degree"]))
+        if before is None:
+            continue
+        ratio = result["seconds"] / before["seconds"]
+        peak = result["peak_bytes"] / before["peak_bytes"] if before["peak_bytes"] else float("nan")
+        mark = " !" if ratio > threshold else ""
+        print(f"{result['case']:>32} {result['degree']:>7} {before['seconds']:>12.6f} {result['seconds']:>12.6f} "
+              f"{ratio:>7.2f} {peak:>10.2f}{mark}")
+        if ratio > threshold:
+            regressions.append(result)
+    return regressions
+
+
+def main(arguments: Optional[List[str]]=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m PyCalc.benchmarks.suite", description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--cases", nargs="+", choices=list(CASES), default=list(CASES), metavar="CASE",
+                        help="the cases to run, all by default")
+    parser.add_argument("--degrees", nargs="+", type=int, default=list(DEGREES))
+    parser.add_argument("--max-time", type=float, default=10.0,
+                        help="the estimated seconds of one call above which the larger degrees of a case are skipped")
+    parser.add_argument("--budget", type=float, default=60.0,
+                        help="the seconds after which a measurement is stopped along with the larger degrees of its case, 0 for none")
+    parser.add_argument("--output", help="the JSON file for the results, standard output by default")
+    parser.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"),
+                        help="compares two JSON results instead of running, fails on regressions")
+    parser.add_argument("--threshold", type=float, default=1.1,
+                        help="the ratio of the new and the old time that is a regression")
+    options = parser.parse_args(arguments)
+
+    if options.compare:
+        with open(options.compare[0]) as old, open(options.compare[1]) as new:
+            regressions = compare(json.load(old), json.load(new), options.threshold)
+        return 1 if regressions else 0
+
+    results = run(options.cases, options.degrees, options.max_time, options.budget)
+    if options.output:
+        with open(options.output, "w") as output:
+            json.dump(results, output, indent=2)
+    else:
+        json.dump(results, sys.stdout, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,14 +1,43 @@
+from collections import OrderedDict
+from math import gcd as intGcd
+from sys import hash_info
+from typing import Optional, Tuple
 from .operations import gcd, scm
 
 
+# floats are converted to fractions with denominators up to this bound
+MAX_DENOMINATOR = 10**6
+# the largest difference between a float and its fraction
+TOLERANCE = 10e-20
+FLOAT_CACHE_SIZE = 256
+# the results of the integer arithmetic are reduced only when a numerator or a denominator has more bits than this
+# (or when the fraction is printed or hashed), None reduces every result
+REDUCE_BITS = None
+
+_float_cache = OrderedDict()
+_HASH_MODULUS = hash_info.modulus
+
+
 class Fraction():
     """
     A class for representing fractions as numerator and denominator
     """
     __slots__ = ["numerator", "denominator"]
-    __available_types = ["int", "float", "Polinominal", "Fraction"]
+    __available_types = frozenset(["int", "float", "Polinominal", "Fraction"])
 
     def __new__(cls, numerator, denominator=1):
+        if type(numerator) == int and type(denominator) == int:
+            if numerator == 0:
+                return numerator
+            instance = super(Fraction, cls).__new__(cls)
+            common_divisor = intGcd(numerator, denominator)
+            # the denominator is positive, a zero denominator gives 1/0
+            if (denominator or numerator) < 0:
+                common_divisor = -common_divisor
+            instance.numerator = numerator // common_divisor
+            instance.denominator = denominator // common_divisor
+            return instance
+
         if type(numerator).__name__ not in cls.__available_types and type(denominator) == cls.__available_types:
             raise TypeError
         
@@ -17,13 +46,7 @@ class Fraction():
         
         instance = super(Fraction, cls).__new__(cls)
 
-        if type(numerator) == int and type(denominator) == int:
-            common_divisor = gcd(numerator, denominator)
-            instance.numerator = numerator // common_divisor
-            instance.denominator = denominator // common_divisor
-            return instance
-        
-        elif type(numerator).__name__ in ["int", "Polinominal"] and type(denominator).__name__ in ["int", "Polinominal"]:            
+        if type(numerator).__name__ in ["int", "Polinominal"] and type(denominator).__name__ in ["int", "Polinominal"]:            
             common_divisor = gcd(numerator, denominator)
             numerator = numerator / common_divisor
             denominator = denominator / common_divisor
@@ -56,15 +79,18 @@ class Fraction():
         elif type(numerator) == Fraction or type(denominator) == Fraction:
             return numerator / denominator
         else:
-            instance.numerator = Fraction.toFration(numerator).numerator
-            instance.denominator = Fraction.toFration(numerator).denominator
+            converted = Fraction.toFration(numerator)
+            instance.numerator = converted.numerator
+            instance.denominator = converted.denominator
             return instance
         
 
     @staticmethod
-    def toFration(number: float|int) -> "Fraction":
+    def toFration(number: float|int, max_denominator: int=None, tolerance: float=None) -> "Fraction":
         """
-        A function for finding the numerator and denominator that makes a given number
+        A function for finding the numerator and denominator that makes a given number.
+        It takes the first convergent of the continued fraction of the number that is closer than `tolerance`
+        and raises an exception if the denominator of such convergent exceeds `max_denominator`
         """
 
         if type(number) not in [int, float]:
@@ -73,24 +99,110 @@ class Fraction():
         if type(number) == int:
             return number
 
-        numerator, denominator = 1, 1
-        sign = -1 if (number < 0) else 1
-        number = abs(number)
+        max_denominator = MAX_DENOMINATOR if max_denominator is None else max_denominator
+        tolerance = TOLERANCE if tolerance is None else tolerance
 
-        while abs(number - numerator / denominator) > 10e-20:
-            if numerator > 10**3 or denominator > 10**3:
-                raise Exception("number cannot be converted :(")
-            if numerator / denominator < number:
-                numerator += 1
-            else:
-                denominator += 1
-
-        return Fraction(sign * numerator, denominator)
+        key = (number, max_denominator, tolerance)
+        if key in _float_cache:
+            _float_cache.move_to_end(key)
+            result = _float_cache[key]
+        else:
+            result = Fraction._continuedFraction(number, max_denominator, tolerance)
+            if FLOAT_CACHE_SIZE:
+                _float_cache[key] = result
+                while len(_float_cache) > FLOAT_CACHE_SIZE:
+                    _float_cache.popitem(last=False)
+
+        if result is None:
+            raise Exception("number cannot be converted :(")
+        return result
     
 
+    @staticmethod
+    def _continuedFraction(number: float, max_denominator: int, tolerance: float) -> Optional["Fraction"]:
+        """ the first convergent of a float within the tolerance or None """
+
+        if number != number or number in [float("inf"), float("-inf")]:
+            return None
+
+        numerator, denominator = number.as_integer_ratio()
+        # convergents p / q of numerator / denominator: p_k = a_k * p_(k-1) + p_(k-2)
+        p_prev, q_prev, p, q = 0, 1, 1, 0
+        while denominator:
+            quotient, remainder = divmod(numerator, denominator)
+            p_prev, q_prev, p, q = p, q, quotient * p + p_prev, quotient * q + q_prev
+            if q > max_denominator:
+                return None
+            if abs(number - p / q) <= tolerance:
+                return Fraction(p, q)
+            numerator, denominator = denominator, remainder
+
+        return None
+
+    @staticmethod
+    def _fromIntegers(numerator: int, denominator: int, reduce: bool=True) -> "Fraction":
+        """
+        the fraction of two integers without the checks of `__new__`, the common factor is not looked for
+        when `reduce` is not set (the integers are coprime) or while REDUCE_BITS defers it
+        """
+
+        if numerator == 0:
+            return numerator
+        if denominator < 0:
+            numerator, denominator = -numerator, -denominator
+        if reduce and (REDUCE_BITS is None or not denominator or
+                       numerator.bit_length() > REDUCE_BITS or denominator.bit_length() > REDUCE_BITS):
+            common = intGcd(numerator, denominator)
+            if not denominator and numerator < 0:
+                common = -common
+            if common != 1:
+                numerator //= common
+                denominator //= common
+
+        instance = object.__new__(Fraction)
+        instance.numerator = numerator
+        instance.denominator = denominator
+        return instance
+
+
+    def _reduce(self) -> "Fraction":
+        """ cancels the common factor of an integer fraction that REDUCE_BITS left unreduced, in place """
+
+        if type(self.numerator) == int and type(self.denominator) == int:
+            common = intGcd(self.numerator, self.denominator)
+            if common > 1:
+                self.numerator //= common
+                self.denominator //= common
+        return self
+
+
+    def _integerParts(self, other) -> Optional[Tuple[int, int, int, int]]:
+        """ the numerators and denominators of self and other if all of them are 'int', otherwise None """
+
+        if type(self.numerator) != int or type(self.denominator) != int:
+            return None
+        if type(other) == int:
+            return self.numerator, self.denominator, other, 1
+        if type(other) == Fraction and type(other.numerator) == int and type(other.denominator) == int:
+            return self.numerator, self.denominator, other.numerator, other.denominator
+        return None
+
+
+    def _hasPolinominal(self, other: "Fraction") -> bool:
+        """ whether a numerator or a denominator of self or other is a 'Polinominal' """
+
+        return "Polinominal" in (type(self.numerator).__name__, type(self.denominator).__name__,
+                                 type(other.numerator).__name__, type(other.denominator).__name__)
+
+
     def __add__(self, other) -> "Fraction":
         """'Fraction' + other"""
 
+        parts = self._integerParts(other)
+        if parts is not None:
+            a, b, c, d = parts
+            return Fraction._fromIntegers(a * d + b * c, b * d)
+
         if type(other).__name__ not in Fraction.__available_types:
             raise TypeError(f"unsupported operand type(s) for +: '{type(other).__name__}' and 'Fraction'")
         
@@ -101,8 +213,7 @@ class Fraction():
                 return other + self.numerator / self.denominator
     
         if type(other) == Fraction:
-            if "Polinominal" in [type(self.numerator).__name__, type(self.denominator).__name__,
-                                 type(other.numerator).__name__, type(other.denominator).__name__]:
+            if self._hasPolinominal(other):
                 return (self.numerator * other.denominator + self.denominator * other.numerator) / (self.denominator * other.denominator)
         
         return Fraction(self.numerator * other.denominator + self.denominator * other.numerator, self.denominator * other.denominator)
@@ -113,6 +224,11 @@ class Fraction():
     def __sub__(self, other):
         """'Fraction' - other"""
 
+        parts = self._integerParts(other)
+        if parts is not None:
+            a, b, c, d = parts
+            return Fraction._fromIntegers(a * d - b * c, b * d)
+
         if type(other).__name__ not in Fraction.__available_types:
             raise TypeError(f"unsupported operand type(s) for -: 'Fraction' and '{type(other).__name__}'")
         
@@ -123,8 +239,7 @@ class Fraction():
                 return self.numerator / self.denominator - other
         
         if type(other) == Fraction:
-            if "Polinominal" in [type(self.numerator).__name__, type(self.denominator).__name__,
-                                 type(other.numerator).__name__, type(other.denominator).__name__]:
+            if self._hasPolinominal(other):
                 a = (self.numerator * other.denominator - self.denominator * other.numerator) / (self.denominator * other.denominator)
                 return a
         
@@ -134,6 +249,11 @@ class Fraction():
     def __rsub__(self, other) -> "Fraction":
         """other - 'Fraction'"""
 
+        parts = self._integerParts(other)
+        if parts is not None:
+            a, b, c, d = parts
+            return Fraction._fromIntegers(b * c - a * d, b * d)
+
         if type(other).__name__ not in Fraction.__available_types:
             raise TypeError(f"unsupported operand type(s) for -: '{type(other).__name__}' and 'Fraction'")
         
@@ -144,8 +264,7 @@ class Fraction():
                 return other - self.numerator / self.denominator
         
         if type(other) == Fraction:
-            if "Polinominal" in [type(self.numerator).__name__, type(self.denominator).__name__,
-                                 type(other.numerator).__name__, type(other.denominator).__name__]:
+            if self._hasPolinominal(other):
                 return (self.denominator * other.numerator - self.numerator * other.denominator) / (self.denominator * other.denominator)
         
         return Fraction(self.denominator * other.numerator - self.numerator * other.denominator, self.denominator * other.denominator)
@@ -155,6 +274,11 @@ class Fraction():
     def __mul__(self, other) -> "Fraction":
         """'Fraction' * other"""
 
+        parts = self._integerParts(other)
+        if parts is not None:
+            a, b, c, d = parts
+            return Fraction._fromIntegers(a * c, b * d)
+
         if type(other).__name__ not in Fraction.__available_types:
             raise TypeError(f"unsupported operand type(s) for *: '{type(other).__name__}' and 'Fraction'")
         
@@ -165,8 +289,7 @@ class Fraction():
                 return other * self.numerator / self.denominator
         
         if type(other) == Fraction:
-            if "Polinominal" in [type(self.numerator).__name__, type(self.denominator).__name__,
-                                 type(other.numerator).__name__, type(other.denominator).__name__]:
+            if self._hasPolinominal(other):
                 return (self.numerator * other.numerator) / (self.denominator * other.denominator)
         elif type(other).__name__ == "Polinominal":
             return other * self
@@ -179,6 +302,11 @@ class Fraction():
     def __truediv__(self, other) -> "Fraction":
         """'Fraction' / other"""
 
+        parts = self._integerParts(other)
+        if parts is not None:
+            a, b, c, d = parts
+            return Fraction._fromIntegers(a * d, b * c)
+
         if type(other).__name__ not in Fraction.__available_types:
             raise TypeError(f"unsupported operand type(s) for /: '{type(other).__name__}' and 'Fraction'")
         
@@ -189,8 +317,7 @@ class Fraction():
                 return self.numerator / self.denominator / other
         
         if type(other) == Fraction:
-            if "Polinominal" in [type(self.numerator).__name__, type(self.denominator).__name__,
-                                 type(other.numerator).__name__, type(other.denominator).__name__]:
+            if self._hasPolinominal(other):
                 return (self.numerator * other.denominator) / (self.denominator * other.numerator)
         
         return Fraction(self.numerator * other.denominator, self.denominator * other.numerator)
@@ -199,6 +326,11 @@ class Fraction():
     def __rtruediv__(self, other) -> "Fraction":
         """other / 'Fraction'"""
 
+        parts = self._integerParts(other)
+        if parts is not None:
+            a, b, c, d = parts
+            return Fraction._fromIntegers(c * b, d * a)
+
         if type(other).__name__ not in Fraction.__available_types:
             raise TypeError(f"unsupported operand type(s) for /: 'Fraction' and '{type(other).__name__}'")
         
@@ -209,8 +341,7 @@ class Fraction():
                 return  other / self.numerator * self.denominator
         
         if type(other) == Fraction:
-            if "Polinominal" in [type(self.numerator).__name__, type(self.denominator).__name__,
-                                 type(other.numerator).__name__, type(other.denominator).__name__]:
+            if self._hasPolinominal(other):
                 return (self.denominator * other.numerator) / (self.numerator * other.numerator)
         
         return Fraction(other.numerator * self.denominator, other.denominator * self.numerator)
@@ -218,6 +349,9 @@ class Fraction():
 
     def __neg__(self) -> "Fraction":
         """-'Fraction'"""
+
+        if type(self.numerator) == int and type(self.denominator) == int:
+            return Fraction._fromIntegers(-self.numerator, self.denominator, reduce=not self.denominator)
         return Fraction(-self.numerator, self.denominator)
 
 
@@ -226,7 +360,10 @@ class Fraction():
 
         if type(other).__name__ not in Fraction.__available_types:
             raise TypeError(f"unsupported operand type(s) for **: 'Fraction' and '{type(other).__name__}'")
-       
+
+        if type(other) == int and other >= 0 and type(self.numerator) == int and type(self.denominator) == int:
+            # the powers of coprime integers are coprime
+            return Fraction._fromIntegers(self.numerator**other, self.denominator**other, reduce=REDUCE_BITS is not None)
         return Fraction(self.numerator**other, self.denominator**other)
     
 
@@ -238,27 +375,67 @@ class Fraction():
         return self.numerator // self.denominator
     
 
-    def __eq__(self, other) -> bool: # self == other        
+    def __eq__(self, other) -> bool: # self == other
+        parts = self._integerParts(other)
+        if parts is not None:
+            a, b, c, d = parts
+            return a * d == b * c
         return abs(float(self) - float(other)) < 10**(-20)
+
+
+    def __hash__(self) -> int:
+        # the hash of the rational number as the built-in numbers compute it, so Fraction(2, 1) and 2 have the same hash
+        if type(self.numerator) == int and type(self.denominator) == int:
+            numerator, denominator = self.numerator, self.denominator
+            if denominator < 0:
+                numerator, denominator = -numerator, -denominator
+            try:
+                inverse = pow(denominator, -1, _HASH_MODULUS)
+            except ValueError:
+                if self._reduce().denominator % _HASH_MODULUS:
+                    return hash(self)
+                return hash(float("inf")) if numerator >= 0 else -hash(float("inf"))
+            value = hash(abs(numerator)) * inverse % _HASH_MODULUS
+            value = value if numerator >= 0 else -value
+            return -2 if value == -1 else value
+        return hash((self.numerator, self.denominator))
     
 
     def __lt__(self, other) -> bool: # self < other
+        parts = self._integerParts(other)
+        if parts is not None:
+            a, b, c, d = parts
+            return a * d < c * b
         return (float(self) - float(other)) < 0
     
     
     def __le__(self, other) -> bool: # self <= other
+        parts = self._integerParts(other)
+        if parts is not None:
+            a, b, c, d = parts
+            return a * d <= c * b
         return (float(self) - float(other)) <= 0
     
     
     def __gt__(self, other) -> bool: # self > other
+        parts = self._integerParts(other)
+        if parts is not None:
+            a, b, c, d = parts
+            return a * d > c * b
         return (float(self) - float(other)) > 0
     
     
     def __ge__(self, other) -> bool: # self >= other
+        parts = self._integerParts(other)
+        if parts is not None:
+            a, b, c, d = parts
+            return a * d >= c * b
         return (float(self) - float(other)) >= 0
     
     
     def __abs__(self) -> "Fraction": # abs( self )
+        if type(self.numerator) == int and type(self.denominator) == int:
+            return Fraction._fromIntegers(abs(self.numerator), self.denominator, reduce=False)
         return Fraction(abs(self.numerator), abs(self.denominator))
     
 
@@ -279,6 +456,9 @@ class Fraction():
     
     
     def __repr__(self) -> str:
+        if type(self.numerator) == int and type(self.denominator) == int:
+            self._reduce()
+            return str(self.numerator) if self.denominator == 1 else f"{self.numerator}/{self.denominator}"
         if self.numerator == 0 or self.denominator == 1:
             return str(self.numerator)
         elif type(self.numerator).__name__ == "Polinominal" or type(self.denominator).__name__ == "Polinominal":
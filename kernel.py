@@ -0,0 +1,152 @@
+from typing import Dict, List, Tuple, Union
+from .fraction import Fraction
+from .polynomial import Polinominal, floatCoefficients, hornerFloat
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+KINDS = ["float", "complex", "exact"]
+
+
+def exactCoefficients(value: Union[int, Fraction, Polinominal]) -> Tuple[List[int], int]:
+    """ integer numerators indexed by degree and a shared denominator of a polynomial or a number """
+
+    if type(value) == int:
+        return [value], 1
+    if type(value) == Fraction and type(value.numerator) == int and type(value.denominator) == int:
+        return [value.numerator], value.denominator
+    if type(value) == Polinominal and not value.fraction:
+        dense = value._asDense(force=True)
+        if dense is not None:
+            return list(dense[0]) or [0], dense[1]
+    raise TypeError("the exact kernel needs rational coefficients")
+
+
+def hornerExact(coefficients: Tuple[int, ...], numerator: int, denominator: int) -> Tuple[int, int]:
+    """ the value of the coefficients (the highest degree first) at numerator / denominator as an integer pair """
+
+    value = coefficients[0]
+    power = 1
+    for coefficient in coefficients[1:]:
+        power *= denominator
+        value = value * numerator + coefficient * power
+    return value, power
+
+
+class Kernel():
+    """
+    A compiled `Polinominal`: the Horner coefficients of the polynomial and of the numerator and the denominator
+    of its fraction, evaluated by calling the kernel at a point.
+
+    The "float" and the "complex" kernels compute in float64 or complex arithmetic (a NumPy array of points is evaluated
+    at once), the "exact" kernel takes 'int' or 'Fraction' points and gives exact results with only one reduction.
+    The kernel keeps no reference to the polynomial and can be pickled.
+
+    To make kernel use `Polinominal.compile`.
+    """
+    __slots__ = ["kind", "lists", "denominators"]
+
+    def __init__(self, poli: Union[int, Fraction, Polinominal], kind: str="float") -> None:
+        if kind not in KINDS:
+            raise ValueError(f"the kind of the kernel should be one of {', '.join(KINDS)}, not {kind!r}")
+
+        parts = [poli]
+        if type(poli) == Polinominal and poli.fraction:
+            parts += [poli.fraction.numerator, poli.fraction.denominator]
+
+        self.kind = kind
+        if kind == "exact":
+            dense = [exactCoefficients(Polinominal(poli._view(), symbol=poli.symbol) if type(poli) == Polinominal else poli)]
+            dense += [exactCoefficients(part) for part in parts[1:]]
+            self.lists = tuple(tuple(reversed(numerators)) for numerators, _ in dense)
+            self.denominators = tuple(denominator for _, denominator in dense)
+        else:
+            convert = complex if kind == "complex" else float
+            self.lists = tuple(tuple(convert(c) for c in reversed(floatCoefficients(part))) for part in parts)
+            self.denominators = None
+
+
+    def __call__(self, point):
+        if self.kind == "exact":
+            return self._exact(point)
+        if isinstance(point, (list, tuple, memoryview)) or (numpy is not None and isinstance(point, numpy.ndarray)):
+            return self._array(point)
+
+        point = complex(point) if self.kind == "complex" else float(point)
+        values = []
+        for coefficients in self.lists:
+            value = coefficients[0]
+            for coefficient in coefficients[1:]:
+                value = value * point + coefficient
+            values.append(value)
+
+        if len(values) == 1:
+            return values[0]
+        value, numerator, denominator = values
+        return value + numerator / denominator
+
+
+    def _array(self, points) -> "numpy.ndarray":
+        """ the values at every point of an array in one pass over the coefficients """
+
+        if numpy is None:
+            return [self(point) for point in points]
+
+        points = numpy.asarray(points, dtype=complex if self.kind == "complex" else float)
+        value, *fraction = hornerFloat([list(reversed(coefficients)) for coefficients in self.lists], points)
+        if fraction:
+            numerator, denominator = fraction
+            with numpy.errstate(divide="ignore", invalid="ignore"):
+                value = value + numerator / denominator
+        return value + numpy.zeros_like(points)
+
+
+    def _exact(self, point: Union[int, Fraction]) -> Union[int, Fraction]:
+        if type(point) == int:
+            numer, denom = point, 1
+        elif type(point) == Fraction and type(point.numerator) == int and type(point.denominator) == int:
+            numer, denom = point.numerator, point.denominator
+        else:
+            raise TypeError(f"the exact kernel takes 'int' or 'Fraction' points, not '{type(point).__name__}'")
+
+        pairs = [hornerExact(coefficients, numer, denom) for coefficients in self.lists]
+        value, power = pairs[0]
+        power *= self.denominators[0]
+        if len(pairs) == 1:
+            return Fraction(value, power)
+
+        # value / power + (numerator / numerator_power) / (denominator / denominator_power), with one reduction
+        (numerator, numerator_power), (denominator, denominator_power) = pairs[1:]
+        numerator *= denominator_power * self.denominators[2]
+        denominator *= numerator_power * self.denominators[1]
+        if not denominator:
+            raise ZeroDivisionError("the denominator of the fraction is zero at the point")
+        return Fraction(value * denominator + numerator * power, power * denominator)
+
+
+    @property
+    def cost(self) -> Dict[str, int]:
+        """ the number of arithmetic operations of one evaluation at a point """
+
+        steps = sum(len(coefficients) - 1 for coefficients in self.lists)
+        fraction = len(self.lists) == 3
+        if self.kind == "exact":
+            # the value, the coefficient and the power of the denominator are multiplied on every step
+            return {
+                "multiplications": 3 * steps + 1 + (7 if fraction else 0),
+                "additions": steps + (1 if fraction else 0),
+                "divisions": 1,
+            }
+        return {
+            "multiplications": steps,
+            "additions": steps + (1 if fraction else 0),
+            "divisions": 1 if fraction else 0,
+        }
+
+
+    def __repr__(self) -> str:
+        degrees = ", ".join(str(len(coefficients) - 1) for coefficients in self.lists)
+        return f"Kernel(kind={self.kind!r}, degrees=({degrees}), cost={self.cost})"
@@ -0,0 +1,314 @@
+from typing import Dict, List, Tuple, Union
+from weakref import WeakValueDictionary
+from .fraction import Fraction
+from .polynomial import Polinominal, valueKey
+
+
+# the nodes that are alive, equal subexpressions are built only once
+_nodes = WeakValueDictionary()
+
+
+def lazy(value: Union[int, float, Fraction, Polinominal, "Expression"]) -> "Expression":
+    """ the value as a leaf of an expression, the operators on it build the expression without normalizing it """
+
+    if type(value) == Expression:
+        return value
+    if type(value) not in [int, float, Fraction, Polinominal]:
+        raise TypeError(f"can't make an expression of '{type(value).__name__}'")
+
+    key = ("value", type(value).__name__, valueKey(value))
+    node = _nodes.get(key)
+    if node is None:
+        node = Expression("value", (value._copy() if type(value) == Polinominal else value,))
+        _nodes[key] = node
+    return node
+
+
+def Variable(symbol: str="x") -> "Expression":
+    """
+    #### The variable of a lazy expression
+
+    ##### Usage:
+
+    ```Python
+    x = Variable("x")
+    expression = sum(1 / (x**2 + k*x + 1) for k in range(100))
+    print(expression)
+    ```
+    """
+
+    if type(symbol) != str:
+        raise TypeError(f"the type of the variable name should be 'str', not '{type(symbol).__name__}'")
+    return lazy(Polinominal(coefficients={1: 1}, symbol=symbol))
+
+
+def rationalPair(value: Union[int, float, Fraction, Polinominal]) -> Tuple[object, object]:
+    """ the numerator and the denominator of a value, both without fraction parts """
+
+    if type(value) == Fraction:
+        return value.numerator, value.denominator
+    if type(value) == float:
+        return Polinominal({0: value}), 1
+    if type(value) != Polinominal or not value.fraction:
+        return value, 1
+
+    poli = value._copy()
+    poli.fraction = 0
+    numerator, denominator = rationalPair(value.fraction)
+    return poli * denominator + numerator, denominator
+
+
+def combineSum(terms: List[Tuple[int, Tuple[object, object]]]) -> Tuple[object, object]:
+    """ the sum of signed fractions over one common denominator, equal denominators are added first """
+
+    groups = {}
+    for sign, (numerator, denominator) in terms:
+        key = valueKey(denominator)
+        if key in groups:
+            groups[key][0] = groups[key][0] + sign * numerator
+        else:
+            groups[key] = [sign * numerator, denominator]
+
+    numerator, denominator = 0, 1
+    for group_numerator, group_denominator in groups.values():
+        numerator = numerator * group_denominator + group_numerator * denominator
+        denominator = denominator * group_denominator
+    return numerator, denominator
+
+
+def isZero(value: object) -> bool:
+    """ whether a numerator is zero, a polynomial is zero when it has no terms and no fraction part """
+
+    if type(value) == Polinominal:
+        return value._isConstant() and not value._view().get(0, 0)
+    return value == 0
+
+
+def normalize(numerator: object, denominator: object) -> Union[int, Fraction, Polinominal]:
+    """ the fraction as a normalized value, the polynomial part and the reduced proper fraction """
+
+    if type(denominator) == Polinominal and denominator._isConstant():
+        denominator = denominator._view().get(0, 0)
+    if type(numerator) == Polinominal and numerator._isConstant():
+        numerator = numerator._view().get(0, 0)
+    if type(denominator) == Polinominal:
+        # 'Fraction' / 'Polinominal' is not supported, the numerator is divided as a polynomial
+        if type(numerator) != Polinominal:
+            numerator = Polinominal({0: numerator}, symbol=denominator.symbol)
+        return numerator / denominator
+
+    if denominator == 0:
+        raise ZeroDivisionError("division by zero")
+    if type(numerator) == Polinominal:
+        return numerator / denominator
+    return Fraction(numerator, denominator) if type(numerator) == int and type(denominator) == int else numerator / denominator
+
+
+class Expression():
+    """
+    A node of a lazy expression over `Polinominal`, `Fraction` and numbers.
+
+    The operators build a graph of the expression in which equal subexpressions are shared,
+    it is normalized only once when its value is needed: printing, evaluation or comparison.
+    The intermediate results are kept as a numerator and a denominator without any gcd,
+    sums of several fractions are brought to one common denominator.
+
+    To make lazy expression use `lazy` or `Variable` function of this module.
+
+    A division by zero anywhere in the expression raises `ZeroDivisionError`, as it does for the eager operators,
+    even when the zero would cancel out later.
+
+    >>> x = Variable("x")
+    >>> (x / (x / 0)).value()
+    Traceback (most recent call last):
+        ...
+    ZeroDivisionError: division by zero
+    >>> ((x / 0) * 0).value()
+    Traceback (most recent call last):
+        ...
+    ZeroDivisionError: division by zero
+    >>> (x / (x - x)).value()
+    Traceback (most recent call last):
+        ...
+    ZeroDivisionError: division by zero
+    >>> ((x + 1) / (x + 1) * 0).value()
+    0
+    """
+    __slots__ = ["operation", "operands", "_value", "__weakref__"]
+
+    def __init__(self, operation: str, operands: tuple) -> None:
+        self.operation = operation
+        self.operands = operands
+        self._value = None
+
+
+    @staticmethod
+    def _node(operation: str, *operands: Union["Expression", int]) -> "Expression":
+        """ the node of the operation, an equal node that is alive is reused """
+
+        ids = tuple(id(operand) if type(operand) == Expression else operand for operand in operands)
+        if operation in ["+", "*"]:
+            ids = tuple(sorted(ids))
+        key = (operation,) + ids
+
+        node = _nodes.get(key)
+        if node is None:
+            node = Expression(operation, operands)
+            _nodes[key] = node
+        return node
+
+
+    def _operand(self, other, operation: str) -> "Expression":
+        if type(other) not in [int, float, Fraction, Polinominal, Expression]:
+            raise TypeError(f"unsupported operand type(s) for {operation}: 'Expression' and '{type(other).__name__}'")
+        return lazy(other)
+
+
+    def __add__(self, other) -> "Expression":
+        """ 'Expression' + other """
+        return Expression._node("+", self, self._operand(other, "+"))
+
+    __radd__ = __add__
+
+
+    def __sub__(self, other) -> "Expression":
+        """ 'Expression' - other """
+        return Expression._node("-", self, self._operand(other, "-"))
+
+
+    def __rsub__(self, other) -> "Expression":
+        """ other - 'Expression' """
+        return Expression._node("-", self._operand(other, "-"), self)
+
+
+    def __neg__(self) -> "Expression":
+        """ -'Expression' """
+        return Expression._node("neg", self)
+
+
+    def __mul__(self, other) -> "Expression":
+        """ 'Expression' * other """
+        return Expression._node("*", self, self._operand(other, "*"))
+
+    __rmul__ = __mul__
+
+
+    def __truediv__(self, other) -> "Expression":
+        """ 'Expression' / other """
+        return Expression._node("/", self, self._operand(other, "/"))
+
+
+    def __rtruediv__(self, other) -> "Expression":
+        """ other / 'Expression' """
+        return Expression._node("/", self._operand(other, "/"), self)
+
+
+    def __pow__(self, other: int) -> "Expression":
+        """ 'Expression' ** other """
+
+        if type(other) != int:
+            raise TypeError(f"unsupported operand type(s) for **: 'Expression' and '{type(other).__name__}'")
+        if other < 0:
+            raise TypeError(f"the degree of the number must not be lower than 0")
+        return Expression._node("**", self, other)
+
+
+    def _terms(self) -> List[Tuple[int, "Expression"]]:
+        """ the signed terms of the sum that starts at this node, the nested sums and differences are opened """
+
+        terms = []
+        stack = [(1, self)]
+        while stack:
+            sign, node = stack.pop()
+            if node.operation == "+":
+                stack += [(sign, node.operands[1]), (sign, node.operands[0])]
+            elif node.operation == "-":
+                stack += [(-sign, node.operands[1]), (sign, node.operands[0])]
+            elif node.operation == "neg":
+                stack.append((-sign, node.operands[0]))
+            else:
+                terms.append((sign, node))
+        return terms
+
+
+    def _pair(self) -> Tuple[object, object]:
+        """ the numerator and the denominator of the expression, every shared node is computed once """
+
+        pairs: Dict[int, Tuple[object, object]] = {}
+        sums: Dict[int, List[Tuple[int, Expression]]] = {}
+        stack = [self]
+        while stack:
+            node = stack[-1]
+            if id(node) in pairs:
+                stack.pop()
+                continue
+
+            if node.operation in ["+", "-", "neg"]:
+                if id(node) not in sums:
+                    sums[id(node)] = node._terms()
+                children = [child for _, child in sums[id(node)]]
+            else:
+                children = [child for child in node.operands if type(child) == Expression]
+
+            pending = [child for child in children if id(child) not in pairs]
+            if pending:
+                stack += pending
+                continue
+
+            stack.pop()
+            if node.operation == "value":
+                pairs[id(node)] = rationalPair(node.operands[0])
+            elif node.operation in ["+", "-", "neg"]:
+                pairs[id(node)] = combineSum([(sign, pairs[id(child)]) for sign, child in sums[id(node)]])
+            elif node.operation == "*":
+                (first_numer, first_denom), (second_numer, second_denom) = pairs[id(node.operands[0])], pairs[id(node.operands[1])]
+                pairs[id(node)] = first_numer * second_numer, first_denom * second_denom
+            elif node.operation == "/":
+                (first_numer, first_denom), (second_numer, second_denom) = pairs[id(node.operands[0])], pairs[id(node.operands[1])]
+                # a zero denominator in the middle could cancel out later, (x / 0) * 0, so it is caught here
+                if isZero(second_numer):
+                    raise ZeroDivisionError("division by zero")
+                pairs[id(node)] = first_numer * second_denom, first_denom * second_numer
+            elif node.operation == "**":
+                numerator, denominator = pairs[id(node.operands[0])]
+                pairs[id(node)] = numerator ** node.operands[1], denominator ** node.operands[1]
+
+        return pairs[id(self)]
+
+
+    def value(self) -> Union[int, Fraction, Polinominal]:
+        """ the normalized value of the expression, it is computed once """
+
+        if self._value is None:
+            if self.operation == "value":
+                self._value = self.operands[0]
+            else:
+                self._value = normalize(*self._pair())
+        return self._value._copy() if type(self._value) == Polinominal else self._value
+
+
+    def evaluate_polynomial(self, variable: Union[int, float, Fraction]):
+        """ the value of the normalized expression at the point """
+
+        value = self.value()
+        return value.evaluate_polynomial(variable) if type(value) == Polinominal else value
+
+
+    def __eq__(self, other) -> bool:
+        """ 'Expression' == other, compares the normalized values """
+
+        if type(other) == Expression:
+            other = other.value()
+        return self.value() == other
+
+
+    def __hash__(self) -> int:
+        return hash(self.value())
+
+
+    def __str__(self) -> str:
+        return str(self.value())
+
+
+    def __repr__(self) -> str:
+        return repr(self.value())
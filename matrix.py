@@ -0,0 +1,428 @@
+from math import gcd as intGcd
+from random import randrange
+from typing import List, Optional, Tuple, Union
+from .fraction import Fraction
+from .operations import polyMul, scm, trim
+from .polynomial import Polinominal
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+# forces the product of matrices to use "fft" or "kronecker", None tries the batched FFT first when NumPy is installed
+MATMUL_ALGORITHM = None
+
+
+Tensor = List[List[List[int]]]
+
+
+def entryDense(value: Union[int, Fraction, Polinominal], symbol: Optional[str]) -> Tuple[List[int], int, Optional[str]]:
+    """ the numerators, the denominator and the variable of an entry, constants have no variable """
+
+    if type(value) == int:
+        return [value], 1, symbol
+    if type(value) == Fraction and type(value.numerator) == int and type(value.denominator) == int:
+        return [value.numerator], value.denominator, symbol
+    if type(value) == Polinominal and not value.fraction:
+        dense = value._asDense(force=True)
+        if dense is not None:
+            if not value._isConstant():
+                if symbol is not None and value.symbol != symbol:
+                    raise TypeError(f"the entries of a matrix must be polynomials of one variable, not '{symbol}' and '{value.symbol}'")
+                symbol = value.symbol
+            return list(dense[0]), dense[1], symbol
+    raise TypeError(f"the entries of a matrix must be 'int', 'Fraction' or 'Polinominal' with rational coefficients and no fraction, "
+                    f"not '{type(value).__name__}'")
+
+
+def tensorBound(tensor: Tensor) -> Tuple[int, int]:
+    """ the largest absolute value of a coefficient and the length of the entries """
+    return max((abs(c) for row in tensor for entry in row for c in entry), default=0), len(tensor[0][0]) if tensor and tensor[0] else 0
+
+
+def fftMatmul(a: Tensor, b: Tensor) -> Optional[Tensor]:
+    """
+    the product of two coefficient tensors with one batched floating point FFT along the degrees:
+    the transforms of all entries are multiplied as a stack of complex matrices, one for every frequency,
+    None if the rounding can not be trusted
+    """
+
+    try:
+        first, second = numpy.array(a, dtype=numpy.int64), numpy.array(b, dtype=numpy.int64)
+    except OverflowError:
+        return None
+
+    n = first.shape[2] + second.shape[2] - 1
+    size = 1 << (n - 1).bit_length()
+    bound = int(abs(first).max()) * int(abs(second).max()) * second.shape[0] * min(first.shape[2], second.shape[2])
+    # the same margin as `operations.exactFftMul`
+    if bound * max(1, size.bit_length()) * 16 >= 2 ** 52:
+        return None
+
+    first_transform = numpy.fft.rfft(first.astype(float), size, axis=2).transpose(2, 0, 1)
+    second_transform = numpy.fft.rfft(second.astype(float), size, axis=2).transpose(2, 0, 1)
+    product = numpy.fft.irfft((first_transform @ second_transform).transpose(1, 2, 0), size, axis=2)[:, :, :n]
+    result = numpy.rint(product).astype(numpy.int64)
+
+    # cheap check of the rounded product at a random point modulo a prime: A(t) B(t) v = C(t) v for a random vector v
+    prime = 2 ** 31 - 1
+    point = randrange(2, prime)
+    vector = [randrange(prime) for _ in range(second.shape[1])]
+
+    def values(tensor: "numpy.ndarray") -> List[List[int]]:
+        tensor = tensor % prime
+        value = numpy.zeros(tensor.shape[:2], dtype=numpy.int64)
+        for degree in range(tensor.shape[2] - 1, -1, -1):
+            value = (value * point + tensor[:, :, degree]) % prime
+        return value.tolist()
+
+    multiply = lambda matrix, v: [sum(x * y for x, y in zip(row, v)) % prime for row in matrix]
+    if multiply(values(first), multiply(values(second), vector)) != multiply(values(result), vector):
+        return None
+    return result.tolist()
+
+
+def kroneckerMatmul(a: Tensor, b: Tensor) -> Tensor:
+    """
+    the exact product of two coefficient tensors: every entry is packed into one integer with a field wide enough
+    for the coefficients of the product, so the sums of products of the entries are sums of products of integers
+    """
+
+    (a_max, a_length), (b_max, b_length) = tensorBound(a), tensorBound(b)
+    n = a_length + b_length - 1
+    bound = a_max * b_max * len(b) * min(a_length, b_length)
+    width = (bound.bit_length() + 2 + 7) // 8
+    half = 1 << (8 * width - 1)
+    # the fields hold the coefficients shifted by half, so they are never negative
+    offset = int.from_bytes(half.to_bytes(width, "little") * n, "little")
+
+    def pack(tensor: Tensor, length: int) -> List[List[int]]:
+        shift = offset & ((1 << (8 * width * length)) - 1)
+        return [[int.from_bytes(b"".join((c + half).to_bytes(width, "little") for c in entry), "little") - shift for entry in row]
+                for row in tensor]
+
+    first = pack(a, a_length)
+    second = list(zip(*pack(b, b_length)))
+
+    result = []
+    for row in first:
+        result_row = []
+        for column in second:
+            data = (sum(x * y for x, y in zip(row, column)) + offset).to_bytes(n * width, "little")
+            result_row.append([int.from_bytes(data[i:i + width], "little") - half for i in range(0, n * width, width)])
+        result.append(result_row)
+    return result
+
+
+def exactDiv(a: List[int], b: List[int]) -> List[int]:
+    """ the quotient of two integer coefficient lists that is known to be exact """
+
+    n = len(b) - 1
+    lead = b[-1]
+    r = list(a)
+    q = [0] * (len(a) - n)
+    for k in range(len(a) - len(b), -1, -1):
+        t = r[n + k] // lead
+        if t:
+            q[k] = t
+            r[k:n + k + 1] = [x - t * y for x, y in zip(r[k:n + k + 1], b)]
+    return trim(q)
+
+
+class PolinominalMatrix():
+    """
+    A class for representing a matrix of polynomials of one variable as a 3-D tensor of integer numerators,
+    indexed by row, column and degree, with one denominator shared by all coefficients.
+
+    The product of two matrices is one batched convolution of their tensors (a floating point FFT with NumPy
+    when the result can be rounded exactly, Kronecker substitution otherwise) instead of a `Polinominal` product
+    for every pair of entries.
+
+    To make matrix use the constructor with nested lists or a NumPy array of entries, or `PolinominalMatrix.identity`.
+    """
+    __slots__ = ["_tensor", "denominator", "symbol"]
+
+    def __init__(self, entries, symbol: str="x") -> None:
+        if numpy is not None and isinstance(entries, numpy.ndarray):
+            entries = entries.tolist()
+        if type(entries) not in [list, tuple] or not all(type(row) in [list, tuple] for row in entries):
+            raise TypeError("the entries of a matrix should be given as a 2-D NumPy array or nested lists")
+        if len(set(len(row) for row in entries)) > 1:
+            raise ValueError("the rows of a matrix must have the same length")
+
+        found = None
+        dense = []
+        for row in entries:
+            dense_row = []
+            for value in row:
+                numerators, denominator, found = entryDense(value, found)
+                dense_row.append((numerators, denominator))
+            dense.append(dense_row)
+
+        denominator = 1
+        length = 1
+        for row in dense:
+            for numerators, entry_denominator in row:
+                denominator = scm(denominator, entry_denominator)
+                length = max(length, len(numerators))
+
+        tensor = [[[c * (denominator // entry_denominator) for c in numerators] + [0] * (length - len(numerators))
+                   for numerators, entry_denominator in row] for row in dense]
+        self._tensor, self.denominator = PolinominalMatrix._normalize(tensor, denominator)
+        self.symbol = found or symbol
+
+
+    @staticmethod
+    def _normalize(tensor: Tensor, denominator: int) -> Tuple[Tensor, int]:
+        """ drops the degrees that are zero in every entry and cancels the common factor with the denominator """
+
+        length = 1
+        common = denominator
+        for row in tensor:
+            for entry in row:
+                for degree in range(len(entry) - 1, length - 1, -1):
+                    if entry[degree]:
+                        length = degree + 1
+                        break
+                for c in entry:
+                    if common == 1:
+                        break
+                    common = intGcd(common, c)
+        if denominator < 0:
+            common = -common
+
+        if common != 1:
+            tensor = [[[c // common for c in entry[:length]] for entry in row] for row in tensor]
+            denominator //= common
+        elif any(len(entry) != length for row in tensor for entry in row):
+            tensor = [[entry[:length] for entry in row] for row in tensor]
+        return tensor, denominator
+
+
+    @classmethod
+    def fromTensor(cls, tensor: Tensor, denominator: int=1, symbol: str="x") -> "PolinominalMatrix":
+        """ makes a matrix from a tensor of integer numerators indexed by row, column and degree, all entries of one length """
+
+        matrix = cls.__new__(cls)
+        matrix._tensor, matrix.denominator = PolinominalMatrix._normalize(tensor, denominator)
+        matrix.symbol = symbol
+        return matrix
+
+
+    @classmethod
+    def identity(cls, size: int, symbol: str="x") -> "PolinominalMatrix":
+        """ the identity matrix of the size """
+        return cls.fromTensor([[[int(i == j)] for j in range(size)] for i in range(size)], 1, symbol)
+
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        """ the number of rows and columns """
+        return len(self._tensor), len(self._tensor[0]) if self._tensor else 0
+
+
+    @property
+    def degree(self) -> int:
+        """ the highest degree of the entries """
+        return len(self._tensor[0][0]) - 1 if self._tensor and self._tensor[0] else 0
+
+
+    @property
+    def tensor(self) -> Tensor:
+        """ a copy of the integer numerators indexed by row, column and degree, they share `denominator` """
+        return [[list(entry) for entry in row] for row in self._tensor]
+
+
+    def __getitem__(self, index: Tuple[int, int]) -> Polinominal:
+        row, column = index
+        return Polinominal.fromDense(list(self._tensor[row][column]), self.denominator, symbol=self.symbol)
+
+
+    def toList(self) -> List[List[Polinominal]]:
+        """ the entries as nested lists of 'Polinominal' """
+
+        rows, columns = self.shape
+        return [[self[i, j] for j in range(columns)] for i in range(rows)]
+
+
+    def toArray(self) -> "numpy.ndarray":
+        """ the entries as a NumPy object array of 'Polinominal' """
+
+        rows, columns = self.shape
+        array = numpy.empty((rows, columns), dtype=object)
+        for i, row in enumerate(self.toList()):
+            for j, value in enumerate(row):
+                array[i, j] = value
+        return array
+
+
+    def _operand(self, other, operation: str) -> "PolinominalMatrix":
+        if type(other) == PolinominalMatrix:
+            matrix = other
+        elif type(other) in [list, tuple] or (numpy is not None and isinstance(other, numpy.ndarray)):
+            matrix = PolinominalMatrix(other, self.symbol)
+        else:
+            raise TypeError(f"unsupported operand type(s) for {operation}: 'PolinominalMatrix' and '{type(other).__name__}'")
+
+        if matrix.symbol != self.symbol and matrix.degree and self.degree:
+            raise TypeError(f"unsupported operand type(s) for {operation}: matrices of '{self.symbol}' and '{matrix.symbol}'")
+        return matrix
+
+
+    def _symbol(self, other: "PolinominalMatrix") -> str:
+        """ the variable of the result, a constant matrix takes the variable of the other operand """
+        return self.symbol if self.degree else other.symbol
+
+
+    def _combine(self, other: "PolinominalMatrix", sign: int) -> "PolinominalMatrix":
+        """ self + sign * other """
+
+        if self.shape != other.shape:
+            raise ValueError(f"the shapes of the matrices are different: {self.shape} and {other.shape}")
+
+        denominator = scm(self.denominator, other.denominator)
+        first, second = denominator // self.denominator, sign * (denominator // other.denominator)
+        length = max(self.degree, other.degree) + 1
+        tensor = []
+        for first_row, second_row in zip(self._tensor, other._tensor):
+            row = []
+            for x, y in zip(first_row, second_row):
+                x = [c * first for c in x] + [0] * (length - len(x))
+                y = [c * second for c in y] + [0] * (length - len(y))
+                row.append([c + d for c, d in zip(x, y)])
+            tensor.append(row)
+        return PolinominalMatrix.fromTensor(tensor, denominator, self._symbol(other))
+
+
+    def __add__(self, other) -> "PolinominalMatrix":
+        """ 'PolinominalMatrix' + other """
+        return self._combine(self._operand(other, "+"), 1)
+
+    __radd__ = __add__
+
+
+    def __sub__(self, other) -> "PolinominalMatrix":
+        """ 'PolinominalMatrix' - other """
+        return self._combine(self._operand(other, "-"), -1)
+
+
+    def __rsub__(self, other) -> "PolinominalMatrix":
+        """ other - 'PolinominalMatrix' """
+        return self._operand(other, "-")._combine(self, -1)
+
+
+    def __neg__(self) -> "PolinominalMatrix":
+        """ -'PolinominalMatrix' """
+        return PolinominalMatrix.fromTensor([[[-c for c in entry] for entry in row] for row in self._tensor], self.denominator, self.symbol)
+
+
+    def __mul__(self, other: Union[int, Fraction, Polinominal]) -> "PolinominalMatrix":
+        """ 'PolinominalMatrix' * other, the product of every entry and a scalar, use @ for the product of matrices """
+
+        if type(other) not in [int, Fraction, Polinominal]:
+            raise TypeError(f"unsupported operand type(s) for *: 'PolinominalMatrix' and '{type(other).__name__}'")
+
+        numerators, denominator, symbol = entryDense(other, self.symbol if self.degree else None)
+        tensor = [[polyMul(entry, numerators) or [0] for entry in row] for row in self._tensor]
+        length = max(len(entry) for row in tensor for entry in row) if tensor else 1
+        tensor = [[entry + [0] * (length - len(entry)) for entry in row] for row in tensor]
+        return PolinominalMatrix.fromTensor(tensor, self.denominator * denominator, symbol or self.symbol)
+
+    __rmul__ = __mul__
+
+
+    def __matmul__(self, other) -> "PolinominalMatrix":
+        """ 'PolinominalMatrix' @ other """
+
+        other = self._operand(other, "@")
+        if self.shape[1] != other.shape[0]:
+            raise ValueError(f"the shapes of the matrices {self.shape} and {other.shape} can't be multiplied")
+
+        tensor = None
+        if MATMUL_ALGORITHM != "kronecker" and numpy is not None:
+            tensor = fftMatmul(self._tensor, other._tensor)
+        if tensor is None:
+            if MATMUL_ALGORITHM == "fft":
+                raise ValueError("the product of these matrices can't be computed exactly with the floating point FFT")
+            tensor = kroneckerMatmul(self._tensor, other._tensor)
+        return PolinominalMatrix.fromTensor(tensor, self.denominator * other.denominator, self._symbol(other))
+
+
+    def __rmatmul__(self, other) -> "PolinominalMatrix":
+        """ other @ 'PolinominalMatrix' """
+        return self._operand(other, "@") @ self
+
+
+    def __pow__(self, other: int) -> "PolinominalMatrix":
+        """ 'PolinominalMatrix' ** other, the power of a square matrix """
+
+        if type(other) != int:
+            raise TypeError(f"unsupported operand type(s) for **: 'PolinominalMatrix' and '{type(other).__name__}'")
+        if other < 0:
+            raise TypeError(f"the degree of the number must not be lower than 0")
+        if self.shape[0] != self.shape[1]:
+            raise ValueError(f"only a square matrix can be raised to a power, not {self.shape}")
+
+        result = PolinominalMatrix.identity(self.shape[0], self.symbol)
+        base = self
+        # square-and-multiply over the bits of the exponent
+        while other:
+            if other & 1:
+                result = result @ base
+            other >>= 1
+            if other:
+                base = base @ base
+        return result
+
+
+    def determinant(self) -> Polinominal:
+        """ the determinant of a square matrix by the fraction-free Bareiss elimination over the integer numerators """
+
+        size = self.shape[0]
+        if self.shape[1] != size:
+            raise ValueError(f"only a square matrix has a determinant, not {self.shape}")
+
+        matrix = [[trim(list(entry)) for entry in row] for row in self._tensor]
+        sign = 1
+        previous = [1]
+        for k in range(size - 1):
+            if not matrix[k][k]:
+                pivot = next((i for i in range(k + 1, size) if matrix[i][k]), None)
+                if pivot is None:
+                    return Polinominal.fromDense([], symbol=self.symbol)
+                matrix[k], matrix[pivot] = matrix[pivot], matrix[k]
+                sign = -sign
+
+            for i in range(k + 1, size):
+                for j in range(k + 1, size):
+                    first = polyMul(matrix[i][j], matrix[k][k])
+                    second = polyMul(matrix[i][k], matrix[k][j])
+                    if len(first) < len(second):
+                        first = first + [0] * (len(second) - len(first))
+                    value = trim([x - y for x, y in zip(first, second)] + first[len(second):])
+                    # every entry of the step is divisible by the previous pivot
+                    matrix[i][j] = exactDiv(value, previous) if value else value
+            previous = matrix[k][k]
+
+        numerators = [sign * c for c in matrix[-1][-1]] if size else [1]
+        return Polinominal.fromDense(numerators, self.denominator ** size, symbol=self.symbol)
+
+
+    def __eq__(self, other: object) -> bool:
+        """ 'PolinominalMatrix' == other, compares the entries of two matrices """
+
+        if type(other) != PolinominalMatrix:
+            return NotImplemented
+        if self.degree and other.degree and self.symbol != other.symbol:
+            return False
+        return self.denominator == other.denominator and self._tensor == other._tensor
+
+    __hash__ = None
+
+
+    def __repr__(self) -> str:
+        return "\n".join("[" + ", ".join(repr(value) for value in row) + "]" for row in self.toList())
+
+    __str__ = __repr__
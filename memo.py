@@ -0,0 +1,145 @@
+"""
+Opt-in memoization of the expensive operations: the polynomial `gcd`, division and powers.
+
+Every operation has its own LRU cache, all of them are disabled until `enable` is called.
+
+>>> from PyCalc import memo
+>>> from PyCalc.polynomial import Variable
+>>> x = Variable("x")
+>>> memo.enable(256)
+>>> expression = sum(1 / (x**2 + k*x + 1) for k in range(6))
+>>> memo.statistics()["pow"]
+{'size': 1, 'maxsize': 256, 'hits': 5, 'misses': 1, 'evictions': 0, 'hit_rate': 0.8333333333333334}
+"""
+
+from collections import OrderedDict
+from functools import wraps
+from typing import Callable, Dict, Hashable, Optional, Tuple
+
+
+class LRUCache():
+    """
+    A dict with a bound on its size that drops the least recently used entries and counts its hits and misses,
+    a cache with `maxsize` 0 is disabled
+    """
+    __slots__ = ["maxsize", "data", "hits", "misses", "evictions"]
+
+    def __init__(self, maxsize: int=0) -> None:
+        self.maxsize = maxsize
+        self.data = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+
+    def get(self, key: Hashable) -> Tuple[bool, object]:
+        """ whether the key is cached and its value """
+
+        if key in self.data:
+            self.data.move_to_end(key)
+            self.hits += 1
+            return True, self.data[key]
+        self.misses += 1
+        return False, None
+
+
+    def put(self, key: Hashable, value: object) -> None:
+        self.data[key] = value
+        while len(self.data) > self.maxsize:
+            self.data.popitem(last=False)
+            self.evictions += 1
+
+
+    def clear(self) -> None:
+        self.data.clear()
+        self.hits = self.misses = self.evictions = 0
+
+
+    def statistics(self) -> Dict[str, float]:
+        calls = self.hits + self.misses
+        return {
+            "size": len(self.data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / calls if calls else 0.0,
+        }
+
+
+caches = {
+    "gcd": LRUCache(),
+    "divmod": LRUCache(),
+    "pow": LRUCache(),
+}
+
+
+def enable(maxsize: int=1024, *names: str) -> None:
+    """ enables the caches of the given operations (all by default) with at most `maxsize` entries each """
+
+    if type(maxsize) != int or maxsize < 0:
+        raise ValueError(f"the size of a cache should be a non-negative 'int', not {maxsize!r}")
+    for name in names or caches:
+        cache = caches[name]
+        cache.maxsize = maxsize
+        while len(cache.data) > maxsize:
+            cache.data.popitem(last=False)
+
+
+def disable(*names: str) -> None:
+    """ disables and empties the caches of the given operations (all by default) """
+
+    for name in names or caches:
+        caches[name].maxsize = 0
+        caches[name].clear()
+
+
+def clear() -> None:
+    """ empties all caches and resets their statistics """
+
+    for cache in caches.values():
+        cache.clear()
+
+
+def statistics() -> Dict[str, Dict[str, float]]:
+    """ the size, the hits, the misses and the evictions of every cache """
+    return {name: cache.statistics() for name, cache in caches.items()}
+
+
+def copyResult(value: object) -> object:
+    """ a copy of a cached result that the caller may change, polynomials are mutable """
+
+    if type(value) == tuple:
+        return tuple(copyResult(item) for item in value)
+    if hasattr(value, "_copy"):
+        return value._copy()
+    return value
+
+
+def memoize(name: str, key: Callable[..., Optional[Hashable]]) -> Callable:
+    """
+    a decorator that caches the results of a function in the cache `name` while the cache is enabled,
+    `key` makes a hashable key of the arguments or None for the arguments that are not cached
+    """
+
+    def decorator(function: Callable) -> Callable:
+        @wraps(function)
+        def wrapper(*arguments):
+            cache = caches[name]
+            if not cache.maxsize:
+                return function(*arguments)
+
+            cache_key = key(*arguments)
+            if cache_key is None:
+                return function(*arguments)
+
+            found, value = cache.get(cache_key)
+            if not found:
+                value = function(*arguments)
+                cache.put(cache_key, copyResult(value))
+                return value
+            return copyResult(value)
+
+        return wrapper
+
+    return decorator
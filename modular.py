@@ -0,0 +1,386 @@
+from typing import Dict, List, Optional, Tuple, Union
+from .fraction import Fraction
+from .operations import evaluateMod, gcdMod, isPrime, rationalReconstruction, schoolbookMul, trim
+from .polynomial import Polinominal
+
+
+def residue(value: Union[int, Fraction], modulus: int) -> int:
+    """ the integer or the fraction with integer parts as a residue modulo the prime """
+
+    if type(value) == int:
+        return value % modulus
+    if type(value) == Fraction and type(value.numerator) == int and type(value.denominator) == int:
+        if value.denominator % modulus == 0 and value._reduce().denominator % modulus == 0:
+            raise ZeroDivisionError(f"the denominator of {value} is divisible by {modulus}")
+        return value.numerator * pow(value.denominator, modulus - 2, modulus) % modulus
+    raise TypeError(f"can't reduce '{type(value).__name__}' modulo a prime")
+
+
+# products of operands shorter than this are computed term by term, longer ones with Kronecker substitution
+KRONECKER_THRESHOLD = 8
+# divisions whose divisor and quotient are both at least this long multiply by the reciprocal series of the divisor
+NEWTON_THRESHOLD = 64
+
+
+def mulMod(a: List[int], b: List[int], prime: int) -> List[int]:
+    """
+    product of two lists of residues modulo the prime, the long ones are packed into two integers
+    with a field wide enough for every coefficient of the product, so one integer product gives all of them
+    """
+
+    if not a or not b:
+        return []
+    if min(len(a), len(b)) < KRONECKER_THRESHOLD:
+        return [c % prime for c in schoolbookMul(a, b)]
+
+    width = (2 * (prime - 1).bit_length() + min(len(a), len(b)).bit_length() + 7) // 8
+    first = int.from_bytes(b"".join(c.to_bytes(width, "little") for c in a), "little")
+    second = int.from_bytes(b"".join(c.to_bytes(width, "little") for c in b), "little")
+    size = (len(a) + len(b) - 1) * width
+    data = (first * second).to_bytes(size, "little")
+    return [int.from_bytes(data[i:i + width], "little") % prime for i in range(0, size, width)]
+
+
+def inverseMod(f: List[int], n: int, prime: int) -> List[int]:
+    """ the first n coefficients of the reciprocal series of f modulo the prime by Newton iteration, f[0] must not be 0 """
+
+    g = [pow(f[0], prime - 2, prime)]
+    k = 1
+    while k < n:
+        k = min(2 * k, n)
+        # g = g * (2 - f * g) modulo x^k
+        error = mulMod(f[:k], g, prime)[:k]
+        error = [(-c) % prime for c in error]
+        error[0] = (error[0] + 2) % prime
+        g = mulMod(g, error, prime)[:k]
+    return g
+
+
+def divmodMod(a: List[int], b: List[int], prime: int) -> Tuple[List[int], List[int]]:
+    """ the quotient and the remainder of two coefficient lists modulo the prime, `b` must have a non-zero leading coefficient """
+
+    if len(a) < len(b):
+        return [], list(a)
+
+    shift = len(b) - 1
+    if min(len(b), len(a) - shift) >= NEWTON_THRESHOLD:
+        # the reversed quotient is the reversed dividend times the reciprocal series of the reversed divisor
+        n = len(a) - shift
+        quotient = mulMod(a[::-1][:n], inverseMod(b[::-1], n, prime), prime)[:n][::-1]
+        product = mulMod(quotient, b, prime)
+        return trim(quotient), trim([(x - y) % prime for x, y in zip(a[:shift], product)])
+
+    a = list(a)
+    inverse = pow(b[-1], prime - 2, prime)
+    quotient = [0] * (len(a) - shift)
+    for k in range(len(a) - len(b), -1, -1):
+        c = a[k + shift] * inverse % prime
+        if c:
+            quotient[k] = c
+            a[k:k + shift + 1] = [(x - c * y) % prime for x, y in zip(a[k:k + shift + 1], b)]
+    return quotient, trim(a[:shift])
+
+
+def Variable(symbol: str="x", modulus: int=2 ** 31 - 1) -> "ModPolinominal":
+    """
+    #### The variable of a polynomial with coefficients modulo a prime
+
+    ##### Usage:
+
+    ```Python
+    x = Variable("x", 101)
+    expression = x**2 + 100*x + 3
+    ```
+    """
+
+    if type(symbol) != str:
+        raise TypeError(f"the type of the variable name should be 'str', not '{type(symbol).__name__}'")
+    return ModPolinominal({1: 1}, modulus, symbol)
+
+
+class ModPolinominal():
+    """
+    A class for representing a polynomial with coefficients in the integers modulo a prime.
+
+    The coefficients are plain integers from 0 to `modulus - 1` in a list indexed by degree, so the operators
+    never make a `Fraction` or call `gcd`; the division by a polynomial is `//`, `%` and `divmod`.
+
+    To make mathematical expression use `Variable` function of this module or `Polinominal.toModular`.
+    """
+    __slots__ = ["_coefficients", "modulus", "symbol"]
+
+    def __init__(self, coefficients: Dict[int, Union[int, Fraction]]={}, modulus: int=2 ** 31 - 1, symbol: str="x") -> None:
+        if type(coefficients) != dict:
+            raise TypeError("use the Variable function to create a variable, and then make an expression")
+        if type(modulus) != int or not isPrime(modulus):
+            raise ValueError(f"the modulus should be a prime 'int', not {modulus!r}")
+
+        self.modulus = modulus
+        self.symbol = symbol
+        self._coefficients = [0] * (max(coefficients, default=-1) + 1)
+        for degree, coefficient in coefficients.items():
+            if type(degree) != int or degree < 0:
+                raise TypeError(f"the degrees must be non-negative 'int', not {degree!r}")
+            self._coefficients[degree] = residue(coefficient, modulus)
+        trim(self._coefficients)
+
+
+    @classmethod
+    def fromList(cls, coefficients: List[int], modulus: int, symbol: str="x") -> "ModPolinominal":
+        """ makes a polynomial from residues indexed by degree without checking them """
+
+        poli = cls.__new__(cls)
+        poli._coefficients = trim(coefficients)
+        poli.modulus = modulus
+        poli.symbol = symbol
+        return poli
+
+
+    @classmethod
+    def fromPolinominal(cls, poli: Union[int, Fraction, Polinominal], modulus: int) -> "ModPolinominal":
+        """ the image of the polynomial with rational coefficients, the prime must not divide their denominators """
+
+        if type(poli) != Polinominal:
+            return cls.fromList([residue(poli, modulus)], modulus)
+        if poli.fraction:
+            raise TypeError("can't convert a 'Polinominal' with a fraction to 'ModPolinominal'")
+
+        dense = poli._asDense(force=True)
+        if dense is None:
+            raise TypeError("can't convert a 'Polinominal' with 'float' coefficients to 'ModPolinominal'")
+        numerators, denominator = dense
+        if denominator % modulus == 0:
+            raise ZeroDivisionError(f"the denominator of the coefficients is divisible by {modulus}")
+
+        inverse = pow(denominator, modulus - 2, modulus)
+        return cls.fromList([numerator * inverse % modulus for numerator in numerators], modulus, poli.symbol)
+
+
+    def toPolinominal(self, rational: bool=False) -> Polinominal:
+        """
+        the polynomial with the coefficients lifted to the integers from -modulus/2 to modulus/2,
+        or with `rational` set to the fractions with the smallest parts that have these residues
+        """
+
+        if not rational:
+            half = self.modulus // 2
+            return Polinominal.fromDense([c - self.modulus if c > half else c for c in self._coefficients], symbol=self.symbol)
+
+        terms = {}
+        for degree, c in enumerate(self._coefficients):
+            if c:
+                pair = rationalReconstruction(c, self.modulus)
+                if pair is None:
+                    raise ValueError(f"the coefficient {c} of degree {degree} has no small rational reconstruction")
+                terms[degree] = Fraction(*pair)
+        return Polinominal(terms, symbol=self.symbol)
+
+
+    @property
+    def coefficients(self) -> Dict[int, int]:
+        """ the non-zero terms of the polynomial as a dict of degree and residue """
+        return {degree: c for degree, c in enumerate(self._coefficients) if c}
+
+
+    @property
+    def degree(self) -> int:
+        """ the degree of the polynomial, -1 for zero """
+        return len(self._coefficients) - 1
+
+
+    def _operand(self, other, operation: str) -> Optional[List[int]]:
+        """ the coefficient list of other, None for the unsupported types """
+
+        if type(other) in [int, Fraction, Polinominal]:
+            other = ModPolinominal.fromPolinominal(other, self.modulus)
+        if type(other) != ModPolinominal:
+            return None
+        if other.modulus != self.modulus:
+            raise ValueError(f"the moduli of the polynomials are different: {self.modulus} and {other.modulus}")
+        if other.symbol != self.symbol and len(other._coefficients) > 1 and len(self._coefficients) > 1:
+            raise TypeError(f"unsupported operand type(s) for {operation}: polynomials of '{self.symbol}' and '{other.symbol}'")
+        return other._coefficients
+
+
+    def _new(self, coefficients: List[int], other) -> "ModPolinominal":
+        """ the result of an operation with other, the symbol of a constant gives way to the symbol of a variable """
+
+        symbol = self.symbol
+        if len(self._coefficients) <= 1 and type(other) in [ModPolinominal, Polinominal]:
+            symbol = other.symbol
+        return ModPolinominal.fromList(coefficients, self.modulus, symbol)
+
+
+    def __add__(self, other: Union[int, Fraction, Polinominal, "ModPolinominal"]) -> "ModPolinominal":
+        """ 'ModPolinominal' + other """
+
+        second = self._operand(other, "+")
+        if second is None:
+            raise TypeError(f"unsupported operand type(s) for +: 'ModPolinominal' and '{type(other).__name__}'")
+        return self._new(self._combine(self._coefficients, second, 1), other)
+
+    __radd__ = __add__
+
+
+    def __sub__(self, other: Union[int, Fraction, Polinominal, "ModPolinominal"]) -> "ModPolinominal":
+        """ 'ModPolinominal' - other """
+
+        second = self._operand(other, "-")
+        if second is None:
+            raise TypeError(f"unsupported operand type(s) for -: 'ModPolinominal' and '{type(other).__name__}'")
+        return self._new(self._combine(self._coefficients, second, -1), other)
+
+
+    def __rsub__(self, other: Union[int, Fraction, Polinominal]) -> "ModPolinominal":
+        """ other - 'ModPolinominal' """
+
+        first = self._operand(other, "-")
+        if first is None:
+            raise TypeError(f"unsupported operand type(s) for -: '{type(other).__name__}' and 'ModPolinominal'")
+        return self._new(self._combine(first, self._coefficients, -1), other)
+
+
+    def _combine(self, first: List[int], second: List[int], sign: int) -> List[int]:
+        """ first + sign * second modulo the prime """
+
+        p = self.modulus
+        if len(first) < len(second):
+            first = first + [0] * (len(second) - len(first))
+        result = [(x + sign * y) % p for x, y in zip(first, second)]
+        return result + first[len(second):]
+
+
+    def __neg__(self) -> "ModPolinominal":
+        """ -'ModPolinominal' """
+        return ModPolinominal.fromList([(-c) % self.modulus for c in self._coefficients], self.modulus, self.symbol)
+
+
+    def __mul__(self, other: Union[int, Fraction, Polinominal, "ModPolinominal"]) -> "ModPolinominal":
+        """ 'ModPolinominal' * other """
+
+        second = self._operand(other, "*")
+        if second is None:
+            raise TypeError(f"unsupported operand type(s) for *: 'ModPolinominal' and '{type(other).__name__}'")
+
+        if len(second) == 1:
+            factor = second[0]
+            return self._new([c * factor % self.modulus for c in self._coefficients], other)
+        return self._new(mulMod(self._coefficients, second, self.modulus), other)
+
+    __rmul__ = __mul__
+
+
+    def __truediv__(self, other: Union[int, Fraction, "ModPolinominal"]) -> "ModPolinominal":
+        """ 'ModPolinominal' / other, only the division by a constant is supported """
+
+        second = self._operand(other, "/")
+        if second is None:
+            raise TypeError(f"unsupported operand type(s) for /: 'ModPolinominal' and '{type(other).__name__}'")
+        if len(second) > 1:
+            raise TypeError("a 'ModPolinominal' can only be divided by a constant, use // and % for polynomials")
+        if not second:
+            raise ZeroDivisionError("division by zero")
+
+        p = self.modulus
+        inverse = pow(second[0], p - 2, p)
+        return ModPolinominal.fromList([c * inverse % p for c in self._coefficients], p, self.symbol)
+
+
+    def __divmod__(self, other: Union[int, Fraction, Polinominal, "ModPolinominal"]) -> Tuple["ModPolinominal", "ModPolinominal"]:
+        """ divmod('ModPolinominal', other) """
+
+        second = self._operand(other, "divmod")
+        if second is None:
+            raise TypeError(f"unsupported operand type(s) for divmod(): 'ModPolinominal' and '{type(other).__name__}'")
+        if not second:
+            raise ZeroDivisionError("polynomial division by zero")
+
+        quotient, remainder = divmodMod(self._coefficients, second, self.modulus)
+        return self._new(quotient, other), self._new(remainder, other)
+
+
+    def __floordiv__(self, other: Union[int, Fraction, Polinominal, "ModPolinominal"]) -> "ModPolinominal":
+        """ 'ModPolinominal' // other """
+        return divmod(self, other)[0]
+
+
+    def __mod__(self, other: Union[int, Fraction, Polinominal, "ModPolinominal"]) -> "ModPolinominal":
+        """ 'ModPolinominal' % other """
+        return divmod(self, other)[1]
+
+
+    def __pow__(self, other: int) -> "ModPolinominal":
+        """ 'ModPolinominal' ** other """
+
+        if type(other) != int:
+            raise TypeError(f"unsupported operand type(s) for **: 'ModPolinominal' and '{type(other).__name__}'")
+        if other < 0:
+            raise TypeError(f"the degree of the number must not be lower than 0")
+
+        result = ModPolinominal.fromList([1], self.modulus, self.symbol)
+        base = self
+        # square-and-multiply over the bits of the exponent
+        while other:
+            if other & 1:
+                result = result * base
+            other >>= 1
+            if other:
+                base = base * base
+        return result
+
+
+    def gcd(self, other: Union[int, Fraction, Polinominal, "ModPolinominal"]) -> "ModPolinominal":
+        """ the monic greatest common divisor of the polynomials """
+
+        second = self._operand(other, "gcd")
+        if second is None:
+            raise TypeError(f"can't calculate gcd of 'ModPolinominal' and '{type(other).__name__}'")
+        if not self._coefficients and not second:
+            return self._new([], other)
+        if not second:
+            return self / self._coefficients[-1]
+        if not self._coefficients:
+            return self._new(second, other) / second[-1]
+        return self._new(gcdMod(self._coefficients, second, self.modulus), other)
+
+
+    def evaluate_polynomial(self, variable: Union[int, Fraction]) -> int:
+        """ the residue of the value of the polynomial at the point """
+        return evaluateMod(self._coefficients, residue(variable, self.modulus), self.modulus)
+
+
+    def __eq__(self, other: object) -> bool:
+        """ 'ModPolinominal' == other, polynomials of different moduli are not equal """
+
+        if type(other) == ModPolinominal:
+            if other.modulus != self.modulus:
+                return False
+            if len(self._coefficients) > 1 and other.symbol != self.symbol:
+                return False
+            return other._coefficients == self._coefficients
+        return NotImplemented
+
+
+    def __hash__(self) -> int:
+        symbol = self.symbol if len(self._coefficients) > 1 else None
+        return hash((self.modulus, symbol, tuple(self._coefficients)))
+
+
+    def __repr__(self) -> str:
+        string = []
+        for degree in range(len(self._coefficients) - 1, -1, -1):
+            c = self._coefficients[degree]
+            if not c:
+                continue
+            s = "" if not string else "+ "
+            if c != 1 or degree == 0:
+                s += str(c)
+            if degree == 1:
+                s += self.symbol
+            elif degree:
+                s += f"{self.symbol}^{degree}"
+            string.append(s)
+
+        return f"{' '.join(string) or '0'} (mod {self.modulus})"
+
+    __str__ = __repr__
@@ -0,0 +1,368 @@
+from typing import Dict, Tuple, Union
+from .fraction import Fraction
+from .polynomial import Polinominal, valueKey
+
+
+# the bits of one exponent in a packed key, the highest of them is a guard bit that catches overflows
+EXPONENT_BITS = 16
+
+
+def guardMask(count: int) -> int:
+    """ the mask of the guard bits of `count` packed exponents """
+
+    field = (1 << EXPONENT_BITS) - 1
+    return ((1 << (EXPONENT_BITS * count)) - 1) // field << (EXPONENT_BITS - 1)
+
+
+def pack(exponents: Tuple[int, ...]) -> int:
+    """ packs the exponents into one key, the first exponent takes the lowest bits """
+
+    key = 0
+    for exponent in reversed(exponents):
+        if type(exponent) != int or not 0 <= exponent < 1 << (EXPONENT_BITS - 1):
+            raise ValueError(f"the exponents must be 'int' from 0 to {(1 << (EXPONENT_BITS - 1)) - 1}, not {exponent!r}")
+        key = (key << EXPONENT_BITS) | exponent
+    return key
+
+
+def unpack(key: int, count: int) -> Tuple[int, ...]:
+    """ the `count` exponents of a packed key """
+
+    field = (1 << EXPONENT_BITS) - 1
+    return tuple((key >> (EXPONENT_BITS * i)) & field for i in range(count))
+
+
+def termsMul(first: Dict[int, Union[int, Fraction]], second: Dict[int, Union[int, Fraction]], guard: int) -> Dict[int, Union[int, Fraction]]:
+    """ the product of two dicts of terms keyed by packed exponents, the sum of two keys is the key of their product """
+
+    if len(first) > len(second):
+        first, second = second, first
+
+    terms = {}
+    get = terms.get
+    for first_key, first_coefficient in first.items():
+        for second_key, second_coefficient in second.items():
+            key = first_key + second_key
+            terms[key] = get(key, 0) + first_coefficient * second_coefficient
+
+    for key in [key for key, coefficient in terms.items() if not coefficient]:
+        del terms[key]
+    if any(key & guard for key in terms):
+        raise OverflowError(f"an exponent of the product exceeds {(1 << (EXPONENT_BITS - 1)) - 1}")
+    return terms
+
+
+def Variables(*symbols: str) -> Tuple["MultiPolinominal", ...]:
+    """
+    #### The variables of a polynomial of several variables
+
+    ##### Usage:
+
+    ```Python
+    x, y, z = Variables("x", "y", "z")
+    expression = x**2*y - 3*y*z + 1
+    ```
+    """
+
+    for symbol in symbols:
+        if type(symbol) != str:
+            raise TypeError(f"the type of the variable name should be 'str', not '{type(symbol).__name__}'")
+    if len(set(symbols)) != len(symbols):
+        raise ValueError("the variable names must be different")
+
+    return tuple(MultiPolinominal.fromPacked({1 << (EXPONENT_BITS * i): 1}, symbols) for i in range(len(symbols)))
+
+
+class MultiPolinominal():
+    """
+    A class for representing a polynomial of several variables as a dict of terms.
+
+    The exponents of every term are packed into one integer key: the exponent of the i-th symbol takes
+    `EXPONENT_BITS` bits from bit `i * EXPONENT_BITS`, so the key of a product of two terms is the sum of their keys.
+
+    To make mathematical expression use `Variables` function.
+
+    Two polynomials are equal when they have the same terms over the symbols they use, whatever the order
+    of their symbols; a constant polynomial equals its number and has its hash.
+
+    >>> x, y = Variables("x", "y")
+    >>> x*y == y*x, (x + y)**2 == x**2 + 2*x*y + y**2, x*y - y*x == 0
+    (True, True, True)
+    >>> len({x*y, y*x, (x + 1)*y - y}), hash(x - x + 3) == hash(3)
+    (1, True)
+    """
+    __slots__ = ["_terms", "symbols"]
+
+    def __init__(self, coefficients: Dict[Tuple[int, ...], Union[int, float, Fraction]]={}, symbols: Tuple[str, ...]=("x",)) -> None:
+        if type(coefficients) != dict:
+            raise TypeError("use the Variables function to create variables, and then make an expression")
+
+        self.symbols = tuple(symbols)
+        self._terms = {}
+        for exponents, coefficient in coefficients.items():
+            if type(exponents) != tuple or len(exponents) != len(self.symbols):
+                raise TypeError(f"the terms must be keyed by tuples of {len(self.symbols)} exponents")
+            if type(coefficient) not in [int, float, Fraction]:
+                raise TypeError(f"the coefficients must be 'int', 'float' or 'Fraction', not '{type(coefficient).__name__}'")
+            if type(coefficient) == float:
+                coefficient = Fraction(coefficient, 1)
+            key = pack(exponents)
+            coefficient = self._terms.get(key, 0) + coefficient
+            if coefficient:
+                self._terms[key] = coefficient
+            else:
+                self._terms.pop(key, None)
+
+
+    @classmethod
+    def fromPacked(cls, terms: Dict[int, Union[int, Fraction]], symbols: Tuple[str, ...]) -> "MultiPolinominal":
+        """
+        makes a polynomial from non-zero coefficients keyed by packed exponents without checking them;
+        the polynomial takes the dict itself, the caller must not keep it or change it afterwards
+        """
+
+        poli = cls.__new__(cls)
+        poli._terms = terms
+        poli.symbols = symbols
+        return poli
+
+
+    @classmethod
+    def fromPolinominal(cls, poli: Polinominal) -> "MultiPolinominal":
+        """ the polynomial of one variable as a polynomial of its symbol """
+
+        if poli.fraction:
+            raise TypeError("can't convert a 'Polinominal' with a fraction to 'MultiPolinominal'")
+
+        terms = {}
+        for degree, coefficient in poli._view().items():
+            if coefficient:
+                terms[pack((degree,))] = coefficient
+        return cls.fromPacked(terms, (poli.symbol,))
+
+
+    @property
+    def coefficients(self) -> Dict[Tuple[int, ...], Union[int, Fraction]]:
+        """ the terms of the polynomial as a dict of exponent tuples and coefficients """
+        return {unpack(key, len(self.symbols)): coefficient for key, coefficient in self._terms.items()}
+
+
+    def _align(self, other: "MultiPolinominal") -> Tuple[Dict[int, Union[int, Fraction]], Tuple[str, ...]]:
+        """
+        the terms of other packed over the symbols of self followed by the new symbols of other;
+        for the same symbols these are the terms of other themselves, so they are only for reading
+        """
+
+        if other.symbols == self.symbols:
+            return other._terms, self.symbols
+
+        symbols = self.symbols + tuple(symbol for symbol in other.symbols if symbol not in self.symbols)
+        shifts = [EXPONENT_BITS * symbols.index(symbol) for symbol in other.symbols]
+        field = (1 << EXPONENT_BITS) - 1
+
+        terms = {}
+        for key, coefficient in other._terms.items():
+            new_key = 0
+            for shift in shifts:
+                new_key |= (key & field) << shift
+                key >>= EXPONENT_BITS
+            terms[new_key] = coefficient
+        return terms, symbols
+
+
+    def _canonical(self) -> Union[int, Fraction, tuple]:
+        """
+        a hashable snapshot of the value of the polynomial: the number of a constant, otherwise the symbols
+        it uses in sorted order and its terms as sorted tuples of their exponents and coefficients
+        """
+
+        count = len(self.symbols)
+        exponents = {key: unpack(key, count) for key in self._terms}
+        used = sorted((symbol, i) for i, symbol in enumerate(self.symbols) if any(exponent[i] for exponent in exponents.values()))
+        if not used:
+            return self._terms.get(0, 0)
+
+        terms = tuple(sorted((tuple(exponents[key][i] for _, i in used), valueKey(coefficient)) for key, coefficient in self._terms.items()))
+        return tuple(symbol for symbol, _ in used), terms
+
+
+    def __eq__(self, other: object) -> bool:
+        """ 'MultiPolinominal' == other, compares the values of two polynomials or of a constant and a number """
+
+        if type(other) == float:
+            other = Fraction(other, 1)
+        if type(other) in [int, Fraction]:
+            value = self._canonical()
+            return type(value) != tuple and value == other
+        if type(other) != MultiPolinominal:
+            return NotImplemented
+
+        first, second = self._canonical(), other._canonical()
+        # a number is never compared with the terms of a polynomial
+        if (type(first) == tuple) != (type(second) == tuple):
+            return False
+        return first == second
+
+
+    def __hash__(self) -> int:
+        return hash(self._canonical())
+
+
+    def _operand(self, other, operation: str) -> Union[int, Fraction, "MultiPolinominal"]:
+        """ other as a scalar or a 'MultiPolinominal', raises TypeError for the unsupported types """
+
+        if type(other) in [int, Fraction, MultiPolinominal]:
+            return other
+        if type(other) == float:
+            return Fraction(other, 1)
+        if type(other) == Polinominal:
+            return MultiPolinominal.fromPolinominal(other)
+        raise TypeError(f"unsupported operand type(s) for {operation}: '{type(other).__name__}' and 'MultiPolinominal'")
+
+
+    def __add__(self, other: Union[int, float, Fraction, Polinominal, "MultiPolinominal"]) -> "MultiPolinominal":
+        """ 'MultiPolinominal' + other """
+
+        other = self._operand(other, "+")
+        return self._combine(other, 1)
+
+    __radd__ = __add__
+
+
+    def __sub__(self, other: Union[int, float, Fraction, Polinominal, "MultiPolinominal"]) -> "MultiPolinominal":
+        """ 'MultiPolinominal' - other """
+
+        other = self._operand(other, "-")
+        return self._combine(other, -1)
+
+
+    def __rsub__(self, other: Union[int, float, Fraction, Polinominal]) -> "MultiPolinominal":
+        """ other - 'MultiPolinominal' """
+
+        other = self._operand(other, "-")
+        return -self + other
+
+
+    def _combine(self, other: Union[int, Fraction, "MultiPolinominal"], sign: int) -> "MultiPolinominal":
+        """ self + sign * other """
+
+        if type(other) != MultiPolinominal:
+            other_terms, symbols = ({0: other} if other else {}), self.symbols
+        else:
+            other_terms, symbols = self._align(other)
+
+        terms = dict(self._terms)
+        for key, coefficient in other_terms.items():
+            coefficient = terms.get(key, 0) + sign * coefficient
+            if coefficient:
+                terms[key] = coefficient
+            else:
+                terms.pop(key, None)
+        return MultiPolinominal.fromPacked(terms, symbols)
+
+
+    def __neg__(self) -> "MultiPolinominal":
+        """ -'MultiPolinominal' """
+        return MultiPolinominal.fromPacked({key: -coefficient for key, coefficient in self._terms.items()}, self.symbols)
+
+
+    def __mul__(self, other: Union[int, float, Fraction, Polinominal, "MultiPolinominal"]) -> "MultiPolinominal":
+        """ 'MultiPolinominal' * other """
+
+        other = self._operand(other, "*")
+        if type(other) != MultiPolinominal:
+            if not other:
+                return MultiPolinominal.fromPacked({}, self.symbols)
+            return MultiPolinominal.fromPacked({key: coefficient * other for key, coefficient in self._terms.items()}, self.symbols)
+
+        other_terms, symbols = self._align(other)
+        return MultiPolinominal.fromPacked(termsMul(self._terms, other_terms, guardMask(len(symbols))), symbols)
+
+    __rmul__ = __mul__
+
+
+    def __truediv__(self, other: Union[int, float, Fraction]) -> "MultiPolinominal":
+        """ 'MultiPolinominal' / other, only the division by a number is supported """
+
+        if type(other) not in [int, float, Fraction]:
+            raise TypeError(f"unsupported operand type(s) for /: 'MultiPolinominal' and '{type(other).__name__}'")
+        if type(other) == float:
+            other = Fraction(other, 1)
+        if not other:
+            raise ZeroDivisionError("division by zero")
+
+        return self * (Fraction(1, other) if type(other) == int else Fraction(other.denominator, other.numerator))
+
+
+    def __pow__(self, other: int) -> "MultiPolinominal":
+        """ 'MultiPolinominal' ** other """
+
+        if type(other) != int:
+            raise TypeError(f"unsupported operand type(s) for **: 'MultiPolinominal' and '{type(other).__name__}'")
+        if other < 0:
+            raise TypeError(f"the degree of the number must not be lower than 0")
+
+        result = MultiPolinominal.fromPacked({0: 1}, self.symbols)
+        base = self
+        # square-and-multiply over the bits of the exponent
+        while other:
+            if other & 1:
+                result = result * base
+            other >>= 1
+            if other:
+                base = base * base
+        return result
+
+
+    def evaluate_polynomial(self, values: Dict[str, Union[int, float, Fraction]]) -> Union[int, float, Fraction]:
+        """ the value of the polynomial with the values of all its symbols given as a dict """
+
+        missing = [symbol for symbol in self.symbols if symbol not in values]
+        if missing:
+            raise ValueError(f"no values for the variables {', '.join(missing)}")
+
+        points = [values[symbol] for symbol in self.symbols]
+        # the powers of every variable are computed once for all terms
+        powers = [{} for _ in points]
+        value = 0
+        for key, coefficient in self._terms.items():
+            term = coefficient
+            for exponents, point, exponent in zip(powers, points, unpack(key, len(points))):
+                if exponent:
+                    if exponent not in exponents:
+                        exponents[exponent] = point ** exponent
+                    term = term * exponents[exponent]
+            value += term
+        return value
+
+
+    def __repr__(self) -> str:
+        count = len(self.symbols)
+        # the terms of a higher total degree go first, then the higher powers of the first symbols
+        exponents = {key: unpack(key, count) for key in self._terms}
+        keys = sorted(self._terms, key=lambda key: (sum(exponents[key]), exponents[key]), reverse=True)
+
+        string = []
+        for key in keys:
+            coefficient = self._terms[key]
+            if key == keys[0]:
+                s = "-" if coefficient < 0 else ""
+            else:
+                s = "- " if coefficient < 0 else "+ "
+
+            if abs(coefficient) != 1 or key == 0:
+                s += str(abs(coefficient))
+
+            for symbol, exponent in zip(self.symbols, exponents[key]):
+                if exponent == 1:
+                    s += symbol
+                elif exponent:
+                    s += f"{symbol}^{exponent}"
+            string.append(s)
+
+        if len(string) == 0:
+            return "0"
+
+        return " ".join(string)
+
+    __str__ = __repr__
@@ -1,10 +1,46 @@
 from cmath import exp, pi
-from math import ceil, log2
+from concurrent.futures import ProcessPoolExecutor
+from math import gcd as intGcd, isqrt, prod
+from os import cpu_count
+from random import randrange
+from typing import Callable, Iterable
+from .memo import memoize
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+# operands shorter than this are multiplied with the schoolbook algorithm
+KARATSUBA_THRESHOLD = 48
+# operands at least this long are multiplied with a transform when it gives the exact answer
+FFT_THRESHOLD = 1024 if numpy is None else 96
+# operands at least this long are multiplied with the number-theoretic transform
+NTT_THRESHOLD = 8192
+# divisions whose divisor and quotient are both at least this long use Newton iteration, None turns it off:
+# the exact reciprocal series of an integer divisor has growing coefficients and the classical loop is faster
+NEWTON_THRESHOLD = None
+# polynomials whose degrees are both at least this are reduced with the modular algorithm
+GCD_MODULAR_THRESHOLD = 24
+# forces polyMul to use "schoolbook", "karatsuba", "fft" or "ntt", None chooses by size
+MUL_ALGORITHM = None
+# batches shorter than this are computed by map_batch in the calling process
+BATCH_MIN_SIZE = 64
 
 
 def gcd(a, b):
     """ a function that finds the greatest common divisor of 'Polinominal' class """
     
+    if type(a) == int and type(b) == int:
+        if a == 0:
+            return b
+        elif b == 0:
+            return a
+        # the sign of b, as the Euclidean algorithm with Python's remainders gives it
+        common = intGcd(a, b)
+        return -common if b < 0 else common
+
     if type(a).__name__ not in ["int", "Polinominal"] or type(b).__name__ not in  ["int", "Polinominal"]:
         raise TypeError(f"can't calculate gcd of '{type(a)}' and '{type(b)}'")
     
@@ -13,13 +49,40 @@ def gcd(a, b):
     elif b == 0:
         return a
 
+    if type(a).__name__ == "Polinominal" or type(b).__name__ == "Polinominal":
+        if type(a) == int or type(b) == int:
+            # a non-zero constant is a unit among the polynomials with rational coefficients
+            return 1
+        return polinominalGcd(a, b)
+
     if type(a) == int:
         a = abs(a)
     elif type(b) == int:
         b = abs(b)
 
-    if type(a) == int and type(b).__name__ == "Polinominal":
-        a, b = b, a
+    while a % b:
+        a, b = b, a % b
+
+    return b
+
+
+def gcdKey(a, b) -> tuple:
+    return a._canonical(), b._canonical()
+
+
+@memoize("gcd", gcdKey)
+def polinominalGcd(a, b):
+    """ the greatest common divisor of two 'Polinominal', over the dense forms when they have no fractions """
+
+    if not (a.fraction or b.fraction):
+        first, second = a._asDense(force=True), b._asDense(force=True)
+        if first is not None and second is not None:
+            if not first[0]:
+                return b
+            if not second[0]:
+                return a
+            # the gcd may be one of the dense lists of the operands, the new polynomial must own its list
+            return type(a).fromDense(list(polyGcd(first[0], second[0])), symbol=a.symbol)
 
     while a % b:
         a, b = b, a % b
@@ -35,76 +98,755 @@ def scm(a: int, b: int) -> int:
     return a * b // gcd(a, b)
 
 
-def fft(x: list) -> list[complex]:
-    """ fast Fourier transform algorithm """
+_fft_twiddles: dict[int, list[complex]] = {}
+_numpy_twiddles: dict[int, tuple["numpy.ndarray", "numpy.ndarray"]] = {}
+_bit_reverse: dict[int, list[int]] = {}
+
+
+def twiddles(n: int) -> list[complex]:
+    """ cached table of exp(-2j * pi * k / n) for k < n / 2 """
+
+    if n not in _fft_twiddles:
+        _fft_twiddles[n] = [exp(-2j * pi * k / n) for k in range(n // 2)]
+    return _fft_twiddles[n]
+
+
+def bitReverse(n: int) -> list[int]:
+    """ cached bit-reversal permutation of the indices 0..n-1, n is a power of two """
+
+    if n not in _bit_reverse:
+        high_bit = n >> 1
+        permutation = [0] * n
+        for i in range(1, n):
+            permutation[i] = (permutation[i >> 1] >> 1) | (high_bit if i & 1 else 0)
+        _bit_reverse[n] = permutation
+    return _bit_reverse[n]
+
+
+def transform(x: list, inverse: bool=False) -> list[complex]:
+    """ iterative radix-2 Fourier transform, the input is padded with zeros to a power of two and is not changed """
+
+    n = 1 << max(0, (len(x) - 1).bit_length())
     if len(x) <= 1:
-        return x
-    
-    N = int(2 ** ceil(log2(len(x))))
-    x += [0] * (N - len(x))
-    
-    even = fft(x[0::2])
-    odd = fft(x[1::2])
+        return [complex(v) for v in x]
 
-    T = [exp(-2j * pi * k / N) * odd[k] for k in range(N // 2)]
+    if numpy is not None:
+        return numpyTransform(x, n, inverse).tolist()
 
-    return [even[k] + T[k] for k in range(N // 2)] + [even[k] - T[k] for k in range(N // 2)]
+    permutation = bitReverse(n)
+    a = [complex(x[i]) if i < len(x) else 0j for i in permutation]
+    table = twiddles(n)
+    if inverse:
+        table = [w.conjugate() for w in table]
 
+    half = 1
+    while half < n:
+        length = 2 * half
+        factors = table[::n // length]
+        for start in range(0, n, length):
+            low = a[start:start + half]
+            high = [v * w for v, w in zip(a[start + half:start + length], factors)]
+            a[start:start + half] = [u + v for u, v in zip(low, high)]
+            a[start + half:start + length] = [u - v for u, v in zip(low, high)]
+        half = length
 
-def ifft(x: list[complex]) -> list[complex]:
-    """ the algorithm of the inverse fast Fourier transform """
-    if len(x) == 1:
-        return x
-    
-    N = int(2 ** ceil(log2(len(x))))
-    x += [0] * (N - len(x))
-    
-    omega_N = exp(2j * pi / N)
+    if inverse:
+        a = [v / n for v in a]
+    return a
 
-    even = ifft(x[::2])
-    odd = ifft(x[1::2])
 
-    factor = omega(N)
+def numpyTransform(x, n: int, inverse: bool=False) -> "numpy.ndarray":
+    """ the same transform as `transform` over NumPy buffers, returns an array of length n """
 
-    factor = elemMul(factor, odd)
+    if n not in _numpy_twiddles:
+        _numpy_twiddles[n] = (numpy.array(twiddles(n), dtype=complex), numpy.array(bitReverse(n)))
+    table, permutation = _numpy_twiddles[n]
+    if inverse:
+        table = table.conj()
 
-    x = []
-    
-    for i in range(len(even)):
-        x.append((factor[i] + even[i]) / 2)
-    for i in range(len(even)):
-        x.append((even[i] - factor[i]) / 2)
-    
-    return x
+    buffer = numpy.zeros(n, dtype=complex)
+    buffer[:len(x)] = numpy.asarray(x, dtype=complex)
+    a = buffer[permutation]
+
+    half = 1
+    while half < n:
+        length = 2 * half
+        blocks = a.reshape(-1, length)
+        low = blocks[:, :half].copy()
+        high = blocks[:, half:] * table[::n // length]
+        blocks[:, :half] += high
+        blocks[:, half:] = low - high
+        half = length
+
+    if inverse:
+        a /= n
+    return a
+
+
+def fft(x: list) -> list[complex]:
+    """ fast Fourier transform algorithm """
+    return transform(x)
+
+
+def ifft(x: list[complex]) -> list[complex]:
+    """ the algorithm of the inverse fast Fourier transform """
+    return transform(x, inverse=True)
 
 
 def elemMul(a: list, b: list):
-    final = []
-    for i in range(len(a)):
-        final.append(a[i] * b[i])
-    return final
+    return [x * y for x, y in zip(a, b)]
 
 
 def omega(n: int):
-    final = []
-    for i in range(n//2):
-        final.append(exp(2j * pi / n) ** i)
-    
-    return final
+    return [w.conjugate() for w in twiddles(n)]
 
 
 def fftMul(poly1: list, poly2: list) -> list[complex]:
-    n = int(2 ** ceil(log2(len(poly1) + len(poly2))))
-    poly1 += [0] * (n - len(poly1))
-    poly2 += [0] * (n - len(poly2))
+    """ product of two coefficient lists with the fast Fourier transform, the lists are not changed """
+
+    n = 1 << (len(poly1) + len(poly2) - 1).bit_length()
+
+    if numpy is not None:
+        product = numpyTransform(poly1, n) * numpyTransform(poly2, n)
+        return numpyTransform(product, n, inverse=True).tolist()
+
+    fft_poly1 = transform(list(poly1) + [0] * (n - len(poly1)))
+    fft_poly2 = transform(list(poly2) + [0] * (n - len(poly2)))
+
+    return transform(elemMul(fft_poly1, fft_poly2), inverse=True)
+
+
+def schoolbookMul(a: list[int], b: list[int]) -> list[int]:
+    """ product of two coefficient lists with the O(n*m) algorithm """
 
-    fft_poly1 = fft(poly1)
-    fft_poly2 = fft(poly2)
+    if not a or not b:
+        return []
 
+    result = [0] * (len(a) + len(b) - 1)
+    for i, x in enumerate(a):
+        if x:
+            for j, y in enumerate(b, i):
+                result[j] += x * y
+
+    return result
+
+
+def karatsubaMul(a: list[int], b: list[int]) -> list[int]:
+    """ product of two coefficient lists with the Karatsuba algorithm """
+
+    if len(a) < len(b):
+        a, b = b, a
+    if len(b) < KARATSUBA_THRESHOLD:
+        return schoolbookMul(a, b)
+
+    result = [0] * (len(a) + len(b) - 1)
+
+    if len(a) >= 2 * len(b):
+        for start in range(0, len(a), len(b)):
+            for i, c in enumerate(karatsubaMul(a[start:start + len(b)], b), start):
+                result[i] += c
+        return result
+
+    m = len(a) // 2
+    a0, a1 = a[:m], a[m:]
+    b0, b1 = b[:m], b[m:]
+
+    low = karatsubaMul(a0, b0)
+    high = karatsubaMul(a1, b1)
+    mid = karatsubaMul(elemAdd(a0, a1), elemAdd(b0, b1))
+
+    for i, c in enumerate(low):
+        result[i] += c
+        result[i + m] -= c
+    for i, c in enumerate(high):
+        result[i + 2 * m] += c
+        result[i + m] -= c
+    for i, c in enumerate(mid):
+        result[i + m] += c
+
+    return result
 
-    fft_result = elemMul(fft_poly1, fft_poly2)
 
-    result = ifft(fft_result)
+def elemAdd(a: list, b: list) -> list:
+    if len(a) < len(b):
+        a, b = b, a
+    return [x + y for x, y in zip(a, b)] + a[len(b):]
+
+
+def exactFftMul(a: list[int], b: list[int]) -> list[int] | None:
+    """ product of two integer coefficient lists with the floating point FFT, None if rounding can not be trusted """
+
+    if not a or not b:
+        return []
+
+    n = len(a) + len(b) - 1
+    size = 1 << (n - 1).bit_length()
+    bound = max(map(abs, a)) * max(map(abs, b)) * min(len(a), len(b))
+
+    # rounding error of the complex transform grows like size * log2(size) * 2^-53 relative
+    # to the largest coefficient, it has to stay well below 1/2 to round to the exact integer
+    if bound * max(1, size.bit_length()) * 16 >= 2 ** 52:
+        return None
+
+    product = fftMul(a, b)
+    result = [round(c.real) for c in product[:n]]
+
+    # cheap check of the rounded product at a random point modulo a prime
+    prime = 2 ** 61 - 1
+    point = randrange(2, prime)
+    if evaluateMod(a, point, prime) * evaluateMod(b, point, prime) % prime != evaluateMod(result, point, prime):
+        return None
 
     return result
 
+
+def evaluateMod(coefficients: list[int], point: int, modulus: int) -> int:
+    """ value of the polynomial at the point modulo the modulus """
+
+    value = 0
+    for c in reversed(coefficients):
+        value = (value * point + c) % modulus
+    return value
+
+
+def isPrime(n: int) -> bool:
+    """ deterministic Miller-Rabin test for numbers below 3.3 * 10^24 """
+
+    small_primes = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+    if n < 2:
+        return False
+    for p in small_primes:
+        if n % p == 0:
+            return n == p
+
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+
+    for a in small_primes:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+
+    return True
+
+
+def primitiveRoot(prime: int) -> int:
+    """ the smallest generator of the multiplicative group modulo the prime """
+
+    factors = []
+    rest = prime - 1
+    divisor = 2
+    while divisor * divisor <= rest:
+        if rest % divisor == 0:
+            factors.append(divisor)
+            while rest % divisor == 0:
+                rest //= divisor
+        divisor += 1
+    if rest > 1:
+        factors.append(rest)
+
+    root = 2
+    while any(pow(root, (prime - 1) // q, prime) == 1 for q in factors):
+        root += 1
+    return root
+
+
+_ntt_primes: dict[int, list[tuple[int, int]]] = {}
+
+
+def nttPrimes(size: int, count: int) -> list[tuple[int, int]]:
+    """ `count` pairs of a prime p = c * 2^k + 1 with size dividing 2^k and its primitive root, word-sized primes first """
+
+    k = max(20, (size - 1).bit_length())
+    primes = _ntt_primes.setdefault(k, [])
+    step = 1 << k
+
+    for limit in (2 ** 31, 2 ** 62):
+        candidate = primes[-1][0] - step if primes and primes[-1][0] < limit else (limit - 1) // step * step + 1
+        while len(primes) < count and candidate > step:
+            if isPrime(candidate):
+                primes.append((candidate, primitiveRoot(candidate)))
+            candidate -= step
+
+    if len(primes) < count:
+        raise ValueError(f"not enough primes for a transform of size {size}")
+    return primes[:count]
+
+
+_ntt_twiddles: dict[tuple[int, int, bool], list[list[int]]] = {}
+
+
+def ntt(a: list[int], prime: int, root: int, invert: bool=False) -> list[int]:
+    """ iterative number-theoretic transform modulo the prime, the length of `a` must be a power of two """
+
+    n = len(a)
+    a = [x % prime for x in a]
+
+    j = 0
+    for i in range(1, n):
+        bit = n >> 1
+        while j & bit:
+            j ^= bit
+            bit >>= 1
+        j |= bit
+        if i < j:
+            a[i], a[j] = a[j], a[i]
+
+    key = (prime, n, invert)
+    if key not in _ntt_twiddles:
+        stages = []
+        length = 2
+        while length <= n:
+            w = pow(root, (prime - 1) // length, prime)
+            if invert:
+                w = pow(w, prime - 2, prime)
+            twiddles = [1] * (length // 2)
+            for k in range(1, length // 2):
+                twiddles[k] = twiddles[k - 1] * w % prime
+            stages.append(twiddles)
+            length <<= 1
+        _ntt_twiddles[key] = stages
+
+    half = 1
+    for twiddles in _ntt_twiddles[key]:
+        length = 2 * half
+        for start in range(0, n, length):
+            low = a[start:start + half]
+            high = [x * w % prime for x, w in zip(a[start + half:start + length], twiddles)]
+            a[start:start + half] = [(x + y) % prime for x, y in zip(low, high)]
+            a[start + half:start + length] = [(x - y) % prime for x, y in zip(low, high)]
+        half = length
+
+    if invert:
+        n_inverse = pow(n, prime - 2, prime)
+        a = [x * n_inverse % prime for x in a]
+
+    return a
+
+
+def nttMul(a: list[int], b: list[int]) -> list[int]:
+    """ exact product of two integer coefficient lists with transforms over several primes and the Chinese remainder theorem """
+
+    if not a or not b:
+        return []
+
+    n = len(a) + len(b) - 1
+    size = 1 << (n - 1).bit_length()
+    # the product of the primes has to cover both signs of the largest possible coefficient
+    bound = 2 * max(map(abs, a)) * max(map(abs, b)) * min(len(a), len(b)) + 1
+
+    count = bound.bit_length() // 30 + 1
+    while True:
+        primes = nttPrimes(size, count)
+        modulus = prod(prime for prime, _ in primes)
+        if modulus > bound:
+            break
+        count += 1
+
+    residues = []
+    for prime, root in primes:
+        fa = ntt(a + [0] * (size - len(a)), prime, root)
+        fb = ntt(b + [0] * (size - len(b)), prime, root)
+        residues.append(ntt([x * y % prime for x, y in zip(fa, fb)], prime, root, invert=True)[:n])
+
+    if len(primes) == 1:
+        prime = primes[0][0]
+        return [r - prime if r > prime // 2 else r for r in residues[0]]
+
+    factors = []
+    for prime, _ in primes:
+        rest = modulus // prime
+        factors.append(rest * pow(rest % prime, prime - 2, prime))
+
+    result = []
+    half = modulus // 2
+    for values in zip(*residues):
+        c = sum(r * f for r, f in zip(values, factors)) % modulus
+        result.append(c - modulus if c > half else c)
+
+    return result
+
+
+def polyMul(a: list[int], b: list[int], algorithm: str | None=None) -> list[int]:
+    """
+    product of two integer coefficient lists, the algorithm is chosen by the size of the operands and their coefficients
+
+    `algorithm` (or the module level `MUL_ALGORITHM`) can force "schoolbook", "karatsuba", "fft" or "ntt"
+    """
+
+    algorithm = algorithm or MUL_ALGORITHM
+    length = min(len(a), len(b))
+
+    if algorithm is None:
+        if length < KARATSUBA_THRESHOLD:
+            return schoolbookMul(a, b)
+        if length >= FFT_THRESHOLD:
+            result = exactFftMul(a, b)
+            if result is not None:
+                return result
+        if length >= NTT_THRESHOLD:
+            return nttMul(a, b)
+        return karatsubaMul(a, b)
+    
+    if algorithm == "schoolbook":
+        return schoolbookMul(a, b)
+    elif algorithm == "karatsuba":
+        return karatsubaMul(a, b)
+    elif algorithm == "fft":
+        result = exactFftMul(a, b)
+        # the floating point transform can not give the exact product of these operands
+        return nttMul(a, b) if result is None else result
+    elif algorithm == "ntt":
+        return nttMul(a, b)
+
+    raise ValueError(f"unknown multiplication algorithm '{algorithm}'")
+
+
+def polyPow(a: list[int], exponent: int) -> list[int]:
+    """ power of an integer coefficient list by squaring and multiplying """
+
+    result = [1]
+    while exponent:
+        if exponent & 1:
+            result = polyMul(result, a)
+        exponent >>= 1
+        if exponent:
+            a = polyMul(a, a)
+    return result
+
+
+def seriesInverse(f: list[int], n: int) -> tuple[list[int], int]:
+    """ integer numerators h and a denominator d with f * h = d mod x^n, found with Newton iteration """
+
+    h, denominator = [1], f[0]
+    length = 1
+    while length < n:
+        length = min(2 * length, n)
+        # h / d * (2 - f * h / d) doubles the number of correct terms
+        error = [-c for c in polyMul(f[:length], h)[:length]]
+        error[0] += 2 * denominator
+        h = polyMul(h, error)[:length]
+        denominator *= denominator
+
+        common = denominator
+        for c in h:
+            if common == 1:
+                break
+            common = intGcd(common, c)
+        if common != 1:
+            h = [c // common for c in h]
+            denominator //= common
+
+    return h, denominator
+
+
+def classicalDivmod(a: list[int], b: list[int]) -> tuple[list[int], list[int], int]:
+    """ division with remainder in place, the divisor's leading coefficient is cleared with the smallest multipliers """
+
+    n = len(b) - 1
+    lead = b[-1]
+    r = list(a)
+    q = [0] * (len(a) - n)
+    scales = [1] * len(q)
+    scale = 1
+
+    for k in range(len(a) - len(b), -1, -1):
+        c = r[n + k]
+        if not c:
+            scales[k] = scale
+            continue
+
+        multiplier = abs(lead) // intGcd(c, lead)
+        if multiplier != 1:
+            r[:n + k] = [x * multiplier for x in r[:n + k]]
+            scale *= multiplier
+        t = c * multiplier // lead
+
+        q[k], scales[k] = t, scale
+        r[n + k] = 0
+        r[k:n + k] = [x - t * y for x, y in zip(r[k:n + k], b)]
+
+    q = [t * (scale // s) for t, s in zip(q, scales)]
+    return q, r[:n], scale
+
+
+def newtonDivmod(a: list[int], b: list[int]) -> tuple[list[int], list[int], int]:
+    """ division with remainder through the reciprocal of the reversed divisor """
+
+    n = len(b) - 1
+    k = len(a) - n
+
+    inverse, denominator = seriesInverse(b[::-1], k)
+    q = polyMul(a[::-1][:k], inverse)[:k]
+    q = q[::-1]
+    q = [0] * (k - len(q)) + q
+
+    qb = polyMul(q, b)
+    r = [x * denominator - y for x, y in zip(a[:n], qb)]
+    return q, r, denominator
+
+
+def polyDivmod(a: list[int], b: list[int]) -> tuple[list[int], list[int], int]:
+    """
+    division with remainder of integer coefficient lists, the result (q, r, scale) means a * scale = q * b + r
+
+    the divisor must not end with zero, divisions longer than NEWTON_THRESHOLD use Newton iteration
+    """
+
+    if not b:
+        raise ZeroDivisionError("polynomial division by zero")
+    if len(a) < len(b):
+        return [], list(a), 1
+    if NEWTON_THRESHOLD is not None and min(len(b), len(a) - len(b) + 1) >= NEWTON_THRESHOLD:
+        return newtonDivmod(a, b)
+    return classicalDivmod(a, b)
+
+
+def primitivePart(a: list[int]) -> list[int]:
+    """ the coefficient list divided by the positive gcd of its coefficients """
+
+    content = 0
+    for c in a:
+        content = intGcd(content, c)
+        if content == 1:
+            return a
+    return [c // content for c in a] if content else a
+
+
+def trim(a: list[int]) -> list[int]:
+    """ removes the zero coefficients of the highest degrees in place """
+
+    while a and not a[-1]:
+        a.pop()
+    return a
+
+
+def prsGcd(a: list[int], b: list[int]) -> list[int]:
+    """
+    gcd of two integer coefficient lists by the primitive polynomial remainder sequence,
+    the sign of the result is the sign of the last remainder of the Euclidean algorithm over the rationals
+    """
+
+    if len(a) < len(b):
+        a, b = b, a
+
+    # the remainders only differ from the Euclidean ones by positive factors
+    a, b = primitivePart(a), primitivePart(b)
+    while True:
+        remainder = trim(classicalDivmod(a, b)[1])
+        if not remainder:
+            return b
+        a, b = b, primitivePart(remainder)
+
+
+_gcd_primes: list[int] = []
+
+
+def gcdPrimes():
+    """ an endless sequence of word-sized primes, the found ones are cached """
+
+    for prime in _gcd_primes:
+        yield prime
+    candidate = _gcd_primes[-1] - 2 if _gcd_primes else 2 ** 31 - 1
+    while True:
+        if isPrime(candidate):
+            _gcd_primes.append(candidate)
+            yield candidate
+        candidate -= 2
+
+
+def gcdMod(a: list[int], b: list[int], prime: int) -> list[int]:
+    """ monic gcd of two coefficient lists modulo the prime """
+
+    a = trim([c % prime for c in a])
+    b = trim([c % prime for c in b])
+
+    while b:
+        inverse = pow(b[-1], prime - 2, prime)
+        shift = len(b) - 1
+        for k in range(len(a) - len(b), -1, -1):
+            c = a[k + shift] * inverse % prime
+            if c:
+                a[k:k + shift + 1] = [(x - c * y) % prime for x, y in zip(a[k:k + shift + 1], b)]
+        a, b = b, trim(a[:shift])
+
+    inverse = pow(a[-1], prime - 2, prime)
+    return [c * inverse % prime for c in a]
+
+
+def rationalReconstruction(u: int, modulus: int) -> tuple[int, int] | None:
+    """ the fraction n / d with |n|, d below sqrt(modulus / 2) and n = u * d modulo the modulus, None if there is none """
+
+    bound = isqrt(modulus // 2)
+    r0, r1 = modulus, u % modulus
+    t0, t1 = 0, 1
+    while r1 > bound:
+        q = r0 // r1
+        r0, r1 = r1, r0 - q * r1
+        t0, t1 = t1, t0 - q * t1
+
+    if t1 == 0 or abs(t1) > bound or intGcd(r1, t1) != 1:
+        return None
+    return (r1, t1) if t1 > 0 else (-r1, -t1)
+
+
+def modularGcd(a: list[int], b: list[int]) -> list[int]:
+    """
+    gcd of two integer coefficient lists from monic gcds modulo several primes, combined with
+    the Chinese remainder theorem and rational reconstruction, the result has a positive leading coefficient
+    """
+
+    a, b = primitivePart(a), primitivePart(b)
+    leading = a[-1] * b[-1]
+
+    images = None
+    modulus = 1
+    candidate = None
+
+    for prime in gcdPrimes():
+        if leading % prime == 0:
+            continue
+
+        image = gcdMod(a, b, prime)
+        if len(image) == 1:
+            return [1]
+
+        if images is None or len(image) < len(images):
+            # every earlier prime was unlucky
+            images, modulus, candidate = image, prime, None
+        elif len(image) > len(images):
+            continue
+        else:
+            inverse = pow(modulus % prime, prime - 2, prime)
+            images = [x + modulus * ((y - x) * inverse % prime) for x, y in zip(images, image)]
+            modulus *= prime
+
+        fractions = [rationalReconstruction(c, modulus) for c in images]
+        if None in fractions:
+            continue
+        denominator = 1
+        for _, d in fractions:
+            denominator = denominator // intGcd(denominator, d) * d
+        result = primitivePart([n * (denominator // d) for n, d in fractions])
+
+        if result == candidate and not trim(classicalDivmod(a, result)[1]) and not trim(classicalDivmod(b, result)[1]):
+            return result
+        candidate = result
+
+
+def polyGcd(a: list[int], b: list[int]) -> list[int]:
+    """ gcd of two non-zero integer coefficient lists, small ones use the remainder sequence and large ones the modular algorithm """
+
+    if min(len(a), len(b)) >= GCD_MODULAR_THRESHOLD:
+        return modularGcd(a, b)
+    return prsGcd(a, b)
+
+
+def packValue(value):
+    """ a compact picklable form of a number, a 'Fraction', a 'Polinominal' or a tuple of them: tuples of ints and strings """
+
+    kind = type(value).__name__
+    if kind in ["int", "float", "complex", "bool", "NoneType"]:
+        return value
+    if kind == "tuple":
+        return ("T",) + tuple(packValue(item) for item in value)
+    if kind == "Fraction":
+        if type(value.numerator) == int and type(value.denominator) == int:
+            return ("f", value.numerator, value.denominator)
+        return ("F", packValue(value.numerator), packValue(value.denominator))
+    if kind == "Polinominal":
+        dense = value._asDense()
+        if dense is not None:
+            return ("p", value.symbol, tuple(dense[0]), dense[1], packValue(value.fraction))
+        terms = tuple((degree, packValue(coefficient)) for degree, coefficient in value._view().items() if coefficient)
+        return ("t", value.symbol, terms, packValue(value.fraction))
+    raise TypeError(f"can't pack '{kind}' for a batch")
+
+
+def unpackValue(value):
+    """ the value of a form made by `packValue` """
+
+    if type(value) != tuple:
+        return value
+
+    from .fraction import Fraction
+    from .polynomial import Polinominal
+
+    tag = value[0]
+    if tag == "T":
+        return tuple(unpackValue(item) for item in value[1:])
+    if tag in ["f", "F"]:
+        # the parts are already reduced
+        fraction = object.__new__(Fraction)
+        fraction.numerator, fraction.denominator = unpackValue(value[1]), unpackValue(value[2])
+        return fraction
+    if tag == "p":
+        return Polinominal.fromDense(list(value[2]), value[3], fraction=unpackValue(value[4]), symbol=value[1])
+    if tag == "t":
+        poli = Polinominal({}, symbol=value[1], fraction=unpackValue(value[3]))
+        poli._terms.update((degree, unpackValue(coefficient)) for degree, coefficient in value[2])
+        return poli
+    raise ValueError(f"unknown packed value {tag!r}")
+
+
+def evaluate(poli, point):
+    """ the value of a polynomial (or a number) at the point """
+    return poli.evaluate_polynomial(point) if type(poli).__name__ == "Polinominal" else poli
+
+
+BATCH_OPERATIONS: dict[str, Callable] = {
+    "+": lambda a, b: a + b,
+    "-": lambda a, b: a - b,
+    "*": lambda a, b: a * b,
+    "/": lambda a, b: a / b,
+    "%": lambda a, b: a % b,
+    "**": lambda a, b: a ** b,
+    "divmod": divmod,
+    "gcd": gcd,
+    "evaluate": evaluate,
+}
+
+
+def batchChunk(operation: str | Callable, chunk: tuple) -> tuple:
+    """ runs the operation on a chunk of packed pairs in a worker process, the results are packed """
+
+    function = BATCH_OPERATIONS[operation] if type(operation) == str else operation
+    return tuple(packValue(function(unpackValue(a), unpackValue(b))) for a, b in chunk)
+
+
+def map_batch(operation: str | Callable, pairs: Iterable[tuple], workers: int | None=None, chunksize: int | None=None) -> list:
+    """
+    the results of a binary operation on every pair, computed in a pool of `workers` processes (all cores by default)
+
+    `operation` is one of "+", "-", "*", "/", "%", "**", "divmod", "gcd", "evaluate" (a polynomial and a point)
+    or a function of two arguments defined at the top level of a module, so it can be pickled;
+    the pairs are sent in chunks of `chunksize` in a compact packed form and the results come back in their order
+    """
+
+    if type(operation) == str and operation not in BATCH_OPERATIONS:
+        raise ValueError(f"unknown batch operation '{operation}', use one of {', '.join(BATCH_OPERATIONS)} or a function")
+
+    pairs = list(pairs)
+    workers = workers or cpu_count() or 1
+    if workers == 1 or len(pairs) < BATCH_MIN_SIZE:
+        function = BATCH_OPERATIONS[operation] if type(operation) == str else operation
+        return [function(a, b) for a, b in pairs]
+
+    # a few chunks for every worker keep them busy when the pairs take different time
+    chunksize = chunksize or max(1, -(-len(pairs) // (4 * workers)))
+    chunks = [tuple((packValue(a), packValue(b)) for a, b in pairs[start:start + chunksize])
+              for start in range(0, len(pairs), chunksize)]
+
+    results = []
+    with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as executor:
+        for chunk in executor.map(batchChunk, [operation] * len(chunks), chunks):
+            results += [unpackValue(value) for value in chunk]
+    return results
@@ -1,5 +1,359 @@
-from typing import Dict, Union
+from array import array
+from math import gcd as intGcd
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 from .fraction import Fraction
+from .memo import memoize
+from .operations import gcd, polyDivmod, polyMul, polyPow, scm
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+# a polynomial whose share of non-zero terms is at least DENSE_FILL is kept as a list
+# of integer numerators indexed by degree with one shared denominator (None disables it)
+DENSE_FILL = 0.5
+# polynomials of a lower degree are always kept dense
+DENSE_MIN_DEGREE = 16
+# how many recently computed powers every polynomial keeps for later `**` calls, 0 disables the cache
+POWER_CACHE_SIZE = 8
+# `Polinominal.write_to` passes the text to the file in pieces of at least this many characters
+WRITE_CHUNK = 1 << 16
+
+
+def normalizeDense(numerators: List[int], denominator: int) -> Tuple[List[int], int]:
+    """ removes leading zero terms and cancels the common factor of the numerators and the denominator """
+
+    while numerators and not numerators[-1]:
+        numerators.pop()
+
+    common = denominator
+    for numerator in numerators:
+        if common == 1:
+            break
+        common = intGcd(common, numerator)
+    if denominator < 0:
+        common = -common
+
+    if common != 1:
+        numerators = [numerator // common for numerator in numerators]
+        denominator //= common
+
+    return numerators, denominator
+
+
+def termsToDense(coefficients: Dict[int, Union[int, Fraction]], force: bool=False) -> Optional[Tuple[List[int], int]]:
+    """
+    converts a dict of coefficients to numerators indexed by degree and a shared denominator,
+    returns None for sparse polynomials unless `force` is set and for coefficients that are not rational
+    """
+
+    if DENSE_FILL is None and not force:
+        return None
+
+    denominator = 1
+    terms = 0
+    top = 0
+
+    for degree, coefficient in coefficients.items():
+        if type(degree) != int or degree < 0:
+            return None
+        if type(coefficient) == Fraction:
+            if type(coefficient.numerator) != int or type(coefficient.denominator) != int:
+                return None
+            denominator = denominator // intGcd(denominator, coefficient.denominator) * abs(coefficient.denominator)
+        elif type(coefficient) != int:
+            return None
+        elif coefficient == 0:
+            continue
+        terms += 1
+        top = max(top, degree)
+
+    if not force and top >= DENSE_MIN_DEGREE and terms < DENSE_FILL * (top + 1):
+        return None
+
+    numerators = [0] * (top + 1)
+    for degree, coefficient in coefficients.items():
+        if type(coefficient) == Fraction:
+            numerators[degree] = coefficient.numerator * (denominator // coefficient.denominator)
+        elif coefficient:
+            numerators[degree] = coefficient * denominator
+
+    return normalizeDense(numerators, denominator)
+
+
+def denseToTerms(numerators: List[int], denominator: int) -> Dict[int, Union[int, Fraction]]:
+    """ converts numerators indexed by degree and a shared denominator back to a dict of coefficients """
+
+    terms = {0: Fraction(numerators[0], denominator) if numerators else 0}
+    for degree in range(1, len(numerators)):
+        if numerators[degree]:
+            terms[degree] = Fraction(numerators[degree], denominator)
+
+    return terms
+
+
+def addDense(first: Tuple[List[int], int], second: Tuple[List[int], int], sign: int=1) -> Tuple[List[int], int]:
+    """ adds (or subtracts when sign is -1) two dense polynomials """
+
+    (first_numer, first_denom), (second_numer, second_denom) = first, second
+    denominator = first_denom // intGcd(first_denom, second_denom) * second_denom
+    first_factor = denominator // first_denom
+    second_factor = sign * (denominator // second_denom)
+
+    numerators = [numerator * first_factor for numerator in first_numer]
+    numerators += [0] * (len(second_numer) - len(numerators))
+    for degree, numerator in enumerate(second_numer):
+        numerators[degree] += numerator * second_factor
+
+    return numerators, denominator
+
+
+def addDenseInPlace(first: Tuple[List[int], int], second: Tuple[List[int], int], sign: int=1) -> Tuple[List[int], int]:
+    """
+    adds (or subtracts when sign is -1) the second dense polynomial to the numerators of the first, which are changed in place
+    and must belong to the caller, never to a polynomial
+    """
+
+    (numerators, first_denom), (second_numer, second_denom) = first, second
+    denominator = first_denom // intGcd(first_denom, second_denom) * second_denom
+    if denominator != first_denom:
+        factor = denominator // first_denom
+        numerators[:] = [numerator * factor for numerator in numerators]
+    factor = sign * (denominator // second_denom)
+
+    if len(second_numer) > len(numerators):
+        numerators.extend([0] * (len(second_numer) - len(numerators)))
+    for degree, numerator in enumerate(second_numer):
+        if numerator:
+            numerators[degree] += numerator * factor
+
+    return normalizeDense(numerators, denominator)
+
+
+def addTerm(terms: Dict[int, Union[int, float, Fraction]], degree: int, coefficient: Union[int, float, Fraction]) -> None:
+    """ adds the coefficient to the term of the degree in place, the terms stay as `Polinominal.__init__` makes them """
+
+    value = terms.get(degree, 0) + coefficient
+    if value == 0:
+        if degree:
+            terms.pop(degree, None)
+        else:
+            terms[0] = 0
+    elif type(value) in [int, float]:
+        terms[degree] = Fraction(int(value), 1) if int(value) == value else Fraction(value, 1)
+    else:
+        terms[degree] = value
+
+
+def linearCombination(pairs: Iterable[Tuple[Union[int, float, Fraction, "Polinominal"], Union[int, float, Fraction, "Polinominal"]]]) -> "Polinominal":
+    """
+    the sum of weight * operand over the pairs in one pass: the dense polynomials are added into one list of numerators
+    for every denominator, the fraction parts are grouped by their denominators and put over one common denominator at the end
+    """
+
+    symbol = None
+    # the numerators of the dense operands by their denominator
+    buckets: Dict[int, List[int]] = {}
+    terms: Dict[int, Union[int, Fraction]] = {0: 0}
+    # the denominator and the sum of the numerators of the fraction parts by the key of the denominator
+    fractions: Dict[object, list] = {}
+    # the operands of other variables and types are added the ordinary way
+    others = []
+
+    def addDenseOperand(numerators: List[int], denominator: int, weight: Tuple[int, int]) -> None:
+        denominator *= weight[1]
+        if denominator not in buckets:
+            buckets[denominator] = [numerator * weight[0] for numerator in numerators]
+        else:
+            addDenseInPlace((buckets[denominator], 1), (numerators, 1), weight[0])
+
+    def addOperand(operand: Union[int, float, Fraction, "Polinominal"], weight: Union[int, Fraction], rational: Tuple[int, int]) -> None:
+        nonlocal symbol
+        if type(operand) == float:
+            operand = Fraction(operand, 1)
+
+        if type(operand) == int:
+            addDenseOperand([operand], 1, rational)
+        elif type(operand) == Fraction:
+            if type(operand.numerator) == int and type(operand.denominator) == int:
+                addDenseOperand([operand.numerator], operand.denominator, rational)
+                return
+            key = valueKey(operand.denominator)
+            if key not in fractions:
+                fractions[key] = [operand.denominator, 0]
+            fractions[key][1] = fractions[key][1] + operand.numerator * weight
+        elif type(operand) == Polinominal:
+            if not operand._isConstant():
+                if symbol is None:
+                    symbol = operand.symbol
+                elif operand.symbol != symbol:
+                    others.append(operand * weight)
+                    return
+            dense = operand._asDense()
+            if dense is not None:
+                addDenseOperand(*dense, rational)
+            else:
+                for degree, coefficient in operand._view().items():
+                    if coefficient:
+                        addTerm(terms, degree, coefficient * weight)
+            # the fraction part may be a number or a polynomial with a fraction part of its own, 1/3 + 1/(x + 2)
+            if operand.fraction:
+                addOperand(operand.fraction, weight, rational)
+        elif type(operand).__name__ in _deferred_types:
+            others.append(operand * weight)
+        else:
+            raise TypeError(f"unsupported operand type(s) for +: 'Polinominal' and '{type(operand).__name__}'")
+
+    for weight, operand in pairs:
+        if type(weight) == int or (type(weight) == Fraction and type(weight.numerator) == int and type(weight.denominator) == int):
+            rational = (weight, 1) if type(weight) == int else (weight.numerator, weight.denominator)
+        else:
+            # a polynomial (or a float) weight: the product is added
+            operand, weight, rational = weight * operand, 1, (1, 1)
+        addOperand(operand, weight, rational)
+
+    symbol = symbol or "x"
+    numerators, denominator = [], 1
+    for bucket_denominator, bucket in buckets.items():
+        numerators, denominator = addDenseInPlace((numerators, denominator), (bucket, bucket_denominator))
+    result = Polinominal.fromDense(numerators, denominator, symbol=symbol)
+    if len(terms) > 1 or terms[0]:
+        result += Polinominal(terms, symbol=symbol)
+
+    if fractions:
+        common = None
+        for fraction_denominator, _ in fractions.values():
+            common = fraction_denominator if common is None else common * (fraction_denominator / gcd(common, fraction_denominator))
+        numerator = 0
+        for fraction_denominator, fraction_numerator in fractions.values():
+            numerator = numerator + (fraction_numerator if fraction_denominator is common else fraction_numerator * (common / fraction_denominator))
+        if numerator != 0:
+            result += numerator / common
+
+    for other in others:
+        result = result + other
+    return result
+
+
+def mulDense(first: Tuple[List[int], int], second: Tuple[List[int], int]) -> Tuple[List[int], int]:
+    """ multiplies two dense polynomials """
+
+    (first_numer, first_denom), (second_numer, second_denom) = first, second
+    return polyMul(first_numer, second_numer), first_denom * second_denom
+
+
+def binomialPower(first: int, first_degree: int, second: int, second_degree: int, exponent: int) -> Dict[int, int]:
+    """ the terms of (first * x^first_degree + second * x^second_degree) ** exponent """
+
+    first_powers = [1]
+    for _ in range(exponent):
+        first_powers.append(first_powers[-1] * first)
+
+    terms = {}
+    binomial = 1
+    second_power = 1
+    for k in range(exponent, -1, -1):
+        degree = first_degree * k + second_degree * (exponent - k)
+        terms[degree] = terms.get(degree, 0) + binomial * first_powers[k] * second_power
+        binomial = binomial * k // (exponent - k + 1)
+        second_power *= second
+    return terms
+
+
+def floatCoefficients(poli: Union["Polinominal", int, Fraction]) -> List[float]:
+    """ float coefficients of a polynomial (or a constant) indexed by degree """
+
+    if type(poli) != Polinominal:
+        return [float(poli)]
+
+    dense = poli._asDense(force=True)
+    if dense is not None:
+        return [numerator / dense[1] for numerator in dense[0]] or [0.0]
+
+    terms = poli._view()
+    coefficients = [0.0] * (max(terms) + 1)
+    for degree, coefficient in terms.items():
+        coefficients[degree] = float(coefficient)
+    return coefficients
+
+
+def hornerFloat(lists: List[List[float]], points) -> list:
+    """ the values of several coefficient lists at the same points (a number or a NumPy array), computed in one pass """
+
+    values = [None] * len(lists)
+    for degree in range(max(map(len, lists)) - 1, -1, -1):
+        for i, coefficients in enumerate(lists):
+            if degree < len(coefficients):
+                values[i] = coefficients[degree] + (0 if values[i] is None else values[i] * points)
+    return values
+
+
+def reprParts(value: Union[int, Fraction, "Polinominal"]) -> Iterator[str]:
+    """ the text of `repr` of a value in pieces, a polynomial gives a piece for every term """
+
+    if type(value) == Polinominal:
+        return value._reprParts()
+    return iter([repr(value)])
+
+
+def repeatChunks(char: str, count: int) -> Iterator[str]:
+    """ the character repeated `count` times in pieces of at most WRITE_CHUNK characters """
+
+    while count > 0:
+        yield char * min(count, WRITE_CHUNK)
+        count -= WRITE_CHUNK
+
+
+def writeChunks(fp, parts: Iterable[str]) -> int:
+    """ writes the pieces to the file joined into chunks of about WRITE_CHUNK characters, returns the number of characters """
+
+    written = 0
+    buffer = []
+    size = 0
+    for part in parts:
+        buffer.append(part)
+        size += len(part)
+        if size >= WRITE_CHUNK:
+            fp.write("".join(buffer))
+            written += size
+            buffer = []
+            size = 0
+    if buffer:
+        fp.write("".join(buffer))
+        written += size
+    return written
+
+
+def rationalKey(numerator: int, denominator: int) -> Union[int, Tuple[int, int]]:
+    """ the reduced numerator and positive denominator of a rational number, an integer is just the numerator """
+
+    common = intGcd(numerator, denominator)
+    if denominator < 0:
+        common = -common
+    return numerator // common if denominator == common else (numerator // common, denominator // common)
+
+
+def valueKey(value: Union[int, float, Fraction, "Polinominal"]) -> object:
+    """ a hashable key of a coefficient or a fraction part, equal values have equal keys """
+
+    if type(value) == Fraction:
+        if type(value.numerator) == int and type(value.denominator) == int:
+            return rationalKey(value.numerator, value.denominator)
+        return valueKey(value.numerator), valueKey(value.denominator)
+    if type(value) == Polinominal:
+        return value._canonical()
+    return value
+
+
+def powKey(poli: "Polinominal", exponent: int) -> Optional[tuple]:
+    return (poli._canonical(), exponent) if type(exponent) == int else None
+
+
+def divmodKey(poli: "Polinominal", other: Union[int, float, "Polinominal", Fraction]) -> Optional[tuple]:
+    return (poli._canonical(), other._canonical()) if type(other) == Polinominal else None
 
 
 class Variable():
@@ -26,14 +380,47 @@ class Polinominal():
     A class for representing a polynomial as a separate terms of different degrees and the correct fraction.
 
     To make mathematical expression use `Variable` class.
+
+    Equal polynomials compare equal and have the same hash however they were built, a rational fraction part
+    counts as a part of the constant term.
+
+    >>> x = Variable("x")
+    >>> x + Fraction(2, 3) == Polinominal({1: 1, 0: Fraction(2, 3)}), x + 1 == Polinominal({1: 1}, fraction=1)
+    (True, True)
+    >>> hash(x + Fraction(2, 3)) == hash(Polinominal({1: 1, 0: Fraction(2, 3)}))
+    True
+    >>> x - x + Fraction(2, 3) == Polinominal({0: Fraction(2, 3)}), 1 / x == Polinominal({0: 1}, fraction=1) / x
+    (True, False)
+
+    A polynomial is a value and is never changed by the operators: there are no in-place operators, so `+=`,
+    `-=` and `*=` bind the name to a new polynomial and the other names of the old one and the dict keys
+    made from it stay as they were.
+    `Polinominal.sum` and `Polinominal.dot` add many terms in place, but only in lists of their own.
+
+    >>> y = x
+    >>> y += 1
+    >>> x, y
+    (x, x + 1)
+    >>> keys = {x**2: "square"}
+    >>> power = x**2
+    >>> power *= 5
+    >>> keys[x**2], x**2 in keys, power in keys
+    ('square', True, False)
+    >>> b = x + 1
+    >>> common = gcd((x + 1) * (x + 2), b)
+    >>> common *= 5
+    >>> common, b
+    (5x + 5, x + 1)
     """
-    __slots__ = ["coefficients", "symbol", "fraction"]
+    __slots__ = ["_terms", "_dense", "_powers", "symbol", "fraction"]
 
     def __init__(self, coefficients: Dict[int, Union[float, int, Fraction]]={}, fraction: Fraction=0, symbol: str="x") -> None:
         if type(coefficients) != dict:
             raise TypeError("use the Variable class to create a variable, and then make an expression")
         
-        self.coefficients = {0: 0}
+        self._terms = {0: 0}
+        self._dense = None
+        self._powers = None
         self.symbol = symbol
         self.fraction = fraction
         
@@ -47,21 +434,153 @@ class Polinominal():
             if type(coefficient) == Fraction:
                 if coefficient.numerator == 0:
                     continue
-                self.coefficients[degree] = coefficient
+                self._terms[degree] = coefficient
             else:
                 if int(coefficient) == coefficient:
-                    self.coefficients[degree] = Fraction(int(coefficient), 1)
+                    self._terms[degree] = Fraction(int(coefficient), 1)
                 else:                    
-                    self.coefficients[degree] = Fraction(coefficient, 1)
+                    self._terms[degree] = Fraction(coefficient, 1)
+
+
+    @classmethod
+    def fromDense(cls, numerators: List[int], denominator: int=1, fraction: Fraction=0, symbol: str="x") -> "Polinominal":
+        """
+        makes a polynomial from integer numerators indexed by degree and a shared denominator without checking them;
+        the polynomial takes the list itself, the caller must not keep it or change it afterwards
+        """
+
+        poli = cls.__new__(cls)
+        poli._terms = None
+        poli._dense = normalizeDense(numerators, denominator)
+        poli._powers = None
+        poli.symbol = symbol
+        poli.fraction = fraction
+        return poli
+
+
+    @property
+    def coefficients(self) -> Dict[int, Union[int, Fraction]]:
+        """ the terms of the polynomial as a dict of degree and coefficient """
+
+        terms = self._view()
+        # the caller may change the dict, so the dense form and the powers are no longer trusted
+        self._dense = None
+        self._powers = None
+        return terms
+
+    @coefficients.setter
+    def coefficients(self, coefficients: Dict[int, Union[int, Fraction]]) -> None:
+        self._terms = coefficients
+        self._dense = None
+        self._powers = None
+
+
+    def _view(self) -> Dict[int, Union[int, Fraction]]:
+        """ the dict of terms for reading only, the dense form is kept """
+
+        if self._terms is None:
+            self._terms = denseToTerms(*self._dense)
+        return self._terms
+
+
+    def _asDense(self, force: bool=False) -> Optional[Tuple[List[int], int]]:
+        """ the dense form of the polynomial or None if it is sparse (unless `force` is set) """
+
+        if self._dense is not None:
+            return self._dense
+        return termsToDense(self._terms, force)
+
+
+    def _isConstant(self) -> bool:
+        """ whether the polynomial has no terms of a positive degree and no fraction """
+
+        if self.fraction:
+            return False
+        if self._dense is not None:
+            return len(self._dense[0]) <= 1
+        return all(not degree or not coefficient for degree, coefficient in self._terms.items())
+
+
+    def _otherSymbol(self, other: Union[float, int, "Polinominal", Fraction]) -> bool:
+        """ whether self and other are polynomials of different variables, constants have no variable """
+        return type(other) == Polinominal and other.symbol != self.symbol and not self._isConstant() and not other._isConstant()
+
+
+    def _multivariate(self) -> "MultiPolinominal":
+        """ the polynomial as a 'MultiPolinominal' of its symbol """
+
+        from .multivariate import MultiPolinominal
+        return MultiPolinominal.fromPolinominal(self)
+
+
+    def _canonical(self) -> tuple:
+        """ a hashable snapshot of the value of the polynomial, equal polynomials have equal snapshots """
+
+        fraction = self.fraction
+        # a rational fraction part is a part of the constant term, x + 2/3 has the snapshot of {1: 1, 0: 2/3}
+        if type(fraction) == int:
+            numerator, denominator, fraction = fraction, 1, 0
+        elif type(fraction) == Fraction and type(fraction.numerator) == int and type(fraction.denominator) == int:
+            numerator, denominator, fraction = fraction.numerator, fraction.denominator, 0
+        else:
+            numerator, denominator = 0, 1
+
+        dense = self._asDense()
+        if dense is not None:
+            numerators, common = dense
+            constant = rationalKey((numerators[0] if numerators else 0) * denominator + numerator * common, common * denominator)
+            terms = [(degree, rationalKey(coefficient, common)) for degree, coefficient in enumerate(numerators) if coefficient and degree]
+        else:
+            view = self._view()
+            constant = valueKey(view.get(0, 0) + Fraction(numerator, denominator)) if numerator else valueKey(view.get(0, 0))
+            terms = sorted((degree, valueKey(coefficient)) for degree, coefficient in view.items() if coefficient and degree)
+
+        symbol = None if not terms and not fraction else self.symbol
+        if constant:
+            terms.insert(0, (0, constant))
+        return symbol, tuple(terms), valueKey(fraction)
+
+
+    def __eq__(self, other: object) -> bool:
+        """ 'Polinominal' == other, compares the values of two polynomials """
+
+        if type(other) != Polinominal:
+            return NotImplemented
+        return self._canonical() == other._canonical()
+
+
+    def __hash__(self) -> int:
+        return hash(self._canonical())
+
+
+    def _copy(self) -> "Polinominal":
+        """ a new polynomial with the same value that shares nothing mutable with self """
+
+        poli = Polinominal.__new__(Polinominal)
+        poli._terms = dict(self._terms) if self._terms is not None else None
+        poli._dense = (list(self._dense[0]), self._dense[1]) if self._dense is not None else None
+        poli._powers = None
+        poli.symbol = self.symbol
+        poli.fraction = self.fraction
+        return poli
 
 
     def __add__(self, other: Union[float, int, "Polinominal", Fraction]) -> "Polinominal":
         """ 'Polinominal' + other """
 
-        if type(other) not in [int, float, Polinominal, Fraction]:
+        if type(other) not in _operand_types:
+            if type(other).__name__ in _deferred_types:
+                return NotImplemented
             raise TypeError(f"unsupported operand type(s) for +: '{type(other).__name__}' and 'Polinominal'")
+
+        if self._otherSymbol(other):
+            return self._multivariate() + other
         
-        terms = self.coefficients.copy()
+        dense = self._combineDense(other, 1)
+        if dense is not None:
+            return dense
+
+        terms = self._view().copy()
         fraction = self.fraction
         
         if type(other) in [int, float]:
@@ -89,9 +608,13 @@ class Polinominal():
     def __neg__(self) -> "Polinominal":
         """ -'Polinominal' """
 
+        dense = self._asDense()
+        if dense is not None:
+            return Polinominal.fromDense([-numerator for numerator in dense[0]], dense[1], symbol=self.symbol, fraction=self.fraction*(-1))
+
         terms = {}
 
-        for degree, coefficient in self.coefficients.items():
+        for degree, coefficient in self._view().items():
             terms[degree] = -coefficient
 
         return Polinominal(terms, symbol=self.symbol, fraction=self.fraction*(-1))
@@ -100,10 +623,19 @@ class Polinominal():
     def __sub__(self, other: Union[float, int, "Polinominal", Fraction]) -> "Polinominal":
         """ 'Polinominal' - other """
 
-        if type(other) not in [int, float, Polinominal, Fraction]:
+        if type(other) not in _operand_types:
+            if type(other).__name__ in _deferred_types:
+                return NotImplemented
             raise TypeError(f"unsupported operand type(s) for -: 'Polinominal' and '{type(other).__name__}'")
+
+        if self._otherSymbol(other):
+            return self._multivariate() - other
         
-        terms = self.coefficients.copy()
+        dense = self._combineDense(other, -1)
+        if dense is not None:
+            return dense
+
+        terms = self._view().copy()
         fraction = self.fraction
 
         if type(other) in [int, float]:
@@ -126,6 +658,27 @@ class Polinominal():
         return Polinominal(terms, symbol=self.symbol, fraction=fraction)
     
 
+    def _combineDense(self, other: Union[float, int, "Polinominal", Fraction], sign: int) -> Optional["Polinominal"]:
+        """ self + sign * other over the dense forms, returns None when the dict terms have to be used """
+
+        if type(other) == int:
+            dense = self._asDense()
+            if dense is None:
+                return None
+            numerators = dense[0] or [0]
+            numerators = [numerators[0] + sign * other * dense[1]] + numerators[1:]
+            return Polinominal.fromDense(numerators, dense[1], symbol=self.symbol, fraction=self.fraction)
+
+        if type(other) != Polinominal or self.fraction or other.fraction:
+            return None
+
+        first = self._asDense()
+        second = other._asDense() if first is not None else None
+        if second is None:
+            return None
+        return Polinominal.fromDense(*addDense(first, second, sign), symbol=self.symbol)
+
+
     def __rsub__(self, other: Union[float, int, "Polinominal"]) -> "Polinominal":
         """ other - 'Polinominal' """
 
@@ -135,14 +688,45 @@ class Polinominal():
         return (self - other) * (-1)
 
 
+    @staticmethod
+    def sum(operands: Iterable[Union[int, float, Fraction, "Polinominal"]]) -> "Polinominal":
+        """
+        the sum of numbers and polynomials in one pass, the fraction parts are put over one common denominator
+        at the end, see `linearCombination`; the operands are not changed
+
+        >>> x = Variable("x")
+        >>> p, q = x + 1/(x + 2) + Fraction(1, 3), 2*x**2 + Fraction(1, 2) + 1/(x + 2)
+        >>> Polinominal.sum([p, x, q]) == p + x + q, Polinominal.sum([p, x]) == p + x
+        (True, True)
+        >>> Polinominal.dot([1, -2, 3], [p, x, q]) == p + (-2)*x + 3*q, Polinominal.dot([1, 1], [p, x]) == p + x
+        (True, True)
+        """
+        return linearCombination((1, operand) for operand in operands)
+
+
+    @staticmethod
+    def dot(weights: Iterable[Union[int, float, Fraction, "Polinominal"]], operands: Iterable[Union[int, float, Fraction, "Polinominal"]]) -> "Polinominal":
+        """ the sum of the products of the weights and the operands, which must have the same length, in one pass """
+        return linearCombination(zip(weights, operands, strict=True))
+
+
     def __mul__(self, other: Union[float, int, "Polinominal", Fraction]) -> "Polinominal":
         """ 'Polinominal' * other """
 
-        if type(other) not in [int, float, Polinominal, Fraction]: 
+        if type(other) not in _operand_types:
+            if type(other).__name__ in _deferred_types:
+                return NotImplemented
             raise TypeError(f"unsupported operand type(s) for *: '{type(other).__name__}' and 'Polinominal'")
+
+        if self._otherSymbol(other):
+            return self._multivariate() * other
         
+        dense = self._mulDense(other)
+        if dense is not None:
+            return dense
+
         if type(other) in [int, float, Fraction]:
-            new_poli = Polinominal(self.coefficients, symbol=self.symbol)
+            new_poli = Polinominal(self._view(), symbol=self.symbol)
             for i in new_poli.coefficients:
                 new_poli.coefficients[i] = new_poli.coefficients[i] * other
             new_poli.fraction = self.fraction * other
@@ -150,8 +734,8 @@ class Polinominal():
         
         terms = {}
         if not (self.fraction or other.fraction):
-            for first_degree, first_coefficient in self.coefficients.items():
-                for second_degree, second_coefficient in other.coefficients.items():
+            for first_degree, first_coefficient in self._view().items():
+                for second_degree, second_coefficient in other._view().items():
                     new_degree = first_degree + second_degree
                     terms[new_degree] = terms.get(new_degree, 0) + first_coefficient * second_coefficient
             return Polinominal(terms, symbol=self.symbol)
@@ -176,6 +760,28 @@ class Polinominal():
     __rmul__ = __mul__
 
 
+    def _mulDense(self, other: Union[float, int, "Polinominal", Fraction]) -> Optional["Polinominal"]:
+        """ self * other over the dense forms, returns None when the dict terms have to be used """
+
+        if type(other) == int or (type(other) == Fraction and type(other.numerator) == int and type(other.denominator) == int):
+            dense = self._asDense()
+            if dense is None:
+                return None
+            numerator, denominator = (other, 1) if type(other) == int else (other.numerator, other.denominator)
+            return Polinominal.fromDense([coefficient * numerator for coefficient in dense[0]], dense[1] * denominator,
+                                         symbol=self.symbol, fraction=self.fraction * other)
+
+        if type(other) != Polinominal or self.fraction or other.fraction:
+            return None
+
+        first = self._asDense()
+        second = other._asDense() if first is not None else None
+        if second is None:
+            return None
+        return Polinominal.fromDense(*mulDense(first, second), symbol=self.symbol)
+
+
+    @memoize("pow", powKey)
     def __pow__(self, other: int) -> "Polinominal":
         """ 'Polinominal' ** other """
 
@@ -186,46 +792,99 @@ class Polinominal():
         
         if other == 0:
             return 1
-        
-        new_poli = Polinominal(self.coefficients.copy(), symbol=self.symbol)
 
-        for _ in range(other-1):
-            new_poli = new_poli * self
+        if not self.fraction:
+            terms = [(degree, coefficient) for degree, coefficient in self._view().items() if coefficient != 0]
+            if len(terms) <= 1:
+                degree, coefficient = terms[0] if terms else (0, 0)
+                return Polinominal({degree * other: coefficient ** other}, symbol=self.symbol)
+
+            dense = self._asDense()
+            if dense is not None:
+                return self._powDense(dense, other)
+            if len(terms) == 2 and all(type(coefficient) == Fraction and type(coefficient.numerator) == int and
+                                       type(coefficient.denominator) == int for _, coefficient in terms):
+                return self._powBinomial(terms, other)
+
+        result = None
+        base = self
+        # square-and-multiply over the bits of the exponent
+        while other:
+            if other & 1:
+                result = base if result is None else result * base
+            other >>= 1
+            if other:
+                base = base * base
+
+        if result is self:
+            result = Polinominal(self._view(), symbol=self.symbol, fraction=self.fraction)
+        return result
+
+
+    def _powDense(self, dense: Tuple[List[int], int], exponent: int) -> "Polinominal":
+        """ power of a dense polynomial that reuses the cached powers of self """
+
+        numerators, denominator = dense
+        if self._powers is None:
+            self._powers = OrderedDict()
+        powers = self._powers
+
+        if exponent in powers:
+            powers.move_to_end(exponent)
+            numerators, denominator = powers[exponent]
+            return Polinominal.fromDense(list(numerators), denominator, symbol=self.symbol)
+
+        known = max((k for k in powers if k < exponent), default=0)
+        if len(numerators) == 2 and not known:
+            result = binomialPower(numerators[0], 0, numerators[1], 1, exponent)
+            result = [result.get(degree, 0) for degree in range(exponent + 1)], denominator ** exponent
+        else:
+            result = polyPow(numerators, exponent - known), denominator ** (exponent - known)
+            if known:
+                result = mulDense(powers[known], result)
+        result = normalizeDense(*result)
 
-        return new_poli
+        if POWER_CACHE_SIZE:
+            powers[exponent] = result
+            while len(powers) > POWER_CACHE_SIZE:
+                powers.popitem(last=False)
+
+        return Polinominal.fromDense(list(result[0]), result[1], symbol=self.symbol)
+
+
+    def _powBinomial(self, terms: List[Tuple[int, Fraction]], exponent: int) -> "Polinominal":
+        """ power of a sparse polynomial with two terms by the binomial theorem """
+
+        (first_degree, first), (second_degree, second) = terms
+        denominator = scm(abs(first.denominator), abs(second.denominator))
+        first_numer = first.numerator * (denominator // first.denominator)
+        second_numer = second.numerator * (denominator // second.denominator)
+
+        denominator **= exponent
+        terms = binomialPower(first_numer, first_degree, second_numer, second_degree, exponent)
+        return Polinominal({degree: Fraction(numerator, denominator) for degree, numerator in terms.items()}, symbol=self.symbol)
     
     
     def __truediv__(self, other: Union[int, float, "Polinominal", Fraction]) -> "Polinominal":
         """ 'Polinominal' / other """
 
-        if type(other) not in [int, float, Polinominal, Fraction]:
+        if type(other) not in _operand_types:
+            if type(other).__name__ in _deferred_types:
+                return NotImplemented
             raise TypeError(f"unsupported operand type(s) for /: '{type(other).__name__}' and 'Polinominal'")        
 
-        old_poli = self.coefficients.copy()
-
         if type(other) in [int, float, Fraction]:
+            old_poli = self._view().copy()
             for i in old_poli:
                 old_poli[i] /= other
             return Polinominal(old_poli, symbol=self.symbol, fraction=self.fraction / other)
 
-        fraction = 0
-        if self.fraction:
-            fraction = self.fraction / other
-
-        new_poli = Polinominal({}, symbol=self.symbol, fraction=fraction)
-        old_poli = Polinominal(old_poli, symbol=self.symbol)
+        new_poli, old_poli = divmod(self, other)
 
-        while old_poli.coefficients != {0: 0} and max(old_poli.coefficients) >= max(other.coefficients):
-            multiplier = Polinominal(
-                {max(old_poli.coefficients) - max(other.coefficients):
-                Fraction(old_poli.coefficients[max(old_poli.coefficients)], other.coefficients[max(other.coefficients)])},
-                symbol=self.symbol)
-            tmp = multiplier * other
-            new_poli = new_poli + multiplier
-            old_poli = old_poli - tmp
+        if self.fraction:
+            new_poli.fraction = self.fraction / other
 
-        
-        if old_poli.coefficients != {0: 0}:
+        if type(old_poli) == Polinominal:
             new_poli.fraction += Fraction(old_poli, other)
 
         return new_poli
@@ -234,7 +893,9 @@ class Polinominal():
     def __rtruediv__(self, other: Union[int, float, "Polinominal", Fraction]) -> "Polinominal":
         """ other / 'Polinominal' """
 
-        if type(other) not in [int, float, Polinominal, Fraction]:
+        if type(other) not in _operand_types:
+            if type(other).__name__ in _deferred_types:
+                return NotImplemented
             raise TypeError(f"unsupported operand type(s) for /: '{type(other).__name__}' and 'Polinominal'")
         
         if self.fraction:
@@ -260,17 +921,54 @@ class Polinominal():
     def __mod__(self, other: Union[int, float, "Polinominal", Fraction]) -> "Polinominal":
         """ 'Polinominal' % other """
 
-        if type(other) not in [int, float, Polinominal, Fraction]:
+        if type(other) not in _operand_types:
+            if type(other).__name__ in _deferred_types:
+                return NotImplemented
             raise TypeError(f"unsupported operand type(s) for %: '{type(other).__name__}' and 'Polinominal'")        
 
-        old_poli = self.coefficients.copy()
-
         if type(other) in [int, float, Fraction]:
+            old_poli = self._view().copy()
             for i in old_poli:
                 old_poli[i] /= other
             return Polinominal(old_poli, symbol=self.symbol)
-            
-        old_poli = Polinominal(old_poli, symbol=self.symbol)
+
+        return divmod(self, other)[1]
+
+
+    @memoize("divmod", divmodKey)
+    def __divmod__(self, other: Union[int, float, "Polinominal", Fraction]) -> Tuple["Polinominal", Union["Polinominal", int]]:
+        """
+        divmod('Polinominal', other) is the quotient and the remainder in one pass,
+        the fraction part of the dividend is not divided
+        """
+
+        if type(other) not in _operand_types:
+            raise TypeError(f"unsupported operand type(s) for divmod(): 'Polinominal' and '{type(other).__name__}'")
+        if self._otherSymbol(other):
+            raise TypeError(f"can't divide a polynomial of '{self.symbol}' by a polynomial of '{other.symbol}'")
+
+        if type(other) in [int, float, Fraction]:
+            return Polinominal(self._view(), symbol=self.symbol) / other, 0
+
+        if not other.fraction:
+            dividend, divisor = self._asDense(force=True), other._asDense(force=True)
+            if dividend is not None and divisor is not None:
+                if not divisor[0]:
+                    raise ZeroDivisionError("polynomial division by zero")
+
+                quotient, remainder, scale = polyDivmod(dividend[0], divisor[0])
+                quotient = Polinominal.fromDense([c * divisor[1] for c in quotient], scale * dividend[1], symbol=self.symbol)
+                remainder = Polinominal.fromDense(remainder, scale * dividend[1], symbol=self.symbol)
+                return quotient, remainder if remainder._dense[0] else 0
+
+        return self._longDivision(other)
+
+
+    def _longDivision(self, other: "Polinominal") -> Tuple["Polinominal", Union["Polinominal", int]]:
+        """ term by term division for the polynomials that have no dense form """
+
+        new_poli = Polinominal({}, symbol=self.symbol)
+        old_poli = Polinominal(self._view(), symbol=self.symbol)
 
         while old_poli.coefficients != {0: 0} and max(old_poli.coefficients) >= max(other.coefficients):
             multiplier = Polinominal(
@@ -278,15 +976,17 @@ class Polinominal():
                 Fraction(old_poli.coefficients[max(old_poli.coefficients)], other.coefficients[max(other.coefficients)])},
                 symbol=self.symbol)
             tmp = multiplier * other
+            new_poli = new_poli + multiplier
             old_poli = old_poli - tmp
 
         if old_poli.coefficients != {0: 0}:
-            return old_poli
+            return new_poli, old_poli
 
-        return 0
+        return new_poli, 0
 
                         
-    def __str__(self) -> str:
+    def _strTerms(self) -> Iterator[Tuple[str, str, str]]:
+        """ the three lines of every term of `str` (the numerator, the middle and the denominator), all of one width """
 
         def makeFrac(numer: str, denom: str) -> list[str]:
             if len(denom) > len(numer):
@@ -300,19 +1000,13 @@ class Polinominal():
             return [str(numer), str(divider), str(denom)]
        
         var_symb = self.symbol
-        
-        terms_numer = []
-        terms_mid = []
-        terms_denom = []
-        frac = False
 
-        degrees = sorted(self.coefficients, reverse=True)
+        coefficients = self._view()
+        degrees = sorted(coefficients, reverse=True)
 
-        if (len(degrees) == 0 or self.coefficients == {0: 0}) and not self.fraction:
-            return "0"
         for i in range(len(degrees)):
             term_degree = degrees[i]
-            term_coefficient = self.coefficients[term_degree]
+            term_coefficient = coefficients[term_degree]
             if term_coefficient == 0:
                 continue
             
@@ -324,33 +1018,16 @@ class Polinominal():
                 sign = " - " if term_coefficient < 0 else " + "
 
             term_coefficient = abs(term_coefficient)
+            if type(term_coefficient) == Fraction:
+                term_coefficient._reduce()
 
-            if term_degree == 0:
-                if type(term_coefficient) == Fraction:
-                    if term_coefficient.denominator == 1:
-                        mid = str(term_coefficient.numerator)
-                        numer = denom = " " * len(mid)
-                    else:
-                        frac = True
-                        numer, mid, denom = makeFrac(str(term_coefficient.numerator), str(term_coefficient.denominator))
-                else:                    
-                    mid = str(term_coefficient)
-                    numer = denom = " " * len(mid)
-
+            if term_degree != 0 and term_coefficient == 1:
+                numer, mid, denom = "", "", ""
+            elif type(term_coefficient) == Fraction and term_coefficient.denominator != 1:
+                numer, mid, denom = makeFrac(str(term_coefficient.numerator), str(term_coefficient.denominator))
             else:
-                if term_coefficient == 1:
-                    numer, mid, denom = "", "", ""
-                else:
-                    if type(term_coefficient) == Fraction:
-                        if term_coefficient.denominator == 1:
-                            mid = str(term_coefficient.numerator)
-                            numer = denom = " " * len(mid)
-                        else:
-                            frac = True
-                            numer, mid, denom = makeFrac(str(term_coefficient.numerator), str(term_coefficient.denominator))
-                    else:
-                        mid = str(term_coefficient)
-                        numer = denom = " " * len(mid)
+                mid = str(term_coefficient.numerator) if type(term_coefficient) == Fraction else str(term_coefficient)
+                numer = denom = " " * len(mid)
 
             if term_degree == 1:
                 degree = var_symb
@@ -360,75 +1037,231 @@ class Polinominal():
             mid = sign + mid + degree
             numer = " " * len(sign) + numer + " " * (len(mid) - len(sign) - len(numer))
             denom = " " * len(sign) + denom + " " * (len(mid) - len(sign) - len(denom))
-        
-            terms_numer.append(numer)
-            terms_mid.append(mid)
-            terms_denom.append(denom)
+            yield numer, mid, denom
+
+
+    def _strParts(self, terms: Callable[[], Iterable[Tuple[str, str, str]]]) -> Iterator[str]:
+        """
+        the text of `str` in pieces, line by line: `terms` gives the lines of the terms again for every line,
+        the first pass over the coefficients and over the fraction only measures the layout
+        """
+
+        has_terms = False
+        frac = bool(self.fraction)
+        for coefficient in self._view().values():
+            if coefficient != 0:
+                has_terms = True
+                frac = frac or (type(coefficient) == Fraction and coefficient._reduce().denominator != 1)
 
-        terms_numer = "".join(terms_numer)
-        terms_mid = "".join(terms_mid)
-        terms_denom = "".join(terms_denom)
+        if not has_terms and not self.fraction:
+            yield "0"
+            return
 
         if self.fraction:
-            frac = True
-            numer, divider, denom = makeFrac(repr(self.fraction.numerator), repr(self.fraction.denominator))
+            numer_width = sum(len(part) for part in reprParts(self.fraction.numerator))
+            denom_width = sum(len(part) for part in reprParts(self.fraction.denominator))
 
-            if terms_mid:
-                terms_numer = terms_numer + " " * 3 + numer
-                terms_mid = terms_mid + " + " + divider
-                terms_denom = terms_denom + " " * 3 + denom
-            else:
-                terms_numer = numer
-                terms_mid = divider
-                terms_denom = denom
+        lines = [0, 1, 2] if frac else [1]
+        for line in lines:
+            if line != lines[0]:
+                yield "\n"
+            for term in terms():
+                yield term[line]
 
+            if not self.fraction:
+                continue
+            if line == 1:
+                yield " + " if has_terms else ""
+                yield from repeatChunks("─", max(numer_width, denom_width))
+                continue
+
+            yield "   " if has_terms else ""
+            # the shorter of the numerator and the denominator is centered, the extra space goes to the right
+            padding = max(0, denom_width - numer_width) if line == 0 else max(0, numer_width - denom_width)
+            yield from repeatChunks(" ", padding // 2)
+            yield from reprParts(self.fraction.numerator if line == 0 else self.fraction.denominator)
+            yield from repeatChunks(" ", padding // 2 + padding % 2)
+
+
+    def __str__(self) -> str:
+        terms = list(self._strTerms())
+        return "".join(self._strParts(lambda: terms))
+
+
+    def _reprParts(self) -> Iterator[str]:
+        """ the text of `repr` in pieces, a term at a time """
 
-        if frac:
-            return f"{terms_numer}\n{terms_mid}\n{terms_denom}"        
-        return terms_mid
-        
-        
-    def __repr__(self) -> str:
-        string = []
         var_symb = self.symbol
-        degrees = sorted(self.coefficients, reverse=True)
+        coefficients = self._view()
+        degrees = sorted(coefficients, reverse=True)
+        empty = True
         for i in degrees:
             s = ""
 
-            if self.coefficients[i] == 0:
+            if coefficients[i] == 0:
                 continue
 
             if i == degrees[0]:
-                s = "-" if self.coefficients[i] < 0 else ""
+                s = "-" if coefficients[i] < 0 else ""
             else:
-                s = "- " if self.coefficients[i] < 0 else "+ "
+                s = "- " if coefficients[i] < 0 else "+ "
 
 
-            if abs(self.coefficients[i]) != 1 or i == 0:
-                s += str(abs(self.coefficients[i]))
+            if abs(coefficients[i]) != 1 or i == 0:
+                s += str(abs(coefficients[i]))
 
             if i == 1:
                 s += var_symb
             elif i != 0:
                 s += f"{var_symb}^{i}"
-            string.append(s)
+            yield s if empty else " " + s
+            empty = False
                 
         if self.fraction:
-            if len(string) != 0:
-                string.append(f"+ ({repr(self.fraction.numerator)})/({repr(self.fraction.denominator)})")
-            else:                
-                string.append(f"({repr(self.fraction.numerator)})/({repr(self.fraction.denominator)})")
+            yield "(" if empty else " + ("
+            yield from reprParts(self.fraction.numerator)
+            yield ")/("
+            yield from reprParts(self.fraction.denominator)
+            yield ")"
+        elif empty:
+            yield "0"
 
-        if len(string) == 0:
-            return "0"
-        
-        return " ".join(string)
+
+    def __repr__(self) -> str:
+        return "".join(self._reprParts())
+
+
+    def write_to(self, fp, form: str="str") -> int:
+        """
+        writes the `str` (or with `form` "repr" the `repr`) of the polynomial to a text file-like object in chunks
+        of about WRITE_CHUNK characters without building the whole text, returns the number of written characters
+        """
+
+        if form not in ["str", "repr"]:
+            raise ValueError(f"the form should be 'str' or 'repr', not {form!r}")
+        return writeChunks(fp, self._strParts(self._strTerms) if form == "str" else self._reprParts())
     
 
     def evaluate_polynomial(self, variable: Union[int, float, Fraction]):
-        value = 0
-        for degree in self.coefficients:
-            value += self.coefficients[degree] * variable ** degree
+        if isinstance(variable, (array, memoryview)) or (numpy is not None and isinstance(variable, numpy.ndarray)):
+            return self.evaluate_array(variable)
+
+        dense = self._asDense()
+        if dense is not None and (type(variable) == int or
+                                  (type(variable) == Fraction and type(variable.numerator) == int and type(variable.denominator) == int)):
+            value = self._hornerDense(dense, variable)
+        else:
+            value = 0
+            coefficients = self._view()
+            for degree in coefficients:
+                value += coefficients[degree] * variable ** degree
         if self.fraction:
             value += (self.fraction.numerator.evaluate_polynomial(variable) / self.fraction.denominator.evaluate_polynomial(variable))
-        return value
\ No newline at end of file
+        return value
+    
+
+    def evaluate_array(self, points) -> "numpy.ndarray":
+        """
+        values at every point of a NumPy array (or any buffer) by the Horner scheme in float64 or complex arithmetic,
+        the numerator and the denominator of the fraction part are evaluated in the same pass and poles give inf or nan
+
+        without NumPy a list is returned
+        """
+
+        lists = [floatCoefficients(self)]
+        if self.fraction:
+            lists += [floatCoefficients(self.fraction.numerator), floatCoefficients(self.fraction.denominator)]
+
+        if numpy is None:
+            values = []
+            for point in points:
+                value, *fraction = hornerFloat(lists, point)
+                if fraction:
+                    numerator, denominator = fraction
+                    if denominator:
+                        value += numerator / denominator
+                    else:
+                        value = float("nan") if numerator == 0 else value + numerator * float("inf")
+                values.append(value)
+            return values
+
+        points = numpy.asarray(points)
+        if points.dtype.kind not in "fc":
+            points = points.astype(float)
+
+        value, *fraction = hornerFloat(lists, points)
+        if fraction:
+            numerator, denominator = fraction
+            with numpy.errstate(divide="ignore", invalid="ignore"):
+                value = value + numerator / denominator
+        # constants do not depend on the points, the result still has their shape
+        return value + numpy.zeros_like(points)
+
+
+    def roots(self, method: str=None) -> "numpy.ndarray":
+        """
+        all complex zeros of the expression (with its fraction) at once, `method` is "companion" or "aberth",
+        see `roots.findRoots`
+        """
+
+        from .roots import findRoots
+        return findRoots(self, method)
+
+
+    def poles(self, method: str=None) -> "numpy.ndarray":
+        """ all complex roots of the denominator of the fraction part, see `roots.findRoots` """
+
+        from .roots import findRoots
+        return findRoots(self.fraction.denominator if self.fraction else 1, method)
+
+
+    def isolateRoots(self, width: Union[int, float, Fraction]=None, poles: bool=False) -> List[tuple]:
+        """
+        certified rational intervals (low, high) with exactly one real zero (or pole) in each,
+        not wider than `width` when it is given, see `roots.isolateRealRoots`
+        """
+
+        from .roots import isolateRealRoots
+        return isolateRealRoots(self.fraction.denominator if poles and self.fraction else 1 if poles else self, width)
+
+
+    def toModular(self, modulus: int) -> "ModPolinominal":
+        """ the polynomial with its coefficients reduced modulo the prime, see `modular.ModPolinominal` """
+
+        from .modular import ModPolinominal
+        return ModPolinominal.fromPolinominal(self, modulus)
+
+
+    def compile(self, kind: str="float") -> "Kernel":
+        """
+        the polynomial (with its fraction) as a reusable callable that evaluates it by the Horner scheme,
+        `kind` is "float", "complex" or "exact", see `kernel.Kernel`
+        """
+
+        from .kernel import Kernel
+        return Kernel(self, kind)
+
+
+    @staticmethod
+    def _hornerDense(dense: Tuple[List[int], int], variable: Union[int, Fraction]) -> Union[int, Fraction]:
+        """ exact Horner scheme over the integer numerators """
+
+        numerators, denominator = dense
+        if not numerators:
+            return 0
+
+        numer, denom = (variable, 1) if type(variable) == int else (variable.numerator, variable.denominator)
+        value = 0
+        power = 1
+        for numerator in reversed(numerators):
+            value = value * numer + numerator * power
+            power *= denom
+
+        # power is denom ** len(numerators) after the loop, one factor too many
+        return Fraction(value, power // denom * denominator)
+
+
+# the operand types of the arithmetic operators of 'Polinominal' as one set lookup
+_operand_types = frozenset([int, float, Fraction, Polinominal])
+# the types of the other modules that implement the operators with 'Polinominal' themselves
+_deferred_types = frozenset(["MultiPolinominal", "ModPolinominal", "PolinominalMatrix"])
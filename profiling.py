@@ -0,0 +1,214 @@
+"""
+Opt-in counters of the hot paths: the calls, the time and the sizes of the operands of `Fraction.__new__`
+(and of `Fraction._fromIntegers`, which makes the results of the integer arithmetic), `operations.gcd`,
+the polynomial division and the `Fraction.toFration` fallbacks.
+
+`enable` replaces the instrumented functions with counting wrappers and `disable` puts the originals back,
+so there is no overhead while profiling is off.
+
+>>> from PyCalc import profiling
+>>> from PyCalc.polynomial import Variable
+>>> x = Variable("x")
+>>> with profiling.profile() as summary:
+...     a = (x**3 + 2*x + 1) / (x - 1)
+>>> summary["operations.polyDivmod"]["max_degree"]
+3
+"""
+
+import sys
+from contextlib import contextmanager
+from functools import wraps
+from time import perf_counter
+from typing import Callable, Dict, Iterator, List, Tuple
+from . import operations
+from .fraction import Fraction
+from .polynomial import Polinominal
+
+
+def sizeOf(value) -> Tuple[int, int]:
+    """ the degree and the largest bit length of a coefficient of a number, a 'Polinominal' or a coefficient list """
+
+    if type(value) == int:
+        return 0, value.bit_length()
+    if type(value) == Fraction and type(value.numerator) == int and type(value.denominator) == int:
+        return 0, max(value.numerator.bit_length(), value.denominator.bit_length())
+    if type(value) == list:
+        return max(0, len(value) - 1), max((c.bit_length() for c in value), default=0)
+    if type(value) == Polinominal:
+        dense = value._asDense()
+        if dense is not None:
+            return max(0, len(dense[0]) - 1), max([dense[1].bit_length()] + [c.bit_length() for c in dense[0]])
+        terms = value._view()
+        return max(terms, default=0), max((sizeOf(coefficient)[1] for coefficient in terms.values()), default=0)
+    return 0, 0
+
+
+class Counter():
+    """ the statistics of one instrumented path """
+    __slots__ = ["calls", "seconds", "degree", "bits", "steps", "fallbacks"]
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.seconds = 0.0
+        self.degree = 0
+        self.bits = 0
+        self.steps = 0
+        self.fallbacks = 0
+
+
+    def add(self, seconds: float, operands: tuple=(), steps: int=0) -> None:
+        self.calls += 1
+        self.seconds += seconds
+        self.steps += steps
+        for operand in operands:
+            degree, bits = sizeOf(operand)
+            self.degree = max(self.degree, degree)
+            self.bits = max(self.bits, bits)
+
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            "calls": self.calls,
+            "seconds": self.seconds,
+            "max_degree": self.degree,
+            "max_bits": self.bits,
+            "steps": self.steps,
+            "fallbacks": self.fallbacks,
+        }
+
+
+counters: Dict[str, Counter] = {}
+enabled = False
+# the replaced attributes: the class or the module, the name and the original value
+_patched: List[Tuple[object, str, object]] = []
+
+
+def countFraction(function: Callable, counter: Counter) -> Callable:
+    @wraps(function)
+    def wrapper(cls, numerator, denominator=1):
+        start = perf_counter()
+        result = function(cls, numerator, denominator)
+        counter.add(perf_counter() - start, (numerator, denominator))
+        return result
+    return wrapper
+
+
+def countBinary(function: Callable, counter: Counter, steps: Callable=None) -> Callable:
+    """ a wrapper of a function of two operands, `steps` gives the work of a call from the operands and the result """
+
+    @wraps(function)
+    def wrapper(a, b, *arguments, **options):
+        start = perf_counter()
+        result = function(a, b, *arguments, **options)
+        counter.add(perf_counter() - start, (a, b), steps(a, b, result) if steps else 0)
+        return result
+    return wrapper
+
+
+def countFloat(function: Callable, counter: Counter) -> Callable:
+    """ a wrapper of `Fraction.toFration` that counts the floats that can't be converted """
+
+    @wraps(function)
+    def wrapper(number, *arguments, **options):
+        start = perf_counter()
+        try:
+            return function(number, *arguments, **options)
+        except Exception:
+            counter.fallbacks += 1
+            raise
+        finally:
+            counter.calls += 1
+            counter.seconds += perf_counter() - start
+    return wrapper
+
+
+def divmodSteps(a: List[int], b: List[int], result: tuple) -> int:
+    """ the steps of the classical division: one for every term of the quotient """
+    return max(0, len(a) - len(b) + 1)
+
+
+def longDivisionSteps(a: Polinominal, b: Polinominal, result: tuple) -> int:
+    return sum(1 for coefficient in result[0]._view().values() if coefficient)
+
+
+def _hooks() -> List[Tuple[str, object, str, Callable]]:
+    """ the instrumented paths: the name of the counter, the owner, the attribute and the wrapper factory """
+
+    return [
+        ("Fraction.__new__", Fraction, "__new__", countFraction),
+        ("Fraction._fromIntegers", Fraction, "_fromIntegers", countBinary),
+        ("Fraction.toFration", Fraction, "toFration", countFloat),
+        ("operations.gcd", operations, "gcd", countBinary),
+        ("operations.polyDivmod", operations, "polyDivmod", lambda function, counter: countBinary(function, counter, divmodSteps)),
+        ("Polinominal.__truediv__", Polinominal, "__truediv__", countBinary),
+        ("Polinominal._longDivision", Polinominal, "_longDivision",
+         lambda function, counter: countBinary(function, counter, longDivisionSteps)),
+    ]
+
+
+def enable() -> None:
+    """ starts counting, the counters keep their values """
+
+    global enabled
+    if enabled:
+        return
+    enabled = True
+
+    package = __name__.rsplit(".", 1)[0]
+    modules = [module for name, module in list(sys.modules.items()) if module is not None and (name == package or name.startswith(package + "."))]
+
+    for name, owner, attribute, factory in _hooks():
+        counter = counters.setdefault(name, Counter())
+        raw = vars(owner)[attribute]
+        function = raw.__func__ if isinstance(raw, staticmethod) else raw
+        wrapper = factory(function, counter)
+        if isinstance(raw, staticmethod):
+            wrapper = staticmethod(wrapper)
+
+        if isinstance(owner, type):
+            _patched.append((owner, attribute, raw))
+            setattr(owner, attribute, wrapper)
+            continue
+        # the modules that imported the function by name get the wrapper too
+        for module in modules:
+            if vars(module).get(attribute) is raw:
+                _patched.append((module, attribute, raw))
+                setattr(module, attribute, wrapper)
+
+
+def disable() -> None:
+    """ stops counting and puts the original functions back """
+
+    global enabled
+    for owner, attribute, raw in reversed(_patched):
+        setattr(owner, attribute, raw)
+    _patched.clear()
+    enabled = False
+
+
+def reset() -> None:
+    """ sets all counters to zero """
+
+    for counter in counters.values():
+        counter.__init__()
+
+
+def summary() -> Dict[str, Dict[str, float]]:
+    """ the calls, the seconds, the largest degree and bit length of the operands, the steps and the fallbacks of every path """
+    return {name: counter.summary() for name, counter in counters.items()}
+
+
+@contextmanager
+def profile() -> Iterator[Dict[str, Dict[str, float]]]:
+    """ counts the hot paths of the block from zero, the yielded dict is filled with the summary when the block ends """
+
+    result: Dict[str, Dict[str, float]] = {}
+    was_enabled = enabled
+    reset()
+    enable()
+    try:
+        yield result
+    finally:
+        if not was_enabled:
+            disable()
+        result.update(summary())
@@ -0,0 +1,314 @@
+"""
+Roots of a `Polinominal`: the zeros of the expression with its fraction and the poles (the roots of the denominator).
+
+`findRoots` gives all complex roots at once, by the eigenvalues of the companion matrix when NumPy is available
+or by the Aberth–Ehrlich iteration, which updates every root in one pass.
+`isolateRealRoots` gives disjoint rational intervals, each with exactly one real root, found with a Sturm sequence
+in exact arithmetic, so the result is certified.
+
+>>> from PyCalc.polynomial import Variable
+>>> x = Variable("x")
+>>> isolateRealRoots((x**2 - 2) * (x - 3), width=Fraction(1, 8))
+[(-3/2, -11/8), (11/8, 3/2), (3, 3)]
+"""
+
+import cmath
+import math
+from functools import cmp_to_key
+from typing import List, Tuple, Union
+from .fraction import Fraction
+from .kernel import exactCoefficients, hornerExact
+from .operations import classicalDivmod, intGcd, polyDivmod, polyGcd, polyMul, primitivePart, trim
+from .polynomial import Polinominal
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+METHODS = ["companion", "aberth"]
+
+# the Aberth iteration stops when no root moves more than TOLERANCE relative to its size or after ABERTH_ITERATIONS passes
+TOLERANCE = 1e-15
+ABERTH_ITERATIONS = 200
+
+
+def zerosCoefficients(poli: Union[int, Fraction, Polinominal]) -> List[int]:
+    """ integer coefficients indexed by degree of the polynomial whose roots are the zeros of the expression """
+
+    if type(poli) != Polinominal or not poli.fraction:
+        return trim(exactCoefficients(poli)[0])
+
+    dense = poli._asDense(force=True)
+    if dense is None:
+        raise TypeError("the roots can only be found for rational coefficients")
+    numerators, a = dense
+    fraction_numerators, b = exactCoefficients(poli.fraction.numerator)
+    denominators, c = exactCoefficients(poli.fraction.denominator)
+
+    # p / a + (n / b) / (d / c) = (p * d * b + n * a * c) / (a * b * d)
+    whole = [x * b for x in polyMul(list(numerators), denominators)]
+    whole += [0] * (len(fraction_numerators) - len(whole))
+    for degree, numerator in enumerate(fraction_numerators):
+        whole[degree] += numerator * a * c
+    return trim(whole)
+
+
+def floatRoots(coefficients: List[int], method: str) -> list:
+    """ the complex roots of the integer coefficients (indexed by degree, without zero roots) as floats """
+
+    # the division by the largest coefficient keeps huge integers in the float range
+    scale = max(abs(coefficient) for coefficient in coefficients)
+    coefficients = [coefficient / scale for coefficient in coefficients]
+    degree = len(coefficients) - 1
+
+    if degree == 1:
+        return [complex(-coefficients[0] / coefficients[1])]
+    if method == "companion":
+        companion = numpy.zeros((degree, degree), dtype=float)
+        companion[1:, :-1] = numpy.eye(degree - 1)
+        companion[:, -1] = [-coefficient / coefficients[-1] for coefficient in coefficients[:-1]]
+        return list(numpy.linalg.eigvals(companion).astype(complex))
+    return aberth(coefficients)
+
+
+def initialGuesses(coefficients: List[float]) -> List[complex]:
+    """ points on a circle around the centroid of the roots with the radius of the Fujiwara bound """
+
+    degree = len(coefficients) - 1
+    lead = coefficients[-1]
+    center = -coefficients[-2] / (degree * lead)
+    radius = 2 * max(abs(coefficients[k] / lead) ** (1 / (degree - k)) for k in range(degree)) or 1.0
+    return [center + radius * cmath.exp(1j * (2 * math.pi * k / degree + 0.4)) for k in range(degree)]
+
+
+def aberth(coefficients: List[float]) -> list:
+    """ the roots of the float coefficients (indexed by degree) by the Aberth–Ehrlich iteration """
+
+    if numpy is not None:
+        return list(aberthArray(coefficients))
+
+    roots = initialGuesses(coefficients)
+    for _ in range(ABERTH_ITERATIONS):
+        values, derivatives = [coefficients[-1]] * len(roots), [0] * len(roots)
+        for coefficient in reversed(coefficients[:-1]):
+            derivatives = [d * z + v for d, z, v in zip(derivatives, roots, values)]
+            values = [v * z + coefficient for v, z in zip(values, roots)]
+
+        steps = []
+        for i, z in enumerate(roots):
+            if not values[i]:
+                steps.append(0)
+                continue
+            ratio = values[i] / derivatives[i] if derivatives[i] else values[i]
+            repulsion = sum(1 / (z - w) for j, w in enumerate(roots) if j != i and z != w)
+            denominator = 1 - ratio * repulsion
+            steps.append(ratio / denominator if denominator else ratio)
+
+        roots = [z - step for z, step in zip(roots, steps)]
+        if all(abs(step) <= TOLERANCE * max(1, abs(z)) for z, step in zip(roots, steps)):
+            break
+    return roots
+
+
+def aberthArray(coefficients: List[float]) -> "numpy.ndarray":
+    """ the Aberth–Ehrlich iteration with all roots in one NumPy array """
+
+    roots = numpy.array(initialGuesses(coefficients), dtype=complex)
+    with numpy.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        for _ in range(ABERTH_ITERATIONS):
+            values = numpy.full_like(roots, coefficients[-1])
+            derivatives = numpy.zeros_like(roots)
+            for coefficient in reversed(coefficients[:-1]):
+                derivatives = derivatives * roots + values
+                values = values * roots + coefficient
+
+            ratios = values / derivatives
+            differences = roots[:, None] - roots[None, :]
+            numpy.fill_diagonal(differences, numpy.inf)
+            steps = ratios / (1 - ratios * (1 / differences).sum(axis=1))
+            steps[~numpy.isfinite(steps)] = 0
+
+            roots = roots - steps
+            if numpy.all(numpy.abs(steps) <= TOLERANCE * numpy.maximum(1, numpy.abs(roots))):
+                break
+    return roots
+
+
+def findRoots(poli: Union[int, Fraction, Polinominal], method: str=None) -> "numpy.ndarray":
+    """
+    all complex roots of the expression (a root of multiplicity k is given k times) sorted by the real
+    and the imaginary part, `method` is "companion" (the default with NumPy) or "aberth"
+
+    without NumPy a list is returned
+    """
+
+    if method is None:
+        method = "companion" if numpy is not None else "aberth"
+    if method not in METHODS:
+        raise ValueError(f"the method should be one of {', '.join(METHODS)}, not {method!r}")
+    if method == "companion" and numpy is None:
+        raise ImportError("the companion matrix method needs NumPy")
+
+    coefficients = zerosCoefficients(poli)
+    if not coefficients:
+        raise ValueError("the zero polynomial has no finite set of roots")
+
+    # the zero roots are exact
+    zeros = 0
+    while not coefficients[zeros]:
+        zeros += 1
+    roots = [0j] * zeros
+    # a multiple root is found as a simple root of its square-free factor, which is much more accurate
+    for factor, multiplicity in squareFreeFactors(coefficients[zeros:]):
+        roots += floatRoots(factor, method) * multiplicity
+
+    roots.sort(key=lambda root: (root.real, root.imag))
+    return numpy.array(roots, dtype=complex) if numpy is not None else roots
+
+
+def derivative(coefficients: List[int]) -> List[int]:
+    return [degree * coefficient for degree, coefficient in enumerate(coefficients)][1:]
+
+
+def squareFree(coefficients: List[int]) -> List[int]:
+    """ the primitive polynomial with the same roots as the integer coefficients, every root simple """
+
+    common = polyGcd(coefficients, derivative(coefficients))
+    if len(common) > 1:
+        coefficients = polyDivmod(coefficients, common)[0]
+    return primitivePart(coefficients)
+
+
+def squareFreeFactors(coefficients: List[int]) -> List[Tuple[List[int], int]]:
+    """ the square-free factors of a polynomial of a positive degree with the multiplicity of their roots """
+
+    # powers[k] has every root of multiplicity m > k with multiplicity m - k
+    powers = [primitivePart(coefficients)]
+    while len(powers[-1]) > 1:
+        powers.append(polyGcd(powers[-1], derivative(powers[-1])))
+
+    # at least[k] has the roots of multiplicity k + 1 or more, all simple
+    at_least = [primitivePart(polyDivmod(a, b)[0]) for a, b in zip(powers, powers[1:])] + [[1]]
+    factors = []
+    for multiplicity, (a, b) in enumerate(zip(at_least, at_least[1:]), 1):
+        factor = primitivePart(polyDivmod(a, b)[0])
+        if len(factor) > 1:
+            factors.append((factor, multiplicity))
+    return factors
+
+
+def sturmSequence(coefficients: List[int]) -> List[Tuple[int, ...]]:
+    """ the Sturm sequence of a square-free polynomial, each one reversed for `hornerExact` """
+
+    sequence = [coefficients, derivative(coefficients)]
+    while len(sequence[-1]) > 1:
+        # the remainders of classicalDivmod only differ from the Euclidean ones by positive factors
+        remainder = trim(classicalDivmod(sequence[-2], sequence[-1])[1])
+        if not remainder:
+            break
+        sequence.append(primitivePart([-coefficient for coefficient in remainder]))
+    return [tuple(reversed(polynomial)) for polynomial in sequence]
+
+
+def signChanges(sequence: List[Tuple[int, ...]], point: Tuple[int, int]) -> int:
+    """ the sign changes of the sequence at the rational point, zeros are skipped """
+
+    changes = 0
+    last = 0
+    for polynomial in sequence:
+        value = hornerExact(polynomial, *point)[0]
+        if value:
+            if last and (value > 0) != (last > 0):
+                changes += 1
+            last = value
+    return changes
+
+
+def middle(a: Tuple[int, int], b: Tuple[int, int]) -> Tuple[int, int]:
+    numerator, denominator = a[0] * b[1] + b[0] * a[1], 2 * a[1] * b[1]
+    common = intGcd(numerator, denominator)
+    return numerator // common, denominator // common
+
+
+def isolateRealRoots(poli: Union[int, Fraction, Polinominal, List[int]], width: Union[int, float, Fraction]=None) -> List[tuple]:
+    """
+    disjoint intervals (low, high) in ascending order, each with exactly one real zero of the expression
+    (or of integer coefficients indexed by degree) in low < root <= high, an exact root r is given as (r, r)
+
+    the intervals are bisected until they are not wider than `width`
+    """
+
+    coefficients = trim(list(poli)) if type(poli) == list else zerosCoefficients(poli)
+    if not coefficients:
+        raise ValueError("the zero polynomial has no finite set of roots")
+    if len(coefficients) == 1:
+        return []
+
+    coefficients = squareFree(coefficients)
+    sequence = sturmSequence(coefficients)
+    polynomial = sequence[0]
+
+    def value(point: Tuple[int, int]) -> int:
+        return hornerExact(polynomial, *point)[0]
+
+    # every root is inside the Cauchy bound, so the bound (rounded up to a power of two for short midpoints) is not a root
+    bound = 1 << (1 + max(abs(coefficient) for coefficient in coefficients[:-1]) // abs(coefficients[-1])).bit_length()
+    low, high = (-bound, 1), (bound, 1)
+
+    isolated = []
+    stack = [(low, high, signChanges(sequence, low), signChanges(sequence, high))]
+    while stack:
+        low, high, low_changes, high_changes = stack.pop()
+        count = low_changes - high_changes
+        if count == 1:
+            isolated.append((low, high))
+            continue
+        if not count:
+            continue
+
+        point = middle(low, high)
+        if value(point):
+            changes = signChanges(sequence, point)
+            stack += [(low, point, low_changes, changes), (point, high, changes, high_changes)]
+            continue
+
+        # the middle is an exact root, the intervals around it start at points that are not roots
+        isolated.append((point, point))
+        left, right = low, high
+        while True:
+            left, right = middle(left, point), middle(point, right)
+            left_changes, right_changes = signChanges(sequence, left), signChanges(sequence, right)
+            if value(left) and value(right) and left_changes - right_changes == 1:
+                break
+        stack += [(low, left, low_changes, left_changes), (right, high, right_changes, high_changes)]
+
+    if width is not None:
+        isolated = [refine(value, low, high, width) for low, high in isolated]
+
+    number = lambda point: point[0] if point[1] == 1 else Fraction(*point)
+    isolated.sort(key=cmp_to_key(lambda a, b: a[0][0] * b[0][1] - b[0][0] * a[0][1]))
+    return [(number(low), number(high)) for low, high in isolated]
+
+
+def refine(value, low: Tuple[int, int], high: Tuple[int, int], width: Union[int, float, Fraction]) -> Tuple[Tuple[int, int], Tuple[int, int]]:
+    """ bisects an interval with one simple root (low is not a root) until it is not wider than `width` """
+
+    numerator, denominator = width.as_integer_ratio() if type(width) == float else (width.numerator, width.denominator)
+    if numerator <= 0:
+        raise ValueError("the width of the intervals should be positive")
+
+    if low == high or not value(high):
+        return high, high
+    low_sign = value(low) > 0
+    while (high[0] * low[1] - low[0] * high[1]) * denominator > numerator * low[1] * high[1]:
+        point = middle(low, high)
+        result = value(point)
+        if not result:
+            return point, point
+        if (result > 0) == low_sign:
+            low = point
+        else:
+            high = point
+    return low, high
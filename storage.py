@@ -0,0 +1,317 @@
+"""
+A compact binary format for `Polinominal`: a header and packed arrays of degrees, numerators and denominators.
+
+    storage.dump(poli, "poli.bin")
+    stored = storage.load("poli.bin")    # memory-mapped, the coefficients are read on access
+    stored[1000], stored.toPolinominal()
+
+A file starts with MAGIC and VERSION, then one record:
+
+    flags            u8     DENSE, SHARED, FRACTION, INTEGER
+    symbol           u16 length and UTF-8 bytes
+    count            u64    the number of terms
+    numerator width  u32    bytes of one signed numerator
+    denom. width     u32    bytes of one denominator, 0 when SHARED
+    denominator      u32 length and bytes, only when SHARED
+    degrees          count * u64, ascending, only without DENSE (a dense record has the degrees 0 .. count - 1)
+    numerators       count * numerator width
+    denominators     count * denominator width, only without SHARED
+    fraction         two more records, the numerator and the denominator of the fraction part, only with FRACTION
+
+All integers are little-endian, a record with INTEGER is a constant that is loaded as 'int'.
+"""
+
+import mmap
+import struct
+import sys
+from typing import BinaryIO, Iterator, List, Tuple, Union
+from .fraction import Fraction
+from .polynomial import Polinominal
+
+
+MAGIC = b"PYCALCP\0"
+VERSION = 1
+
+DENSE = 1
+SHARED = 2
+FRACTION = 4
+INTEGER = 8
+
+# the widths that `memoryview.cast` reads in one call, any other width is read number by number
+_signed_formats = {1: "b", 2: "h", 4: "i", 8: "q"}
+_unsigned_formats = {1: "B", 2: "H", 4: "I", 8: "Q"}
+
+
+def width(values: List[int], signed: bool) -> int:
+    """ the bytes of one number in a packed array of the values, rounded up to 1, 2, 4 or 8 when it fits """
+
+    bits = max((value.bit_length() for value in values), default=0) + (1 if signed else 0)
+    size = max(1, (bits + 7) // 8)
+    for packed in (1, 2, 4, 8):
+        if size <= packed:
+            return packed
+    return size
+
+
+def packArray(values: List[int], size: int, signed: bool) -> bytes:
+    formats = _signed_formats if signed else _unsigned_formats
+    if size in formats:
+        return struct.pack(f"<{len(values)}{formats[size]}", *values)
+    return b"".join(value.to_bytes(size, "little", signed=signed) for value in values)
+
+
+def unpackArray(data: memoryview, size: int, signed: bool) -> List[int]:
+    formats = _signed_formats if signed else _unsigned_formats
+    if size in formats and sys.byteorder == "little":
+        return data.cast(formats[size]).tolist()
+    return [int.from_bytes(data[i:i + size], "little", signed=signed) for i in range(0, len(data), size)]
+
+
+def recordParts(value: Union[int, Polinominal]) -> Iterator[bytes]:
+    """ the bytes of one record of a polynomial or a number """
+
+    if type(value) == int:
+        flags, symbol, degrees, numerators, denominators = DENSE | SHARED | INTEGER, "x", None, [value], 1
+        fraction = 0
+    elif type(value) == Polinominal:
+        flags, symbol, fraction = 0, value.symbol, value.fraction
+        dense = value._asDense()
+        if dense is not None:
+            flags |= DENSE | SHARED
+            degrees, (numerators, denominators) = None, dense
+        else:
+            degrees, numerators, denominators = [], [], []
+            for degree, coefficient in sorted(value._view().items()):
+                if not coefficient:
+                    continue
+                if type(coefficient) == int:
+                    coefficient = Fraction(coefficient, 1)
+                if type(coefficient) != Fraction or type(coefficient.numerator) != int:
+                    raise TypeError(f"only polynomials with rational coefficients can be stored, not '{type(coefficient.numerator).__name__}'")
+                degrees.append(degree)
+                numerators.append(coefficient.numerator)
+                denominators.append(coefficient.denominator)
+            if len(set(denominators)) <= 1:
+                flags |= SHARED
+                denominators = denominators[0] if denominators else 1
+    else:
+        raise TypeError(f"can't store '{type(value).__name__}'")
+
+    if fraction:
+        flags |= FRACTION
+
+    symbol = symbol.encode()
+    numerator_width = width(numerators, True)
+    denominator_width = 0 if flags & SHARED else width(denominators, False)
+    yield struct.pack("<BH", flags, len(symbol)) + symbol
+    yield struct.pack("<QII", len(numerators), numerator_width, denominator_width)
+    if flags & SHARED:
+        size = (denominators.bit_length() + 7) // 8
+        yield struct.pack("<I", size) + denominators.to_bytes(size, "little")
+    if not flags & DENSE:
+        yield packArray(degrees, 8, False)
+    yield packArray(numerators, numerator_width, True)
+    if not flags & SHARED:
+        yield packArray(denominators, denominator_width, False)
+    if fraction:
+        yield from recordParts(fraction.numerator)
+        yield from recordParts(fraction.denominator)
+
+
+def dump(poli: Union[int, Polinominal], file: Union[str, BinaryIO]) -> None:
+    """ writes the polynomial (or the number) to a path or to a binary file object """
+
+    if type(file) == str:
+        with open(file, "wb") as fp:
+            return dump(poli, fp)
+
+    file.write(MAGIC + struct.pack("<B", VERSION))
+    for part in recordParts(poli):
+        file.write(part)
+
+
+def dumps(poli: Union[int, Polinominal]) -> bytes:
+    """ the bytes of the polynomial (or the number) in the binary format """
+    return MAGIC + struct.pack("<B", VERSION) + b"".join(recordParts(poli))
+
+
+class StoredPolinominal():
+    """
+    A polynomial in the binary format, read from a buffer (a memory-mapped file for `load`).
+
+    Only the header is read when it is made: a coefficient is decoded when it is asked for,
+    `toPolinominal` reads the packed arrays at once and keeps a shared denominator as the dense form.
+    """
+    __slots__ = ["_buffer", "_file", "flags", "symbol", "count", "_widths", "_denominator", "_offsets", "end"]
+
+    def __init__(self, buffer: memoryview, offset: int=None, file=None) -> None:
+        self._buffer = buffer
+        self._file = file
+        if offset is None:
+            if bytes(buffer[:len(MAGIC)]) != MAGIC:
+                raise ValueError("the data is not a stored polynomial")
+            version = buffer[len(MAGIC)]
+            if version != VERSION:
+                raise ValueError(f"unsupported version {version} of the format")
+            offset = len(MAGIC) + 1
+
+        self.flags, length = struct.unpack_from("<BH", buffer, offset)
+        offset += 3
+        self.symbol = bytes(buffer[offset:offset + length]).decode()
+        offset += length
+        self.count, numerator_width, denominator_width = struct.unpack_from("<QII", buffer, offset)
+        offset += 16
+        self._widths = numerator_width, denominator_width
+
+        self._denominator = None
+        if self.flags & SHARED:
+            size, = struct.unpack_from("<I", buffer, offset)
+            self._denominator = int.from_bytes(buffer[offset + 4:offset + 4 + size], "little")
+            offset += 4 + size
+
+        degrees = offset
+        numerators = degrees + (0 if self.flags & DENSE else 8 * self.count)
+        denominators = numerators + numerator_width * self.count
+        self.end = denominators + denominator_width * self.count
+        self._offsets = degrees, numerators, denominators
+
+
+    @property
+    def degree(self) -> int:
+        """ the highest degree of a term """
+
+        if not self.count:
+            return 0
+        if self.flags & DENSE:
+            return self.count - 1
+        return struct.unpack_from("<Q", self._buffer, self._offsets[0] + 8 * (self.count - 1))[0]
+
+
+    def __len__(self) -> int:
+        return self.count
+
+
+    def _index(self, degree: int) -> int:
+        """ the position of the term of the degree, -1 if there is no such term """
+
+        if self.flags & DENSE:
+            return degree if 0 <= degree < self.count else -1
+
+        # binary search in the ascending degrees
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            if struct.unpack_from("<Q", self._buffer, self._offsets[0] + 8 * middle)[0] < degree:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self.count and struct.unpack_from("<Q", self._buffer, self._offsets[0] + 8 * low)[0] == degree:
+            return low
+        return -1
+
+
+    def _coefficient(self, index: int) -> Union[int, Fraction]:
+        numerator_width, denominator_width = self._widths
+        start = self._offsets[1] + numerator_width * index
+        numerator = int.from_bytes(self._buffer[start:start + numerator_width], "little", signed=True)
+        if self._denominator is not None:
+            denominator = self._denominator
+        else:
+            start = self._offsets[2] + denominator_width * index
+            denominator = int.from_bytes(self._buffer[start:start + denominator_width], "little")
+        return Fraction(numerator, denominator)
+
+
+    def __getitem__(self, degree: int) -> Union[int, Fraction]:
+        """ the coefficient of the degree, 0 if there is no such term """
+
+        index = self._index(degree)
+        return self._coefficient(index) if index >= 0 else 0
+
+
+    def items(self) -> Iterator[Tuple[int, Union[int, Fraction]]]:
+        """ the degrees and the coefficients of the terms, decoded one at a time """
+
+        for index in range(self.count):
+            degree = index if self.flags & DENSE else struct.unpack_from("<Q", self._buffer, self._offsets[0] + 8 * index)[0]
+            coefficient = self._coefficient(index)
+            if coefficient:
+                yield degree, coefficient
+
+
+    def _fraction(self) -> Union[int, Fraction]:
+        if not self.flags & FRACTION:
+            return 0
+        numerator = StoredPolinominal(self._buffer, self.end)
+        denominator = StoredPolinominal(self._buffer, numerator._last())
+        return Fraction(numerator.toPolinominal(), denominator.toPolinominal())
+
+
+    def _last(self) -> int:
+        """ the offset after this record and its fraction records """
+
+        if not self.flags & FRACTION:
+            return self.end
+        numerator = StoredPolinominal(self._buffer, self.end)
+        return StoredPolinominal(self._buffer, numerator._last())._last()
+
+
+    def toPolinominal(self) -> Union[int, Polinominal]:
+        """ the stored polynomial, a record of a constant saved as 'int' gives 'int' """
+
+        numerator_width, denominator_width = self._widths
+        degrees, numerators, denominators = self._offsets
+        numerator_values = unpackArray(self._buffer[numerators:denominators], numerator_width, True)
+
+        if self.flags & INTEGER:
+            return numerator_values[0] if numerator_values else 0
+        fraction = self._fraction()
+        if self.flags & DENSE:
+            return Polinominal.fromDense(numerator_values, self._denominator, fraction=fraction, symbol=self.symbol)
+
+        degree_values = unpackArray(self._buffer[degrees:numerators], 8, False)
+        if self._denominator is not None:
+            denominator_values = [self._denominator] * self.count
+        else:
+            denominator_values = unpackArray(self._buffer[denominators:self.end], denominator_width, False)
+
+        poli = Polinominal({}, fraction=fraction, symbol=self.symbol)
+        for degree, numerator, denominator in zip(degree_values, numerator_values, denominator_values):
+            # the coefficients of a sparse record were stored reduced
+            coefficient = object.__new__(Fraction)
+            coefficient.numerator, coefficient.denominator = numerator, denominator
+            poli._terms[degree] = coefficient
+        return poli
+
+
+    def close(self) -> None:
+        """ releases the buffer and closes the mapped file """
+
+        self._buffer.release()
+        if self._file is not None:
+            self._file.close()
+
+
+    def __enter__(self) -> "StoredPolinominal":
+        return self
+
+
+    def __exit__(self, *exception) -> None:
+        self.close()
+
+
+    def __repr__(self) -> str:
+        return f"StoredPolinominal(symbol={self.symbol!r}, terms={self.count}, degree={self.degree})"
+
+
+def load(path: str) -> StoredPolinominal:
+    """ maps the file into memory and reads its header, the coefficients are read on access """
+
+    with open(path, "rb") as fp:
+        mapped = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+    return StoredPolinominal(memoryview(mapped), file=mapped)
+
+
+def loads(data: bytes) -> Union[int, Polinominal]:
+    """ the polynomial (or the number) of bytes in the binary format """
+    return StoredPolinominal(memoryview(data)).toPolinominal()
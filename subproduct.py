@@ -0,0 +1,132 @@
+from typing import List, Tuple, Union
+from .fraction import Fraction
+from .operations import polyDivmod, polyMul
+from .polynomial import Polinominal, addDense, mulDense, normalizeDense
+
+
+# nodes with at most this many points evaluate their remainder point by point,
+# exact remainders grow their coefficients so Horner wins up to large nodes
+LEAF_SIZE = 1024
+
+
+def remainderDense(dense: Tuple[List[int], int], divisor: List[int]) -> Tuple[List[int], int]:
+    """ remainder of a dense polynomial divided by an integer coefficient list """
+
+    numerators, denominator = dense
+    if len(numerators) < len(divisor):
+        return dense
+
+    _, remainder, scale = polyDivmod(numerators, divisor)
+    return normalizeDense(remainder, scale * denominator)
+
+
+class SubproductTree():
+    """
+    The products of the linear factors (x - point) over a binary tree.
+
+    It evaluates a `Polinominal` at all points at once and interpolates a `Polinominal` from values at the points,
+    both with exact `Fraction` results in O(n log^2 n) multiplications and remainders.
+    """
+    __slots__ = ["points", "levels"]
+
+    def __init__(self, points: List[Union[int, Fraction]]) -> None:
+        self.points = list(points)
+        if not self.points:
+            raise ValueError("the tree needs at least one point")
+
+        leaves = []
+        for point in self.points:
+            if type(point) == int:
+                leaves.append([-point, 1])
+            elif type(point) == Fraction and type(point.numerator) == int and type(point.denominator) == int:
+                # q * x - p vanishes at p / q like x - p / q
+                sign = -1 if point.denominator < 0 else 1
+                leaves.append([-sign * point.numerator, sign * point.denominator])
+            else:
+                raise TypeError(f"can't use '{type(point).__name__}' as a point, use 'int' or 'Fraction'")
+
+        self.levels = [leaves]
+        while len(self.levels[-1]) > 1:
+            nodes = self.levels[-1]
+            self.levels.append([polyMul(nodes[i], nodes[i + 1]) if i + 1 < len(nodes) else nodes[i]
+                                for i in range(0, len(nodes), 2)])
+
+
+    def _evaluateDense(self, dense: Tuple[List[int], int]) -> List[Union[int, Fraction]]:
+        """ exact values of a dense polynomial at all points """
+
+        top = len(self.levels) - 1
+        if len(self.points) <= LEAF_SIZE:
+            return [Polinominal._hornerDense(dense, point) for point in self.points]
+
+        remainders = [remainderDense(dense, self.levels[top][0])]
+
+        level = top
+        while level > 0 and 2 ** level > LEAF_SIZE:
+            level -= 1
+            remainders = [remainderDense(remainders[i // 2], node) for i, node in enumerate(self.levels[level])]
+
+        size = 2 ** level
+        return [Polinominal._hornerDense(remainders[i // size], point) for i, point in enumerate(self.points)]
+
+
+    def evaluate(self, poli: Union[Polinominal, int, Fraction]) -> List[Union[int, Fraction]]:
+        """ the values of `poli.evaluate_polynomial` at all points of the tree """
+
+        if type(poli) != Polinominal:
+            return [poli] * len(self.points)
+
+        dense = poli._asDense(force=True)
+        if dense is None:
+            return [poli.evaluate_polynomial(point) for point in self.points]
+
+        values = self._evaluateDense(dense)
+        if poli.fraction:
+            numerators = self.evaluate(poli.fraction.numerator)
+            denominators = self.evaluate(poli.fraction.denominator)
+            values = [value + numerator / denominator for value, numerator, denominator in zip(values, numerators, denominators)]
+
+        return values
+
+
+    def interpolate(self, values: List[Union[int, Fraction]], symbol: str="x") -> Polinominal:
+        """ the polynomial of the lowest degree that has the given values at the points of the tree """
+
+        if len(values) != len(self.points):
+            raise ValueError(f"expected {len(self.points)} values, got {len(values)}")
+
+        root = self.levels[-1][0]
+        derivative = [degree * coefficient for degree, coefficient in enumerate(root)][1:]
+        weights = self._evaluateDense((derivative, 1))
+
+        # y * q / M'(p / q) is the weight of the product of all the other factors
+        polis = []
+        for value, weight, leaf in zip(values, weights, self.levels[0]):
+            if type(weight) == int and not weight:
+                raise ValueError("the interpolation points must be distinct")
+            if type(value) not in [int, Fraction]:
+                raise TypeError(f"can't interpolate '{type(value).__name__}' values, use 'int' or 'Fraction'")
+            polis.append(normalizeDense([value.numerator * leaf[1] * weight.denominator], value.denominator * weight.numerator))
+
+        for nodes in self.levels[:-1]:
+            combined = []
+            for i in range(0, len(polis), 2):
+                if i + 1 == len(polis):
+                    combined.append(polis[i])
+                    continue
+                left = mulDense(polis[i], (nodes[i + 1], 1))
+                right = mulDense(polis[i + 1], (nodes[i], 1))
+                combined.append(normalizeDense(*addDense(left, right)))
+            polis = combined
+
+        return Polinominal.fromDense(*polis[0], symbol=symbol)
+
+
+def evaluate(poli: Union[Polinominal, int, Fraction], points: List[Union[int, Fraction]]) -> List[Union[int, Fraction]]:
+    """ the values of the polynomial at all points with a subproduct tree """
+    return SubproductTree(points).evaluate(poli)
+
+
+def interpolate(points: List[Union[int, Fraction]], values: List[Union[int, Fraction]], symbol: str="x") -> Polinominal:
+    """ the polynomial of the lowest degree that has the given values at the points """
+    return SubproductTree(points).interpolate(values, symbol)